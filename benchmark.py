@@ -0,0 +1,1112 @@
+"""Offline benchmarks for linkedin_scraper.py.
+
+Run ``python benchmark.py --help`` to list the available benchmarks. Nothing here touches the live site;
+every benchmark builds its own synthetic input in a temporary directory.
+"""
+import argparse
+import contextlib
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import random
+import resource
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote
+
+import fake_webdriver
+import linkedin_scraper
+import linkedin_urls
+import page_archives
+
+
+def generate_forum_page(page_number, posts_per_page=40, linkedin_ratio=0.5, seed=None):
+    """Builds the HTML of one synthetic forum page.
+
+    Roughly ``linkedin_ratio`` of the posts carry a LinkedIn link; the rest link to other profile sites
+    so the extractor has to filter something.
+    """
+    rng = random.Random(page_number if seed is None else seed)
+    posts = []
+    for post_number in range(posts_per_page):
+        user_id = page_number * posts_per_page + post_number
+        if rng.random() < linkedin_ratio:
+            profile_link = f'<a href="https://www.linkedin.com/in/user-{user_id}/?trk=forum">LinkedIn</a>'
+        else:
+            profile_link = f'<a href="https://github.com/user-{user_id}">GitHub</a>'
+        posts.append(
+            '<div class="post">'
+            f'<div class="post--list__user"><a href="/u/{user_id}">User {user_id}</a></div>'
+            f'<p>Post {post_number} on page {page_number}. {"Lorem ipsum dolor sit amet. " * 8}</p>'
+            f'{profile_link}'
+            '</div>'
+        )
+    return (
+        "<!DOCTYPE html><html><head><title>Saved forum page</title></head><body>"
+        f'<div class="post--list">{"".join(posts)}</div>'
+        "</body></html>"
+    )
+
+
+def generate_forum_corpus(directory, num_pages, posts_per_page=40, linkedin_ratio=0.5):
+    """Writes ``num_pages`` synthetic ``saved_forum_page*.html`` files into ``directory``."""
+    paths = []
+    for page_number in range(num_pages):
+        path = os.path.join(directory, f"saved_forum_page{page_number:06d}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generate_forum_page(page_number, posts_per_page, linkedin_ratio))
+        paths.append(path)
+    return paths
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silences stdout at the file-descriptor level so worker processes are muted too, and the scraper's logs."""
+    sys.stdout.flush()
+    saved_fd = os.dup(1)
+    logging.disable(logging.CRITICAL)
+    with open(os.devnull, 'w') as devnull:
+        os.dup2(devnull.fileno(), 1)
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            os.dup2(saved_fd, 1)
+            os.close(saved_fd)
+            logging.disable(logging.NOTSET)
+
+
+def bench_local_scan(args):
+    """Local archive scan throughput: serial loop vs. process pool at several worker counts."""
+    worker_counts = args.workers or sorted({1, 2, 4, os.cpu_count() or 1})
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        file_list = generate_forum_corpus(corpus_dir, args.pages, args.posts_per_page, args.linkedin_ratio)
+        print(f"Synthetic corpus: {len(file_list)} pages, {args.posts_per_page} posts/page, {os.cpu_count()} cores available")
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            with _quiet():
+                if workers == 1:
+                    profiles = linkedin_scraper._scan_local_files(file_list, args.extractor)
+                else:
+                    profiles = linkedin_scraper._scan_local_files_parallel(file_list, workers, args.chunk_size,
+                                                                          args.extractor)
+            elapsed = time.perf_counter() - start
+
+            if baseline is None:
+                baseline = (profiles, elapsed)
+            elif profiles != baseline[0]:
+                raise SystemExit(f"Result mismatch with {workers} workers: {len(profiles)} vs {len(baseline[0])} profiles")
+            print(f"  workers={workers:<3} {elapsed:8.2f}s  {len(file_list) / elapsed:9.1f} pages/s  "
+                  f"speedup x{baseline[1] / elapsed:.2f}  ({len(profiles)} profiles)")
+
+
+def _bytes_read():
+    """Bytes this process has read so far (``rchar`` in /proc/self/io), or ``None`` where that is not available."""
+    try:
+        with open('/proc/self/io') as f:
+            return int(dict(line.split(': ') for line in f.read().splitlines())['rchar'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def bench_incremental_scan(args):
+    """Incremental local scan: cold run vs. warm rerun vs. rerun after a few files changed."""
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        file_list = generate_forum_corpus(corpus_dir, args.pages, args.posts_per_page)
+        manifest_path = os.path.join(corpus_dir, "manifest.sqlite")
+        print(f"Synthetic corpus: {len(file_list)} pages, {args.posts_per_page} posts/page")
+
+        def run(label):
+            current_files = sorted(glob.glob(os.path.join(corpus_dir, "saved_forum_page*.html")))
+            manifest = linkedin_scraper._LocalScanManifest(manifest_path)
+            start, read_before = time.perf_counter(), _bytes_read()
+            with _quiet():
+                profiles = linkedin_scraper._scan_local_files_incremental(
+                    current_files, manifest, args.workers, args.chunk_size, args.extractor
+                )
+            elapsed, read_after = time.perf_counter() - start, _bytes_read()
+            manifest.close()
+            with _quiet():
+                expected = linkedin_scraper._scan_local_files(current_files, args.extractor)
+            if profiles != expected:
+                raise SystemExit(f"{label}: incremental result differs from a full scan "
+                                 f"({len(profiles)} vs {len(expected)} profiles)")
+            # Parsed files are hashed as they are read, so a scan should read each one once. Only reads made by
+            # this process are counted, so the figure is left out when the workers parse
+            reads = ""
+            if read_before is not None and args.workers == 1:
+                corpus_size = sum(os.path.getsize(path) for path in current_files)
+                reads = f", read {(read_after - read_before) / corpus_size:.2f}x the corpus"
+            print(f"  {label:<28} {elapsed:8.2f}s  {len(current_files) / elapsed:10.1f} files/s  "
+                  f"({len(profiles)} profiles{reads})")
+
+        run("cold (empty manifest)")
+        run("warm (nothing changed)")
+
+        rng = random.Random(1)
+        changed = rng.sample(file_list, min(args.changes, len(file_list)))
+        for path in changed[:len(changed) // 2]:
+            os.remove(path)
+        for path in changed[len(changed) // 2:]:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('<a href="https://www.linkedin.com/in/appended-profile">new</a>')
+        for page_number in range(args.pages, args.pages + args.changes):
+            with open(os.path.join(corpus_dir, f"saved_forum_page{page_number:06d}.html"), 'w', encoding='utf-8') as f:
+                f.write(generate_forum_page(page_number, args.posts_per_page))
+        run(f"after {args.changes} del/mod/add")
+
+        # Rows stored by a run with an older canonical form, e.g. before URLs were canonicalized at all
+        with sqlite3.connect(manifest_path) as conn:
+            conn.execute("UPDATE files SET profiles = ?, profiles_version = 0 WHERE rowid % 10 = 0",
+                         (json.dumps(["http://uk.linkedin.com/in/Stale-Spelling/"]),))
+        run("stale canonical form")
+
+
+def bench_result_sink(args):
+    """Result sinks: write throughput per format, and an interrupted run resumed from the checkpoint."""
+    rng = random.Random(0)
+    sources = [
+        (f"saved_forum_page{source:06d}.html",
+         [f"https://www.linkedin.com/in/user-{rng.randrange(args.unique_profiles)}" for _ in range(args.profiles_per_source)])
+        for source in range(args.sources)
+    ]
+    expected = sorted({profile for _, profiles in sources for profile in profiles})
+    print(f"{len(sources)} sources x {args.profiles_per_source} profiles, {len(expected)} unique")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for sink_format in ("jsonl", "csv", "sqlite"):
+            path = os.path.join(output_dir, f"profiles.{sink_format}")
+            start = time.perf_counter()
+            sink = linkedin_scraper._open_result_sink(path, sink_format)
+            for source, profiles in sources:
+                linkedin_scraper._record_source(sink, source, profiles)
+            sink.close()
+            elapsed = time.perf_counter() - start
+
+            # Interrupted run: stop halfway through a source, then resume and finish the rest
+            half = len(sources) // 2
+            sink = linkedin_scraper._open_result_sink(path, sink_format)
+            for source, profiles in sources[:half]:
+                linkedin_scraper._record_source(sink, source, profiles)
+            for profile in sources[half][1][:args.profiles_per_source // 2]:
+                sink.add(profile, sources[half][0])
+            sink.close()
+            with _quiet():
+                sink = linkedin_scraper._open_result_sink(path, sink_format, resume=True)
+            completed = sink.completed_sources()
+            for source, profiles in sources:
+                if source not in completed:
+                    linkedin_scraper._record_source(sink, source, profiles)
+            resumed = list(sink.profiles())
+            sink.close()
+            if resumed != expected or len(completed) != half:
+                raise SystemExit(f"{sink_format}: resumed run has {len(resumed)} profiles and {len(completed)} "
+                                 f"checkpointed sources, expected {len(expected)} and {half}")
+            print(f"  {sink_format:<7} {elapsed:8.2f}s  {len(sources) * args.profiles_per_source / elapsed:10.0f} records/s  "
+                  f"{os.path.getsize(path) / 1024:8.0f} KiB  (resume skipped {len(completed)} sources)")
+
+
+# Edge cases the streaming extractor must agree with the soup extractor on.
+EXTRACTOR_PARITY_HTML = """<html><body>
+<A HREF="https://www.LinkedIn.com/in/Upper-Case/">upper-case tag and attribute</A>
+<a href="https://linkedin.com/in/entity&amp;name?x=1&amp;y=2">entity in href</a>
+<a href="https://linkedin.com/in/first" href="https://linkedin.com/in/second">duplicate href</a>
+<a href="https://linkedin.com/in/self-closing"/>
+<a data-href="https://linkedin.com/in/not-an-href">wrong attribute</a>
+<link href="https://linkedin.com/in/not-an-anchor">
+<a href>empty href</a>
+<script>var s = '<a href="https://linkedin.com/in/in-script">';</script>
+<!-- <a href="https://linkedin.com/in/in-comment"> -->
+<a href='https://uk.linkedin.com/in/single-quoted/'>single quotes</a>
+<a href=https://linkedin.com/in/unquoted>unquoted</a>
+</body></html>"""
+
+
+def _peak_rss_kb():
+    """Peak RSS of this process in KB.
+
+    On Linux a spawned child's ``ru_maxrss`` starts at its parent's RSS, which can hide everything the child
+    does, so the high-water mark of the child's own address space is read from /proc where it exists.
+    """
+    try:
+        with open('/proc/self/status', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure_extractor(extractor, path):
+    """Runs one extractor over ``path`` in a fresh process and reports time and peak RSS growth."""
+    rss_before_kb = _peak_rss_kb()
+    with _quiet():
+        start = time.perf_counter()
+        with open(path, 'r', encoding='utf-8') as f:
+            profiles = linkedin_scraper._extract_linkedin_links(f, extractor)
+        elapsed = time.perf_counter() - start
+    return elapsed, max(0, _peak_rss_kb() - rss_before_kb), profiles
+
+
+def bench_extractors(args):
+    """Link extractor backends: parity check plus time and peak RSS across page sizes."""
+    with _quiet():
+        expected = linkedin_scraper._extract_linkedin_links(EXTRACTOR_PARITY_HTML, 'soup')
+        for extractor in linkedin_scraper.LINK_EXTRACTORS:
+            actual = linkedin_scraper._extract_linkedin_links(EXTRACTOR_PARITY_HTML, extractor)
+            if actual != expected:
+                raise SystemExit(f"Parity failure for '{extractor}': {sorted(actual ^ expected)}")
+    print(f"Parity fixture: all extractors agree on {len(expected)} profiles")
+
+    spawn = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as page_dir:
+        for posts in args.sizes:
+            path = os.path.join(page_dir, f"page_{posts}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(generate_forum_page(0, posts_per_page=posts))
+            size_mb = os.path.getsize(path) / 1e6
+
+            results = {}
+            for extractor in linkedin_scraper.LINK_EXTRACTORS:
+                # A fresh process per measurement, otherwise the peak RSS carries over from earlier runs
+                with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+                    results[extractor] = executor.submit(_measure_extractor, extractor, path).result()
+
+            reference = results['soup'][2]
+            for extractor, (elapsed, rss_kb, profiles) in results.items():
+                if profiles != reference:
+                    raise SystemExit(f"Parity failure for '{extractor}' on {posts} posts")
+                print(f"  {posts:>7} posts ({size_mb:7.2f} MB)  {extractor:<7} {elapsed:8.3f}s  "
+                      f"peak RSS +{rss_kb / 1024:8.1f} MB  ({len(profiles)} profiles)")
+
+
+def _warc_record(warc_type, target_uri, content_type, payload):
+    header = (f"WARC/1.0\r\nWARC-Type: {warc_type}\r\nWARC-Target-URI: {target_uri}\r\n"
+              f"Content-Type: {content_type}\r\nContent-Length: {len(payload)}\r\n\r\n")
+    return header.encode('utf-8') + payload + b"\r\n\r\n"
+
+
+def _http_chunked(body, chunk_size=4096):
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    return b"".join(b"%x\r\n%s\r\n" % (len(chunk), chunk) for chunk in chunks) + b"0\r\n\r\n"
+
+
+def write_forum_warc(path, pages):
+    """Writes ``(url, html)`` pairs as a ``.warc.gz`` with one gzip member per record, the way crawlers do.
+
+    Every third response is stored gzip-encoded and chunked, and request records and a JSON response are
+    mixed in, so the reader has to decode payloads and skip what is not HTML.
+    """
+    with open(path, 'wb') as f:
+        for index, (url, html) in enumerate(pages):
+            body = html.encode('utf-8')
+            http_headers = "HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+            if index % 3 == 2:
+                body = _http_chunked(gzip.compress(body))
+                http_headers += "Content-Encoding: gzip\r\nTransfer-Encoding: chunked\r\n"
+            records = [
+                _warc_record('request', url, 'application/http; msgtype=request',
+                             f"GET {url} HTTP/1.1\r\nHost: forum.example\r\n\r\n".encode('utf-8')),
+                _warc_record('response', url, 'application/http; msgtype=response',
+                             (http_headers + "\r\n").encode('utf-8') + body),
+            ]
+            if index % 10 == 0:
+                payload = b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n' \
+                          b'{"bio": "https://www.linkedin.com/in/not-a-page-link"}'
+                records.append(_warc_record('response', url + '.json', 'application/http; msgtype=response', payload))
+            for record in records:
+                f.write(gzip.compress(record))
+
+
+def _build_archive_corpus(directory, num_pages, posts_per_page, linkedin_ratio):
+    """Writes the same synthetic pages as loose files, per-page gzip, one zip, one WARC and one concatenated file."""
+    pages = [generate_forum_page(page_number, posts_per_page, linkedin_ratio) for page_number in range(num_pages)]
+    formats = {'html': [], 'gzip': []}
+    for page_number, html in enumerate(pages):
+        path = os.path.join(directory, f"saved_forum_page{page_number:06d}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        formats['html'].append(path)
+        with gzip.open(path + ".gz", 'wt', encoding='utf-8') as f:
+            f.write(html)
+        formats['gzip'].append(path + ".gz")
+
+    formats['zip'] = [os.path.join(directory, "forum_pages.zip")]
+    with zipfile.ZipFile(formats['zip'][0], 'w', zipfile.ZIP_DEFLATED) as archive:
+        for path in formats['html']:
+            archive.write(path, os.path.basename(path))
+        archive.writestr("README.txt", "not a page")
+
+    formats['warc'] = [os.path.join(directory, "forum_pages.warc.gz")]
+    write_forum_warc(formats['warc'][0], [(f"https://forum.example/page/{n}", html) for n, html in enumerate(pages)])
+
+    formats['one big file'] = [os.path.join(directory, "all_pages.html")]
+    with open(formats['one big file'][0], 'w', encoding='utf-8') as f:
+        f.writelines(pages)
+    return formats
+
+
+def _measure_archive_scan(file_list, extractor, mmap_threshold):
+    """Scans ``file_list`` in a fresh process and reports time and peak RSS growth."""
+    page_archives.MMAP_THRESHOLD = mmap_threshold
+    rss_before_kb = _peak_rss_kb()
+    with _quiet():
+        start = time.perf_counter()
+        profiles = linkedin_scraper._scan_local_files(file_list, extractor)
+        elapsed = time.perf_counter() - start
+    return elapsed, max(0, _peak_rss_kb() - rss_before_kb), profiles
+
+
+def _check_damaged_archives(directory, num_pages=20, posts_per_page=50):
+    """Archives cut short or corrupted after ``num_pages`` good pages must still yield those pages' profiles."""
+    pages = [generate_forum_page(page_number, posts_per_page, 0.5) for page_number in range(num_pages + 1)]
+    with tempfile.TemporaryDirectory() as loose_dir:
+        expected = set()
+        for page_number, html in enumerate(pages[:num_pages]):
+            path = os.path.join(loose_dir, f"page{page_number}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            expected |= linkedin_scraper._extract_profiles_from_file(path, 'stream')
+
+    damaged = {}
+    for name in ("truncated.warc.gz", "truncated.warc"):
+        path = damaged[name] = os.path.join(directory, name)
+        sizes = []
+        for count in (num_pages, num_pages + 1):
+            write_forum_warc(path, [(f"https://forum.example/page/{n}", html) for n, html in enumerate(pages[:count])])
+            if not name.endswith('.gz'):
+                with gzip.open(path, 'rb') as f:
+                    data = f.read()
+                with open(path, 'wb') as f:
+                    f.write(data)
+            sizes.append(os.path.getsize(path))
+        with open(path, 'r+b') as f:
+            f.truncate(sum(sizes) // 2)  # Halfway through the records of the last page
+    path = damaged["bad-crc.zip"] = os.path.join(directory, "bad-crc.zip")
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as archive:
+        for page_number, html in enumerate(pages):
+            archive.writestr(f"page{page_number:03d}.html", html)
+    with open(path, 'r+b') as f:
+        data = f.read()
+        offset = data.rindex(pages[-1].encode('utf-8')) + 100  # Inside the last member's stored data
+        f.seek(offset)
+        f.write(bytes([data[offset] ^ 0x20]))
+
+    with _quiet():
+        for name, path in damaged.items():
+            profiles = linkedin_scraper._extract_profiles_from_file(path, 'stream')
+            if profiles is None or not expected <= profiles:
+                found = "nothing" if profiles is None else f"{len(expected & profiles)} of {len(expected)} profiles"
+                raise SystemExit(f"Damaged archive {name}: kept {found} from the {num_pages} intact pages")
+    print(f"Damaged archives keep the profiles of the intact pages before the damage: {', '.join(damaged)}")
+
+
+def bench_archives(args):
+    """Archive input: loose pages vs. the same pages in .gz, .zip and WARC, plus mmap on one large file."""
+    with tempfile.TemporaryDirectory() as damaged_dir:
+        _check_damaged_archives(damaged_dir)
+    spawn = multiprocessing.get_context('spawn')
+    for num_pages in args.pages:
+        with tempfile.TemporaryDirectory() as corpus_dir:
+            # Built in another process too: a spawned child starts with its parent's RSS as its ru_maxrss
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+                formats = executor.submit(_build_archive_corpus, corpus_dir, num_pages, args.posts_per_page,
+                                          args.linkedin_ratio).result()
+            runs = [(label, file_list, float('inf')) for label, file_list in formats.items()]
+            runs.append(("one big file, mmap", formats['one big file'], 0))
+            print(f"Synthetic corpus: {num_pages} pages, {args.posts_per_page} posts/page")
+
+            expected = None
+            for label, file_list, mmap_threshold in runs:
+                size_mb = sum(os.path.getsize(path) for path in file_list) / 1e6
+                # A fresh process per measurement, otherwise the peak RSS carries over from earlier runs
+                with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+                    elapsed, rss_kb, profiles = executor.submit(
+                        _measure_archive_scan, file_list, args.extractor, mmap_threshold).result()
+                if expected is None:
+                    expected = profiles
+                elif profiles != expected:
+                    raise SystemExit(f"Result mismatch for {label}: {len(profiles)} vs {len(expected)} profiles")
+                print(f"  {label:<20} {size_mb:9.1f} MB on disk  {elapsed:8.2f}s  {num_pages / elapsed:9.1f} pages/s  "
+                      f"peak RSS +{rss_kb / 1024:7.1f} MB  ({len(profiles)} profiles)")
+
+
+# Hrefs that mention LinkedIn but are not profile links; the normalizer must reject every one.
+NON_PROFILE_HREFS = [
+    "https://github.com/user-1",
+    "https://www.linkedin.com/company/udacity/",
+    "https://www.linkedin.com/in/",
+    "https://www.linkedin.com/feed/?u=/in/user-1",
+    "https://notlinkedin.com/in/user-1",
+    "https://linkedin.com.example.net/in/user-1",
+    "https://example.com/redirect?to=https://linkedin.com/in/user-1",
+    "javascript:window.open('linkedin.com/in/user-1')",
+    "mailto:someone@linkedin.com",
+    "ftp://linkedin.com/in/user-1",
+    "/in/user-1",
+    "https://[linkedin.com/in/user-1",
+]
+_URL_SLUG_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789-_"
+_MEMBER_ID_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+def _legacy_normalize_href(href):
+    """The normalization the scraper used before linkedin_urls: drop the query and one trailing slash."""
+    if 'linkedin.com/in/' in href.lower():
+        profile_url = href.split('?')[0]
+        return profile_url[:-1] if profile_url.endswith('/') else profile_url
+    return None
+
+
+def _random_slug(rng):
+    slug = ''.join(rng.choice(_URL_SLUG_ALPHABET) for _ in range(rng.randint(3, 20)))
+    if rng.random() < 0.2:
+        slug += rng.choice(["-josé", "-müller", ".jr", "-李"])
+    return slug
+
+
+def _random_member_id(rng):
+    """An opaque ``ACoAA...`` member ID, whose case the normalizer must keep."""
+    return "ACoAA" + ''.join(rng.choice(_MEMBER_ID_ALPHABET) for _ in range(rng.randint(10, 34)))
+
+
+def _random_profile_href(rng, slug, vary_case=True):
+    """Spells ``slug``'s profile link one of the many ways it turns up in forum posts.
+
+    ``vary_case=False`` keeps the slug's case and percent-encodes nothing, for case-sensitive member IDs.
+    """
+    scheme = rng.choice(["", "//", "http://", "https://", "HTTPS://"])
+    host = rng.choice(["linkedin.com", "www.linkedin.com", "WWW.LinkedIn.com", "uk.linkedin.com", "de.linkedin.com",
+                       "linkedin.com:443", "m.linkedin.com"])
+    spelled = slug if not vary_case else ''.join(
+        (char.upper() if rng.random() < 0.3 else char) if rng.random() < 0.8 else quote(char, safe='')
+        for char in slug
+    )
+    if vary_case and rng.random() < 0.2:
+        spelled = quote(spelled, safe='%')  # Unicode characters left for the browser to encode
+    suffix = rng.choice(["", "/", "/?trk=forum", "?originalSubdomain=uk", "#experience", "/details/experience/",
+                         "/?a=1#b", "/en"])
+    padding = rng.choice(["", " ", "\n"])
+    return f"{padding}{scheme}{host}/{rng.choice(['in', 'IN'])}/{spelled}{suffix}{padding}"
+
+
+def _check_url_normalizer_properties(cases, seed=0):
+    """Randomized property checks for linkedin_urls; returns (hrefs checked, legacy distinct, canonical distinct)."""
+    rng = random.Random(seed)
+    checked = 0
+    legacy_outputs, canonical_outputs = set(), set()
+    for case in range(cases):
+        member_id = case % 10 == 0  # Every tenth profile is linked by its case-sensitive member ID
+        slug = _random_member_id(rng) if member_id else _random_slug(rng)
+        expected = linkedin_urls.PROFILE_URL_PREFIX + quote(slug, safe="-_.~")
+        for _ in range(8):
+            href = _random_profile_href(rng, slug, vary_case=not member_id)
+            canonical = linkedin_urls.canonicalize_profile_url(href)
+            if canonical != expected:
+                raise SystemExit(f"Normalizer mapped {href!r} to {canonical!r}, expected {expected!r}")
+            if linkedin_urls._canonicalize_slow(href) != canonical:
+                raise SystemExit(f"Fast and slow paths disagree on {href!r}")
+            if linkedin_urls.canonicalize_profile_url(canonical) != canonical:
+                raise SystemExit(f"Normalizer is not idempotent on {canonical!r}")
+            legacy_outputs.add(_legacy_normalize_href(href))
+            canonical_outputs.add(canonical)
+            checked += 1
+    for href in NON_PROFILE_HREFS:
+        if linkedin_urls.canonicalize_profile_url(href) is not None:
+            raise SystemExit(f"Normalizer accepted non-profile href {href!r}")
+    member_id = _random_member_id(rng)
+    swapped = member_id[:5] + member_id[5:].swapcase()
+    if (linkedin_urls.canonicalize_profile_url(f"https://www.linkedin.com/in/{member_id}/")
+            == linkedin_urls.canonicalize_profile_url(f"https://www.linkedin.com/in/{swapped}/")):
+        raise SystemExit(f"Normalizer merged member IDs {member_id!r} and {swapped!r}, which differ only in case")
+    return checked, len(legacy_outputs), len(canonical_outputs)
+
+
+def bench_url_normalizer(args):
+    """LinkedIn URL normalizer: randomized property checks, then throughput over millions of hrefs."""
+    checked, legacy_distinct, canonical_distinct = _check_url_normalizer_properties(args.property_cases)
+    print(f"Property checks passed on {checked} profile hrefs and {len(NON_PROFILE_HREFS)} non-profile hrefs: "
+          f"{canonical_distinct} canonical profiles (the legacy normalization kept {legacy_distinct} variants)")
+
+    # A page-like mix: mostly other links, common LinkedIn spellings, and a tail of unusual ones
+    rng = random.Random(1)
+    pool = []
+    for index in range(args.distinct):
+        roll = rng.random()
+        if roll < 0.6:
+            pool.append(f"https://github.com/user-{index}")
+        elif roll < 0.95:
+            pool.append(f"https://www.linkedin.com/in/user-{index}/?trk=forum")
+        else:
+            pool.append(_random_profile_href(rng, _random_slug(rng)))
+    hrefs = [pool[rng.randrange(len(pool))] for _ in range(args.hrefs)]
+    print(f"{len(hrefs):,} hrefs drawn from {len(pool):,} distinct ones")
+
+    linkedin_urls._canonicalize_slow.cache_clear()
+    for label, normalize in (("legacy", _legacy_normalize_href),
+                             ("canonical", linkedin_urls.canonicalize_profile_url),
+                             ("slow path only", lambda href: linkedin_urls._canonicalize_slow.__wrapped__(href)
+                              if 'linkedin.com' in href.lower() else None)):
+        start = time.perf_counter()
+        distinct = set(map(normalize, hrefs))
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<15} {elapsed:8.2f}s  {len(hrefs) / elapsed / 1e6:6.2f} M hrefs/s  "
+              f"({len(distinct - {None}):,} distinct profiles)")
+    cache = linkedin_urls._canonicalize_slow.cache_info()
+    print(f"  slow path cache: {cache.hits:,} hits, {cache.misses:,} misses, {cache.currsize:,} entries")
+
+
+class _ForumFixtureHandler(BaseHTTPRequestHandler):
+    """Serves ``/page/<n>`` as a synthetic forum page, with optional latency and transient failures.
+
+    Pages carry an ``ETag`` and answer a matching ``If-None-Match`` with 304, like a static site would.
+    """
+
+    def do_GET(self):
+        server = self.server
+        parts = self.path.strip('/').split('/')
+        if len(parts) != 2 or parts[0] != 'page' or not parts[1].isdigit():
+            self.send_error(404)
+            return
+        time.sleep(server.latency)
+        with server.lock:
+            # Transient: a page never fails more than twice in a row, so the engine's retries always recover it
+            fail = server.consecutive_failures.get(self.path, 0) < 2 and server.rng.random() < server.error_rate
+            server.consecutive_failures[self.path] = server.consecutive_failures.get(self.path, 0) + 1 if fail else 0
+            server.requests_served += 1
+        if fail:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = server.pages.get(int(parts[1]))
+        if body is None:
+            body = generate_forum_page(int(parts[1]), server.posts_per_page, server.linkedin_ratio).encode('utf-8')
+            server.pages[int(parts[1])] = body
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serve_forum_fixtures(latency=0.0, error_rate=0.0, posts_per_page=40, linkedin_ratio=0.5):
+    """Runs a local ``http.server`` stand-in for the forum and yields its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ForumFixtureHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.error_rate = error_rate
+    server.posts_per_page = posts_per_page
+    server.linkedin_ratio = linkedin_ratio
+    server.rng = random.Random(0)
+    server.lock = threading.Lock()
+    server.pages = {}
+    server.consecutive_failures = {}
+    server.requests_served = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def bench_static_fetch(args):
+    """Static fetch engine throughput (URLs/s) against a local fixture server at several concurrency levels."""
+    with serve_forum_fixtures(args.latency, args.error_rate, args.posts_per_page, args.linkedin_ratio) as (server, base_url):
+        urls = [f"{base_url}/page/{n}" for n in range(args.urls)]
+        print(f"Fixture server: {len(urls)} URLs, {args.latency * 1000:.0f} ms latency, {args.error_rate:.0%} transient 503s")
+
+        baseline = None
+        for concurrency in args.concurrency:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                cache = None
+                if args.http_cache:
+                    cache = linkedin_scraper._ResponseCache(os.path.join(cache_dir, "responses.sqlite"))
+                # With a cache the second pass is a warm rerun that only revalidates
+                for run_label in (("cold", "warm") if cache else ("",)):
+                    served_before = server.requests_served
+                    start = time.perf_counter()
+                    with _quiet():
+                        profiles = linkedin_scraper._scrape_static_urls(
+                            urls, {"User-Agent": "benchmark"},
+                            concurrency=concurrency, per_host_concurrency=concurrency,
+                            backoff=0.01, link_extractor=args.extractor, parse_workers=args.parse_workers,
+                            cache=cache,
+                        )
+                    elapsed = time.perf_counter() - start
+
+                    if baseline is None:
+                        baseline = profiles
+                    elif profiles != baseline:
+                        raise SystemExit(f"Result mismatch at concurrency {concurrency} {run_label}: "
+                                         f"{len(profiles)} vs {len(baseline)} profiles")
+                    print(f"  concurrency={concurrency:<4} {run_label:<4} {elapsed:8.2f}s  {len(urls) / elapsed:8.1f} URLs/s  "
+                          f"({server.requests_served - served_before} requests, {len(profiles)} profiles)")
+                if cache:
+                    cache.close()
+
+
+def _print_phase_metrics(phases):
+    """Prints the count and mean/max latency that ``linkedin_scraper.METRICS`` recorded for ``phases``."""
+    histograms = linkedin_scraper.METRICS.snapshot()['histograms']
+    for phase in phases:
+        if phase in histograms:
+            histogram = histograms[phase]
+            print(f"      {phase:<16} n={histogram['count']:<5} mean {histogram['mean'] * 1000:8.1f} ms  "
+                  f"max {histogram['max'] * 1000:8.1f} ms")
+
+
+def bench_dom_extraction(args):
+    """Selenium trigger loop against a fake WebDriver: per-trigger round-trips vs. batched extraction."""
+    users = fake_webdriver.make_users(args.triggers, args.linkedin_ratio, args.inline_ratio)
+    print(f"Fake page: {len(users)} triggers, {args.latency * 1000:.0f} ms per round-trip, "
+          f"{args.card_delay * 1000:.0f} ms card render delay")
+
+    baseline = None
+    for batch_extraction in (False, True):
+        drivers = []
+
+        def driver_factory(options):
+            drivers.append(fake_webdriver.FakeWebDriver(users, args.latency, args.card_delay))
+            return drivers[-1]
+
+        linkedin_scraper.METRICS.reset()
+        start = time.perf_counter()
+        with _quiet():
+            profiles = linkedin_scraper._scrape_url_dynamically_with_selenium(
+                "https://community.example/c/general/", "benchmark",
+                batch_extraction=batch_extraction, driver_factory=driver_factory, manual_login=False,
+            )
+        elapsed = time.perf_counter() - start
+
+        if baseline is None:
+            baseline = profiles
+        elif profiles != baseline:
+            raise SystemExit(f"Result mismatch: {len(profiles)} vs {len(baseline)} profiles")
+        round_trips = drivers[0].round_trips
+        print(f"  {'batched' if batch_extraction else 'per-trigger':<12} {elapsed:8.2f}s  "
+              f"{round_trips:6d} round-trips ({round_trips / len(users):5.1f}/trigger)  "
+              f"{len(profiles) / elapsed * 60:8.1f} profiles/min  ({len(profiles)} profiles)")
+        _print_phase_metrics(("page_load", "iframe_switch", "trigger_click", "modal_wait", "modal_close"))
+
+
+def bench_network_capture(args):
+    """Network capture vs. batched trigger clicks on a fake page, plus the offline HAR extractor."""
+    users = fake_webdriver.make_users(args.triggers, args.linkedin_ratio)
+    expected = {user.linkedin_url.rstrip('/') for user in users if user.linkedin_url}
+
+    with _quiet():
+        from_har = linkedin_scraper._extract_profiles_from_har(
+            fake_webdriver.make_har([(f"https://community.example/api/posts?page={page}", users[page::5]) for page in range(5)])
+        )
+    if from_har != expected:
+        raise SystemExit(f"HAR extractor mismatch: {len(from_har)} vs {len(expected)} profiles")
+    print(f"Synthetic HAR: extractor recovered all {len(expected)} profiles")
+    for har_file in args.har:
+        with open(har_file, 'r', encoding='utf-8') as f, _quiet():
+            recorded = linkedin_scraper._extract_profiles_from_har(json.load(f))
+        print(f"Recorded HAR {har_file}: {len(recorded)} profiles")
+
+    print(f"Fake page: {len(users)} triggers, {args.latency * 1000:.0f} ms per round-trip, "
+          f"{args.card_delay * 1000:.0f} ms card render delay")
+    for label, options in (("batched clicks", {'batch_extraction': True}), ("network capture", {'network_capture': True})):
+        drivers = []
+
+        def driver_factory(options):
+            drivers.append(fake_webdriver.FakeWebDriver(users, args.latency, args.card_delay))
+            return drivers[-1]
+
+        start = time.perf_counter()
+        with _quiet():
+            profiles = linkedin_scraper._scrape_url_dynamically_with_selenium(
+                "https://community.example/c/general/", "benchmark",
+                driver_factory=driver_factory, manual_login=False, **options,
+            )
+        elapsed = time.perf_counter() - start
+        if profiles != expected:
+            raise SystemExit(f"{label}: {len(profiles)} profiles, expected {len(expected)}")
+        print(f"  {label:<16} {elapsed:8.2f}s  {drivers[0].round_trips:6d} round-trips  ({len(profiles)} profiles)")
+
+
+def bench_driver_pool(args):
+    """Browser pool sharing one login: throughput by worker count, sharding one page or spreading many."""
+    if args.community_pages > 1:
+        pages = {
+            f"https://community.example/c/space-{page}/": fake_webdriver.make_users(
+                args.triggers, seed=page, first_user_id=page * args.triggers)
+            for page in range(args.community_pages)
+        }
+        urls = list(pages)
+    else:
+        pages = fake_webdriver.make_users(args.triggers)
+        urls = ["https://community.example/c/general/"]
+    print(f"Fake site: {len(urls)} community pages x {args.triggers} triggers, "
+          f"{args.latency * 1000:.0f} ms per round-trip, {args.card_delay * 1000:.0f} ms card render delay")
+
+    baseline = None
+    for workers in args.workers:
+        factory = fake_webdriver.FakeDriverFactory(pages, latency=args.latency, card_delay=args.card_delay)
+        start = time.perf_counter()
+        with _quiet():
+            profiles = linkedin_scraper._scrape_urls_with_driver_pool(
+                urls, "benchmark", workers, batch_extraction=True, driver_factory=factory, manual_login=False,
+                network_capture=args.network_capture,
+            )
+        elapsed = time.perf_counter() - start
+
+        if baseline is None:
+            baseline = profiles
+        elif profiles != baseline:
+            raise SystemExit(f"Result mismatch with {workers} browsers: {len(profiles)} vs {len(baseline)} profiles")
+        # Triggers a worker skipped (another shard's, or seen before) must not stay referenced by the page
+        retained = max(len(driver.remembered_keys) for driver in factory.drivers)
+        if retained > args.triggers // len(factory.drivers) // 10:
+            raise SystemExit(f"A browser still holds {retained} trigger elements after the run with {workers} browsers")
+        print(f"  browsers={workers:<3} {elapsed:8.2f}s  {len(profiles) / elapsed * 60:9.1f} profiles/min  "
+              f"({len(factory.drivers)} started, {factory.round_trips} round-trips, {len(profiles)} profiles, "
+              f"{retained} trigger elements held at the end)")
+
+
+def bench_pagination(args):
+    """Infinite-scroll feed: every post reached by scrolling, with flat cost per trigger as the page grows."""
+    users = fake_webdriver.make_users(args.posts, args.linkedin_ratio)
+    expected = {user.linkedin_url.rstrip('/') for user in users if user.linkedin_url}
+    print(f"Fake feed: {len(users)} posts, {args.initial_posts} rendered up front, {args.scroll_batch} more per scroll, "
+          f"{args.latency * 1000:.0f} ms per round-trip, {args.card_delay * 1000:.0f} ms card render delay")
+
+    drivers, click_times = [], []
+
+    def driver_factory(options):
+        driver = fake_webdriver.FakeWebDriver(users, args.latency, args.card_delay, initial_posts=args.initial_posts,
+                                              scroll_batch=args.scroll_batch, scroll_delay=args.scroll_delay,
+                                              rerender_posts=args.rerender_posts)
+        execute_script = driver.execute_script
+
+        def timed_execute_script(script, *script_args):
+            if script == linkedin_scraper._CLICK_TRIGGER_JS:
+                click_times.append(time.perf_counter())
+            return execute_script(script, *script_args)
+
+        driver.execute_script = timed_execute_script
+        drivers.append(driver)
+        return driver
+
+    start = time.perf_counter()
+    with _quiet():
+        profiles = linkedin_scraper._scrape_url_dynamically_with_selenium(
+            "https://community.example/c/general/", "benchmark",
+            batch_extraction=True, driver_factory=driver_factory, manual_login=False,
+        )
+    elapsed = time.perf_counter() - start
+    if profiles != expected:
+        raise SystemExit(f"Pagination missed posts: {len(profiles)} profiles, expected {len(expected)}")
+
+    windows = [
+        (click_times[end] - click_times[end - args.window]) / args.window
+        for end in range(args.window, len(click_times), args.window)
+    ]
+    print(f"  {elapsed:8.2f}s  {len(click_times)} triggers  {drivers[0].round_trips} round-trips  "
+          f"({drivers[0].calls.get('execute_async_script', 0)} async scripts, {len(profiles)} profiles)")
+    if windows:
+        print(f"  ms per trigger by window of {args.window}: first {windows[0] * 1000:.1f}, "
+              f"last {windows[-1] * 1000:.1f}, max {max(windows) * 1000:.1f}")
+
+
+def _suite_local_scan(params):
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        file_list = generate_forum_corpus(corpus_dir, params['pages'], params['posts_per_page'], params['linkedin_ratio'])
+        start = time.perf_counter()
+        profiles = linkedin_scraper._scan_local_files(file_list, params['extractor'])
+        return time.perf_counter() - start, len(file_list), profiles
+
+
+def _suite_static_fetch(params):
+    with serve_forum_fixtures(params['latency'], 0.0, params['posts_per_page'], params['linkedin_ratio']) as (server, base_url):
+        urls = [f"{base_url}/page/{n}" for n in range(params['urls'])]
+        start = time.perf_counter()
+        profiles = linkedin_scraper._scrape_static_urls(
+            urls, {"User-Agent": "benchmark"}, concurrency=params['concurrency'],
+            per_host_concurrency=params['concurrency'], backoff=0.01, link_extractor=params['extractor'], parse_workers=0,
+        )
+        return time.perf_counter() - start, len(urls), profiles
+
+
+def _suite_dynamic(params):
+    linkedin_scraper.SCROLL_WAIT_SECONDS = params['scroll_wait']
+    users = fake_webdriver.make_users(params['triggers'], params['linkedin_ratio'])
+
+    def driver_factory(options):
+        return fake_webdriver.FakeWebDriver(users, params['latency'], params['card_delay'],
+                                            initial_posts=params['initial_posts'], scroll_batch=params['scroll_batch'])
+
+    start = time.perf_counter()
+    profiles = linkedin_scraper._scrape_url_dynamically_with_selenium(
+        "https://community.example/c/general/", "benchmark", driver_factory=driver_factory, manual_login=False,
+        **{mode: True for mode in params['modes']},
+    )
+    return time.perf_counter() - start, params['triggers'], profiles
+
+
+# Each scenario is (runner, unit its items are counted in, fixed parameters). The parameters are recorded in the
+# baseline file, so changing one here means regenerating the baseline with --update-baseline.
+SUITE_SCENARIOS = {
+    'local-scan': (_suite_local_scan, 'pages', {
+        'pages': 400, 'posts_per_page': 40, 'linkedin_ratio': 0.5, 'extractor': 'stream',
+    }),
+    'local-scan-sparse': (_suite_local_scan, 'pages', {
+        'pages': 400, 'posts_per_page': 200, 'linkedin_ratio': 0.02, 'extractor': 'stream',
+    }),
+    'static-fetch': (_suite_static_fetch, 'pages', {
+        'urls': 200, 'posts_per_page': 40, 'linkedin_ratio': 0.5, 'latency': 0.01, 'concurrency': 8,
+        'extractor': 'stream',
+    }),
+    'dynamic-batched': (_suite_dynamic, 'triggers', {
+        'triggers': 200, 'linkedin_ratio': 0.8, 'latency': 0.001, 'card_delay': 0.002, 'initial_posts': 50,
+        'scroll_batch': 50, 'scroll_wait': 0.05, 'modes': ['batch_extraction'],
+    }),
+    'dynamic-network-capture': (_suite_dynamic, 'triggers', {
+        'triggers': 5000, 'linkedin_ratio': 0.8, 'latency': 0.001, 'card_delay': 0.002, 'initial_posts': 50,
+        'scroll_batch': 50, 'scroll_wait': 0.05, 'modes': ['network_capture'],
+    }),
+}
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+
+def _run_suite_scenario(name):
+    """Runs one suite scenario in a fresh process and returns its measurements."""
+    runner, unit, params = SUITE_SCENARIOS[name]
+    linkedin_scraper.METRICS.reset()
+    with _quiet():
+        elapsed, items, profiles = runner(params)
+    histograms = linkedin_scraper.METRICS.snapshot()['histograms']
+    return {
+        'params': params,
+        'unit': unit,
+        'items': items,
+        'elapsed': round(elapsed, 4),
+        'items_per_sec': round(items / elapsed, 2),
+        'profiles_per_sec': round(len(profiles) / elapsed, 2),
+        'profiles': len(profiles),
+        'digest': hashlib.sha256("\n".join(sorted(profiles)).encode('utf-8')).hexdigest(),
+        'peak_rss_mb': round(_peak_rss_kb() / 1024, 1),
+        'phases': {
+            phase: {'count': histogram['count'], 'mean_ms': round(histogram['mean'] * 1000, 3)}
+            for phase, histogram in sorted(histograms.items())
+        },
+    }
+
+
+def _compare_with_baseline(result, expected, tolerance, memory_tolerance):
+    """Lists how ``result`` regressed against its ``expected`` baseline entry; empty if it did not."""
+    if result['params'] != expected['params']:
+        return ["parameters differ from the baseline; rerun with --update-baseline"]
+    problems = []
+    if (result['profiles'], result['digest']) != (expected['profiles'], expected['digest']):
+        problems.append(f"found {result['profiles']} profiles (digest {result['digest'][:12]}), "
+                        f"baseline has {expected['profiles']} (digest {expected['digest'][:12]})")
+    for key in ('items_per_sec', 'profiles_per_sec'):
+        floor = expected[key] * (1 - tolerance)
+        if result[key] < floor:
+            problems.append(f"{key} {result[key]:.1f} is below {floor:.1f} (baseline {expected[key]:.1f})")
+    ceiling = expected['peak_rss_mb'] * (1 + memory_tolerance)
+    if result['peak_rss_mb'] > ceiling:
+        problems.append(f"peak RSS {result['peak_rss_mb']:.1f} MB is above {ceiling:.1f} MB "
+                        f"(baseline {expected['peak_rss_mb']:.1f} MB)")
+    return problems
+
+
+def bench_suite(args):
+    """Fixed end-to-end scenarios checked against the committed baseline: results, throughput and peak memory."""
+    names = args.scenario or list(SUITE_SCENARIOS)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['scenarios']
+
+    spawn = multiprocessing.get_context('spawn')
+    results, regressions = {}, 0
+    for name in names:
+        # A fresh process per scenario, so its VmHWM is the peak of that scenario alone
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+            result = results[name] = executor.submit(_run_suite_scenario, name).result()
+        print(f"  {name:<24} {result['elapsed']:8.2f}s  {result['items_per_sec']:9.1f} {result['unit'] + '/s':<10} "
+              f"{result['profiles_per_sec']:10.1f} profiles/s  peak RSS {result['peak_rss_mb']:7.1f} MB  "
+              f"({result['profiles']} profiles)")
+        for phase, timing in result['phases'].items():
+            print(f"      {phase:<18} n={timing['count']:<5} mean {timing['mean_ms']:8.1f} ms")
+
+        if args.update_baseline:
+            continue
+        if name not in baseline:
+            print(f"    no baseline for {name}; rerun with --update-baseline")
+            continue
+        for problem in _compare_with_baseline(result, baseline[name], args.tolerance, args.memory_tolerance):
+            print(f"    REGRESSION: {problem}")
+            regressions += 1
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'scenarios': baseline}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+    elif regressions:
+        raise SystemExit(f"{regressions} regression(s) against {args.baseline}")
+    else:
+        print(f"No regressions against {args.baseline} (throughput tolerance {args.tolerance:.0%}, "
+              f"memory tolerance {args.memory_tolerance:.0%})")
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    browser = argparse.ArgumentParser(add_help=False)
+    browser.add_argument("--scroll-wait", type=float, default=0.05,
+                         help="Seconds the fake feed may take to load more posts before a scroll counts as idle")
+
+    local_scan = subparsers.add_parser("local-scan", help=bench_local_scan.__doc__)
+    local_scan.add_argument("--pages", type=int, default=2000)
+    local_scan.add_argument("--posts-per-page", type=int, default=40)
+    local_scan.add_argument("--chunk-size", type=int, default=64)
+    local_scan.add_argument("--linkedin-ratio", type=float, default=0.5, help="Fraction of posts linking to LinkedIn")
+    local_scan.add_argument("--workers", type=int, nargs="*", help="Worker counts to compare (default: 1, 2, 4, all cores)")
+    local_scan.add_argument("--extractor", choices=sorted(linkedin_scraper.LINK_EXTRACTORS), default="soup")
+    local_scan.set_defaults(func=bench_local_scan)
+
+    incremental = subparsers.add_parser("incremental-scan", help=bench_incremental_scan.__doc__)
+    incremental.add_argument("--pages", type=int, default=5000)
+    incremental.add_argument("--posts-per-page", type=int, default=40)
+    incremental.add_argument("--changes", type=int, default=20, help="Files deleted/modified and added before the last run")
+    incremental.add_argument("--workers", type=int, default=1)
+    incremental.add_argument("--chunk-size", type=int, default=64)
+    incremental.add_argument("--extractor", choices=sorted(linkedin_scraper.LINK_EXTRACTORS), default="stream")
+    incremental.set_defaults(func=bench_incremental_scan)
+
+    extractors = subparsers.add_parser("extractors", help=bench_extractors.__doc__)
+    extractors.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000],
+                            help="Posts per generated page")
+    extractors.set_defaults(func=bench_extractors)
+
+    archives = subparsers.add_parser("archives", help=bench_archives.__doc__)
+    archives.add_argument("--pages", type=int, nargs="+", default=[500, 5000],
+                          help="Corpus sizes; peak RSS should not grow with them")
+    archives.add_argument("--posts-per-page", type=int, default=40)
+    archives.add_argument("--linkedin-ratio", type=float, default=0.5,
+                          help="Fraction of posts linking to LinkedIn; the set of profiles found is what RSS grows with")
+    archives.add_argument("--extractor", choices=sorted(linkedin_scraper.LINK_EXTRACTORS), default="stream")
+    archives.set_defaults(func=bench_archives)
+
+    url_normalizer = subparsers.add_parser("url-normalizer", help=bench_url_normalizer.__doc__)
+    url_normalizer.add_argument("--hrefs", type=int, default=2_000_000)
+    url_normalizer.add_argument("--distinct", type=int, default=200_000, help="Distinct hrefs the stream is drawn from")
+    url_normalizer.add_argument("--property-cases", type=int, default=2000, help="Random profiles for the property checks")
+    url_normalizer.set_defaults(func=bench_url_normalizer)
+
+    dom_extraction = subparsers.add_parser("dom-extraction", help=bench_dom_extraction.__doc__, parents=[browser])
+    dom_extraction.add_argument("--triggers", type=int, default=10,
+                                help="Triggers on the fake page; the per-trigger mode sleeps ~2.25 s on each")
+    dom_extraction.add_argument("--linkedin-ratio", type=float, default=1.0)
+    dom_extraction.add_argument("--inline-ratio", type=float, default=0.0,
+                                help="Fraction of LinkedIn links already visible in the post")
+    dom_extraction.add_argument("--latency", type=float, default=0.005, help="Seconds per WebDriver round-trip")
+    dom_extraction.add_argument("--card-delay", type=float, default=0.1, help="Seconds for a profile card to render")
+    dom_extraction.set_defaults(func=bench_dom_extraction)
+
+    network_capture = subparsers.add_parser("network-capture", help=bench_network_capture.__doc__, parents=[browser])
+    network_capture.add_argument("--triggers", type=int, default=40)
+    network_capture.add_argument("--linkedin-ratio", type=float, default=0.8)
+    network_capture.add_argument("--latency", type=float, default=0.005)
+    network_capture.add_argument("--card-delay", type=float, default=0.1)
+    network_capture.add_argument("--har", action="append", default=[], metavar="PATH",
+                                 help="Also run the extractor over a recorded HAR file")
+    network_capture.set_defaults(func=bench_network_capture)
+
+    driver_pool = subparsers.add_parser("driver-pool", help=bench_driver_pool.__doc__, parents=[browser])
+    driver_pool.add_argument("--triggers", type=int, default=40, help="Triggers per community page")
+    driver_pool.add_argument("--community-pages", type=int, default=1,
+                             help="More than one spreads whole pages across browsers instead of sharding triggers")
+    driver_pool.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    driver_pool.add_argument("--latency", type=float, default=0.005)
+    driver_pool.add_argument("--card-delay", type=float, default=0.1)
+    driver_pool.add_argument("--network-capture", action="store_true",
+                             help="Read each page from its API responses instead of clicking triggers")
+    driver_pool.set_defaults(func=bench_driver_pool)
+
+    pagination = subparsers.add_parser("pagination", help=bench_pagination.__doc__, parents=[browser])
+    pagination.add_argument("--posts", type=int, default=1000)
+    pagination.add_argument("--initial-posts", type=int, default=20, help="Posts rendered before the first scroll")
+    pagination.add_argument("--scroll-batch", type=int, default=20, help="Posts loaded by each scroll")
+    pagination.add_argument("--scroll-delay", type=float, default=0.02, help="Seconds a scroll takes to load its batch")
+    pagination.add_argument("--rerender-posts", type=int, default=0,
+                            help="Posts the feed keeps re-rendering; they must not keep the scroll loop alive")
+    pagination.add_argument("--window", type=int, default=100, help="Triggers per timing window")
+    pagination.add_argument("--linkedin-ratio", type=float, default=0.8)
+    pagination.add_argument("--latency", type=float, default=0.001)
+    pagination.add_argument("--card-delay", type=float, default=0.002)
+    pagination.set_defaults(func=bench_pagination)
+
+    result_sink = subparsers.add_parser("result-sink", help=bench_result_sink.__doc__)
+    result_sink.add_argument("--sources", type=int, default=2000)
+    result_sink.add_argument("--profiles-per-source", type=int, default=20)
+    result_sink.add_argument("--unique-profiles", type=int, default=20000,
+                             help="Size of the pool profiles are drawn from; smaller means more duplicates")
+    result_sink.set_defaults(func=bench_result_sink)
+
+    static_fetch = subparsers.add_parser("static-fetch", help=bench_static_fetch.__doc__)
+    static_fetch.add_argument("--urls", type=int, default=200)
+    static_fetch.add_argument("--posts-per-page", type=int, default=40)
+    static_fetch.add_argument("--linkedin-ratio", type=float, default=0.5, help="Fraction of posts linking to LinkedIn")
+    static_fetch.add_argument("--latency", type=float, default=0.05, help="Seconds the server waits per request")
+    static_fetch.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    static_fetch.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    static_fetch.add_argument("--parse-workers", type=int, default=None)
+    static_fetch.add_argument("--extractor", choices=sorted(linkedin_scraper.LINK_EXTRACTORS), default="stream")
+    static_fetch.add_argument("--http-cache", action="store_true", help="Run each level cold and warm through the response cache")
+    static_fetch.set_defaults(func=bench_static_fetch)
+
+    suite = subparsers.add_parser("suite", help=bench_suite.__doc__)
+    suite.add_argument("--scenario", action="append", choices=list(SUITE_SCENARIOS),
+                       help="Run only this scenario (repeatable; default: all)")
+    suite.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file to check against")
+    suite.add_argument("--update-baseline", action="store_true", help="Record this run as the new baseline")
+    suite.add_argument("--tolerance", type=float, default=0.5,
+                       help="Fraction of baseline throughput a run may lose before it counts as a regression")
+    suite.add_argument("--memory-tolerance", type=float, default=0.25,
+                       help="Fraction of baseline peak RSS a run may gain before it counts as a regression")
+    suite.set_defaults(func=bench_suite)
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    if hasattr(args, 'scroll_wait'):
+        linkedin_scraper.SCROLL_WAIT_SECONDS = args.scroll_wait
+    args.func(args)
@@ -0,0 +1,421 @@
+"""A scriptable stand-in for the Edge WebDriver, used by benchmark.py.
+
+It models just enough of the Udacity Community page for ``_scrape_url_dynamically_with_selenium`` to run
+end to end without a browser: an optional content iframe holding the profile triggers, a profile card
+(modal) in the main document that opens when a trigger is clicked, and a close button. Every WebDriver or
+WebElement call counts as one round-trip and costs ``latency`` seconds, so the two extraction modes can be
+compared by how often they talk to the browser.
+"""
+import json
+import random
+import threading
+import time
+
+from selenium.common.exceptions import NoSuchElementException, NoSuchFrameException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+import linkedin_scraper
+
+TRIGGER_SELECTOR = "div.post--list__user a"
+CARD_LINK_SELECTOR = "div[role='dialog'] a[href*='linkedin.com/in/'], div[class*='modal'] a[href*='linkedin.com/in/']"
+CARD_CLOSE_SELECTOR = "div[role='dialog'] button[aria-label*='lose'], div[class*='modal'] button[aria-label*='lose']"
+IFRAME_SELECTOR = "iframe[src*='inner.html']"
+INLINE_LINK_SELECTOR = "a[href*='linkedin.com/in/']"
+
+
+class FakeUser:
+    def __init__(self, user_id, linkedin_url=None, inline=False):
+        self.user_id = user_id
+        self.linkedin_url = linkedin_url
+        self.inline = inline  # The LinkedIn link is already visible in the post, no card needed
+
+
+class FakeElement(WebElement):
+    """A WebElement whose calls are forwarded to the owning driver's round-trip accounting.
+
+    It subclasses ``WebElement`` so Selenium's expected conditions accept it where they check the type.
+    """
+
+    def __init__(self, driver, tag_name, attributes=None, on_click=None, visible=lambda: True):
+        super().__init__(driver, f"fake-{id(self)}")
+        self._driver = driver
+        self._tag_name = tag_name
+        self._attributes = attributes or {}
+        self._on_click = on_click
+        self._visible = visible
+
+    @property
+    def tag_name(self):
+        self._driver._round_trip("tag_name")
+        return self._tag_name
+
+    @property
+    def location(self):
+        self._driver._round_trip("location")
+        return {'x': 0, 'y': 0}
+
+    def get_attribute(self, name):
+        self._driver._round_trip("get_attribute")
+        if name == 'outerHTML':
+            attributes = "".join(f' {key}="{value}"' for key, value in self._attributes.items())
+            return f"<{self._tag_name}{attributes}></{self._tag_name}>"
+        return self._attributes.get(name)
+
+    def is_displayed(self):
+        self._driver._round_trip("is_displayed")
+        return self._visible()
+
+    def is_enabled(self):
+        self._driver._round_trip("is_enabled")
+        return True
+
+    def click(self):
+        self._driver._round_trip("click")
+        if self._on_click:
+            self._on_click()
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def frame(self, frame_reference):
+        self._driver._round_trip("switch_to.frame")
+        if frame_reference is not self._driver._iframe_element:
+            raise NoSuchFrameException("Unknown frame")
+        self._driver._context = 'frame'
+
+    def default_content(self):
+        self._driver._round_trip("switch_to.default_content")
+        self._driver._context = 'default'
+
+
+SESSION_COOKIE = {'name': 'session', 'value': 'fake-session', 'path': '/', 'sameSite': 'Lax'}
+
+
+class FakeWebDriver:
+    """Fake Edge WebDriver over community pages made of ``FakeUser`` posts.
+
+    ``pages`` is either one list of users shown at every URL or a dict mapping URLs to their users.
+    ``latency`` is the cost of each round-trip and ``card_delay`` how long a profile card takes to render
+    after its trigger is clicked. With ``use_iframe`` the triggers live inside the community iframe and the
+    card opens in the main document, as on the live site. With ``require_login`` the page only shows posts
+    to a browser holding the session cookie; ``auto_login`` hands that cookie out on the first page load,
+    standing in for the manual login. With ``initial_posts`` the feed scrolls infinitely: only that many
+    posts are loaded at first and each scroll to the bottom loads ``scroll_batch`` more after ``scroll_delay``.
+    With ``rerender_posts`` the feed keeps re-rendering its last that many loaded posts, so every collect and
+    scroll reports them again, as a virtualized list re-mounting rows would. ``remembered_keys`` mirrors the
+    collect script's ``byKey`` map: the triggers the page keeps a reference to because they may still be clicked.
+    Every load (the first page and each scroll) is logged as one JSON API response in the performance log.
+    Its ``loadingFinished`` event only shows up in the drain after its ``responseReceived``, as when a drain
+    lands while the response is still loading.
+    """
+
+    def __init__(self, pages, latency=0.0, card_delay=0.0, use_iframe=True, require_login=False, auto_login=False,
+                 initial_posts=None, scroll_batch=20, scroll_delay=0.0, rerender_posts=0):
+        self.pages = pages
+        self.latency = latency
+        self.card_delay = card_delay
+        self.use_iframe = use_iframe
+        self.require_login = require_login
+        self.auto_login = auto_login
+        self.initial_posts = initial_posts
+        self.scroll_batch = scroll_batch
+        self.scroll_delay = scroll_delay
+        self.rerender_posts = rerender_posts
+        self.round_trips = 0
+        self.calls = {}
+        self.remembered_keys = set()
+        self.current_url = "about:blank"
+        self.switch_to = _FakeSwitchTo(self)
+        self._lock = threading.Lock()
+        self._cookies = {}
+        self._context = 'default'
+        self._open_card = None  # (user, time the card becomes visible)
+        self._iframe_element = FakeElement(self, 'iframe', {'src': 'inner.html'})
+        self._trigger_cache = {}
+        self._loaded = 0  # Posts of the current page rendered so far
+        self._drained = 0  # Posts already handed out by the collect script
+        self._user_index = (None, {})
+        self._performance_log = []
+        self._in_flight_events = []  # loadingFinished events held back until the next drain
+        self._response_bodies = {}
+        self._card_link = FakeElement(self, 'a', visible=self._card_visible)
+        self._close_button = FakeElement(self, 'button', {'aria-label': 'Close'}, on_click=self._close_card,
+                                         visible=self._card_visible)
+
+    # --- Round-trip accounting ---
+
+    def _round_trip(self, name):
+        with self._lock:
+            self.round_trips += 1
+            self.calls[name] = self.calls.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    # --- Page model ---
+
+    @property
+    def users(self):
+        """The posts visible on the current page to the current session."""
+        if self.require_login and 'session' not in self._cookies:
+            return []
+        if isinstance(self.pages, dict):
+            return self.pages.get(self.current_url, [])
+        return self.pages
+
+    @property
+    def _triggers(self):
+        if self.current_url not in self._trigger_cache:
+            self._trigger_cache[self.current_url] = [
+                FakeElement(self, 'a', {'href': f"/u/{user.user_id}"}, on_click=lambda user=user: self._click_trigger(user))
+                for user in self.users
+            ]
+        return self._trigger_cache[self.current_url][:self._loaded] if self.users else []
+
+    def _in_trigger_context(self):
+        return self._context == ('frame' if self.use_iframe else 'default')
+
+    def _click_trigger(self, user):
+        if self._in_trigger_context():
+            self._open_card = (user, time.monotonic() + self.card_delay)
+
+    def _card_visible(self):
+        return self._open_card is not None and time.monotonic() >= self._open_card[1]
+
+    def _close_card(self):
+        self._open_card = None
+
+    def _card_link_element(self):
+        user = self._open_card[0]
+        if not user.linkedin_url:
+            return None
+        self._card_link._attributes = {'href': user.linkedin_url}
+        return self._card_link
+
+    def _find(self, selector):
+        if self.use_iframe and selector == IFRAME_SELECTOR and self._context == 'default':
+            return [self._iframe_element]
+        if selector == TRIGGER_SELECTOR and self._in_trigger_context():
+            return list(self._triggers)
+        if self._context == 'default' and self._card_visible():
+            if selector == CARD_LINK_SELECTOR:
+                link = self._card_link_element()
+                return [link] if link else []
+            if selector == CARD_CLOSE_SELECTOR:
+                return [self._close_button]
+        return []
+
+    @staticmethod
+    def _log_entry(method, params):
+        return {'level': 'INFO', 'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+    def _record_api_response(self, users):
+        """Logs the JSON API call that loaded ``users``, as Chromium's performance log would."""
+        page = len(self._response_bodies)
+        request_id = f"{page + 1}.0"
+        url = f"{self.current_url.rstrip('/')}/api/posts?page={page}"
+        self._response_bodies[request_id] = json.dumps(api_payload(users, page))
+        self._performance_log.append(self._log_entry(
+            'Network.responseReceived',
+            {'requestId': request_id, 'type': 'XHR', 'response': {'url': url, 'mimeType': 'application/json'}},
+        ))
+        self._in_flight_events.append(self._log_entry('Network.loadingFinished', {'requestId': request_id}))
+
+    def _load_more(self):
+        """Loads the next ``scroll_batch`` posts of an infinite feed and returns how many were added."""
+        if self.scroll_delay:
+            time.sleep(self.scroll_delay)
+        previously_loaded = self._loaded
+        self._loaded = min(len(self.users), self._loaded + self.scroll_batch)
+        self._record_api_response(self.users[previously_loaded:self._loaded])
+        return self._loaded - previously_loaded
+
+    # --- WebDriver API ---
+
+    def get_log(self, log_type):
+        self._round_trip("get_log")
+        if log_type != 'performance':
+            return []
+        entries, self._performance_log = self._performance_log, self._in_flight_events
+        self._in_flight_events = []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self._round_trip("execute_cdp_cmd")
+        if cmd == 'Network.getResponseBody' and cmd_args['requestId'] in self._response_bodies:
+            return {'body': self._response_bodies[cmd_args['requestId']], 'base64Encoded': False}
+        raise NoSuchElementException(f"No resource with given identifier found: {cmd_args}")
+
+    def get(self, url):
+        self._round_trip("get")
+        self.current_url = url
+        self._context = 'default'
+        self._open_card = None
+        if self.auto_login:
+            self._cookies.setdefault('session', dict(SESSION_COOKIE))
+        self._loaded = len(self.users) if self.initial_posts is None else min(self.initial_posts, len(self.users))
+        self._drained = 0
+        self.remembered_keys = set()
+        if self._loaded:
+            self._record_api_response(self.users[:self._loaded])
+
+    def maximize_window(self):
+        self._round_trip("maximize_window")
+
+    def get_cookies(self):
+        self._round_trip("get_cookies")
+        return [dict(cookie) for cookie in self._cookies.values()]
+
+    def add_cookie(self, cookie_dict):
+        self._round_trip("add_cookie")
+        self._cookies[cookie_dict['name']] = dict(cookie_dict)
+
+    def delete_all_cookies(self):
+        self._round_trip("delete_all_cookies")
+        self._cookies = {}
+
+    def set_script_timeout(self, seconds):
+        self._round_trip("set_script_timeout")
+
+    def quit(self):
+        self._round_trip("quit")
+
+    @property
+    def page_source(self):
+        self._round_trip("page_source")
+        links = ""
+        if self._context == 'default' and self._card_visible():
+            link = self._card_link_element()
+            links = f'<div role="dialog"><a href="{link._attributes["href"]}">LinkedIn</a></div>' if link else ""
+        return f"<html><body>{links}</body></html>"
+
+    def find_elements(self, by=By.ID, value=None):
+        self._round_trip("find_elements")
+        return self._find(value)
+
+    def find_element(self, by=By.ID, value=None):
+        self._round_trip("find_element")
+        found = self._find(value)
+        if not found:
+            raise NoSuchElementException(f"No element matches '{value}'")
+        return found[0]
+
+    def execute_script(self, script, *args):
+        self._round_trip("execute_script")
+        if script == linkedin_scraper._COLLECT_TRIGGERS_JS:
+            if not self._in_trigger_context():
+                return {'triggers': [], 'linkedin_hrefs': []}
+            self.remembered_keys.difference_update(args[2] if len(args) > 2 else ())
+            new_users = self.users[min(self._drained, max(0, self._loaded - self.rerender_posts)):self._loaded]
+            self._drained = self._loaded
+            self.remembered_keys.update(f"/u/{user.user_id}" for user in new_users)
+            return {
+                'triggers': [{'key': f"/u/{user.user_id}", 'href': f"/u/{user.user_id}"} for user in new_users],
+                'linkedin_hrefs': [user.linkedin_url for user in new_users if user.inline and user.linkedin_url],
+            }
+        if script == linkedin_scraper._CLICK_TRIGGER_JS:
+            key = args[0]
+            self.remembered_keys.discard(key)
+            if not (self._in_trigger_context() and key.startswith("/u/") and key[3:].isdigit()):
+                return False
+            user = self._user_by_id(int(key[3:]))
+            if user is None:
+                return False
+            self._click_trigger(user)
+            return True
+        return None  # scrollIntoView and other fire-and-forget scripts
+
+    def _user_by_id(self, user_id):
+        if self._user_index[0] is not self.users:
+            self._user_index = (self.users, {user.user_id: position for position, user in enumerate(self.users)})
+        position = self._user_index[1].get(user_id)
+        return self.users[position] if position is not None and position < self._loaded else None
+
+    def execute_async_script(self, script, *args):
+        self._round_trip("execute_async_script")
+        if script in (linkedin_scraper._SCROLL_FOR_MORE_TRIGGERS_JS, linkedin_scraper._SCROLL_FOR_MORE_RESPONSES_JS):
+            result_key = 'new_triggers' if script == linkedin_scraper._SCROLL_FOR_MORE_TRIGGERS_JS else 'new_requests'
+            if not self._in_trigger_context() or self._loaded >= len(self.users):
+                if self.rerender_posts and result_key == 'new_triggers' and self._loaded:
+                    return {result_key: min(self.rerender_posts, self._loaded)}  # Re-rendered rows queue up at once
+                time.sleep(args[0] / 1000)  # Nothing more to load: the script waits out its timeout
+                return {result_key: 0}
+            added = self._load_more()
+            return {result_key: added if result_key == 'new_triggers' else 1}
+        if script == linkedin_scraper._READ_AND_CLOSE_PROFILE_CARD_JS:
+            if self._context != 'default' or self._open_card is None:
+                time.sleep(args[2] / 1000)  # Nothing will ever open: the script runs into its timeout
+                return {'opened': False, 'hrefs': [], 'closed': False, 'wait_ms': args[2], 'close_ms': 0}
+            remaining = max(0.0, self._open_card[1] - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)  # The page-side observer fires as soon as the card renders
+            link = self._card_link_element()
+            self._close_card()
+            return {'opened': True, 'hrefs': [link._attributes['href']] if link else [], 'closed': True,
+                    'wait_ms': int(remaining * 1000), 'close_ms': 0}
+        return None
+
+
+class FakeDriverFactory:
+    """A ``driver_factory`` producing ``FakeWebDriver`` instances that require a login.
+
+    The first browser created plays the login browser and receives the session cookie when it loads a
+    page; every later browser only sees posts once that cookie has been injected into it.
+    """
+
+    def __init__(self, pages, **driver_options):
+        self.pages = pages
+        self.driver_options = driver_options
+        self.drivers = []
+        self.options = []
+
+    def __call__(self, options):
+        self.options.append(options)
+        driver = FakeWebDriver(self.pages, require_login=True, auto_login=not self.drivers, **self.driver_options)
+        self.drivers.append(driver)
+        return driver
+
+    @property
+    def round_trips(self):
+        return sum(driver.round_trips for driver in self.drivers)
+
+
+def api_payload(users, page=0):
+    """Builds the JSON body of one page of the fake community's posts API.
+
+    LinkedIn URLs show up in two places, like on real profiles: a structured link list, and the free-text
+    bio, without a scheme and followed by punctuation.
+    """
+    posts = []
+    for user in users:
+        profile = {'links': [], 'bio': "Student at Udacity."}
+        if user.linkedin_url and user.user_id % 2 == 0:
+            profile['links'].append({'type': 'linkedin', 'url': user.linkedin_url})
+        elif user.linkedin_url:
+            profile['bio'] = f"Let's connect: {user.linkedin_url.split('://', 1)[1]}."
+        posts.append({'id': f"post-{user.user_id}", 'author': {'id': user.user_id, 'profile': profile}})
+    return {'data': {'posts': posts}, 'page': page}
+
+
+def make_har(pages):
+    """Builds a HAR archive (as a dict) recording one API response per ``(url, users)`` pair in ``pages``."""
+    entries = []
+    for url, users in pages:
+        entries.append({
+            'request': {'method': 'GET', 'url': url},
+            'response': {'status': 200, 'content': {'mimeType': 'application/json; charset=utf-8',
+                                                    'text': json.dumps(api_payload(users))}},
+        })
+    return {'log': {'version': '1.2', 'entries': entries}}
+
+
+def make_users(count, linkedin_ratio=1.0, inline_ratio=0.0, seed=0, first_user_id=0):
+    """Builds ``count`` fake forum users; ``linkedin_ratio`` of them have a LinkedIn profile."""
+    rng = random.Random(seed)
+    users = []
+    for user_id in range(first_user_id, first_user_id + count):
+        linkedin_url = f"https://www.linkedin.com/in/user-{user_id}/" if rng.random() < linkedin_ratio else None
+        users.append(FakeUser(user_id, linkedin_url, inline=bool(linkedin_url) and rng.random() < inline_ratio))
+    return users
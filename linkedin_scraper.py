@@ -3,248 +3,1921 @@ from bs4 import BeautifulSoup
 import os # For accessing environment variables
 import glob
 import time
+import argparse
+import asyncio
+import functools
+import random
+import json
+import sqlite3
+import zlib
+import hashlib
+import queue
+import contextlib
+import subprocess
+import shutil
+import re
+import base64
+import csv
+import io
+import logging
+import threading
+import cProfile
+import pstats
+import importlib.util
+import multiprocessing
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.edge.service import Service as EdgeService # Import EdgeService
 from webdriver_manager.microsoft import EdgeChromiumDriverManager # Import EdgeChromiumDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException # Import TimeoutException and NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException # Import TimeoutException and NoSuchElementException
 from selenium.webdriver.support import expected_conditions as EC
+from linkedin_urls import CANONICAL_FORM_VERSION, canonicalize_profile_url
+from page_archives import ARCHIVE_ERRORS, file_digest, iter_pages
+
+
+# --- Logging and metrics ---
+logger = logging.getLogger("linkedin_scraper")
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)  # Histogram bounds in seconds
+
+
+class _Metrics:
+    """Thread-safe counters and per-phase latency histograms for the scrape pipeline.
+
+    Histograms keep cumulative counts per bucket of ``LATENCY_BUCKETS`` plus the sum, min and max, so they
+    stay the same size however long the run is. ``snapshot`` renders them as a dict for JSON and
+    ``to_prometheus`` in the Prometheus text exposition format.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def observe(self, phase, seconds):
+        with self._lock:
+            histogram = self._histograms.get(phase)
+            if histogram is None:
+                histogram = self._histograms[phase] = {
+                    'count': 0, 'sum': 0.0, 'min': seconds, 'max': seconds, 'buckets': [0] * len(LATENCY_BUCKETS),
+                }
+            histogram['count'] += 1
+            histogram['sum'] += seconds
+            histogram['min'] = min(histogram['min'], seconds)
+            histogram['max'] = max(histogram['max'], seconds)
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    histogram['buckets'][index] += 1
+
+    def snapshot(self):
+        """Returns the counters and histograms as plain data, e.g. for ``json.dump``."""
+        with self._lock:
+            return {
+                'counters': dict(sorted(self._counters.items())),
+                'histograms': {
+                    phase: {
+                        'count': histogram['count'],
+                        'sum': histogram['sum'],
+                        'mean': histogram['sum'] / histogram['count'],
+                        'min': histogram['min'],
+                        'max': histogram['max'],
+                        'buckets': {str(bound): count for bound, count in zip(LATENCY_BUCKETS, histogram['buckets'])},
+                    }
+                    for phase, histogram in sorted(self._histograms.items())
+                },
+            }
+
+    def to_prometheus(self, prefix="linkedin_scraper"):
+        """Renders the metrics in the Prometheus text format: one counter family and one phase histogram."""
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {prefix}_events_total counter"]
+        for name, value in snapshot['counters'].items():
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+        lines.append(f"# TYPE {prefix}_phase_seconds histogram")
+        for phase, histogram in snapshot['histograms'].items():
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{prefix}_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_phase_seconds_bucket{{phase="{phase}",le="+Inf"}} {histogram["count"]}')
+            lines.append(f'{prefix}_phase_seconds_sum{{phase="{phase}"}} {histogram["sum"]:.6f}')
+            lines.append(f'{prefix}_phase_seconds_count{{phase="{phase}"}} {histogram["count"]}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = _Metrics()
+
+
+@contextlib.contextmanager
+def _timed_phase(phase):
+    """Records how long the wrapped block takes in the ``phase`` histogram of ``METRICS``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        METRICS.observe(phase, elapsed)
+        logger.debug(f"  [timing] {phase}: {elapsed:.3f}s", extra={'phase': phase, 'elapsed': elapsed})
+
+
+class _JsonLogFormatter(logging.Formatter):
+    """Formats each record as one JSON object, including any fields passed through ``extra``."""
+
+    _STANDARD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage().strip(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in self._STANDARD_ATTRIBUTES)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _ConsoleLogFormatter(logging.Formatter):
+    """Prints INFO messages as they are, like the script always has, and prefixes every other level."""
+
+    def format(self, record):
+        message = super().format(record)
+        return message if record.levelno == logging.INFO else f"[{record.levelname}] {message}"
+
+
+def _configure_logging(level="INFO", log_format="text"):
+    """Sends the scraper's log records to stderr at ``level``, as plain text or one JSON object per line."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(_JsonLogFormatter() if log_format == "json" else _ConsoleLogFormatter())
+    logger.handlers[:] = [handler]
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = METRICS.to_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"  metrics endpoint: {format % args}")
+
+
+def _serve_metrics(port, host="127.0.0.1"):
+    """Serves ``METRICS`` at ``http://host:port/metrics`` from a daemon thread and returns the server."""
+    server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(f"Serving Prometheus metrics at http://{host}:{server.server_port}/metrics")
+    return server
+
+
+def _write_metrics(path):
+    """Writes a JSON snapshot of ``METRICS`` to ``path`` (``-`` for stdout)."""
+    snapshot = json.dumps(METRICS.snapshot(), indent=2)
+    if path == '-':
+        print(snapshot)
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(snapshot + "\n")
+    logger.info(f"Metrics written to {path}")
+
+
+@contextlib.contextmanager
+def _profiled(profiler=None, output_path=None, top=25):
+    """Runs the wrapped block under ``cProfile`` or ``pyinstrument`` (optional) and reports the hot spots.
+
+    ``cprofile`` dumps its stats to ``output_path`` (for ``snakeviz``/``pstats``) when given and logs the
+    ``top`` functions by cumulative time. ``pyinstrument`` writes an HTML report to ``output_path``, or
+    logs its text report.
+    """
+    if not profiler:
+        yield
+        return
+    if profiler == 'pyinstrument':
+        from pyinstrument import Profiler  # Optional dependency, only needed for --profiler pyinstrument
+        profile = Profiler()
+        profile.start()
+        try:
+            yield
+        finally:
+            profile.stop()
+            if output_path:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(profile.output_html())
+                logger.info(f"pyinstrument report written to {output_path}")
+            else:
+                logger.info(profile.output_text(unicode=True, color=False))
+        return
+
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        if output_path:
+            profile.dump_stats(output_path)
+            logger.info(f"cProfile stats written to {output_path}")
+        report = io.StringIO()
+        pstats.Stats(profile, stream=report).sort_stats('cumulative').print_stats(top)
+        logger.info(report.getvalue())
+
+
+STREAM_READ_SIZE = 64 * 1024  # Characters fed to the streaming extractor per read
+
+
+def _add_linkedin_href(found_profiles, href):
+    """Canonicalizes ``href`` and adds it to ``found_profiles`` if it is a LinkedIn profile link."""
+    profile_url = canonicalize_profile_url(href)
+    if profile_url:
+        found_profiles.add(profile_url)
+        logger.debug(f"Found LinkedIn profile: {profile_url}")
 
 
 def _extract_linkedin_links_from_soup(soup_object):
     """Extracts LinkedIn profile URLs from a BeautifulSoup object."""
     found_profiles = set()
     for link_tag in soup_object.find_all('a', href=True):
-        href = link_tag['href']
-        if 'linkedin.com/in/' in href.lower():
-            # Basic normalization: remove query parameters
-            profile_url = href.split('?')[0]
-            if profile_url.endswith('/'):
-                profile_url = profile_url[:-1]
-            found_profiles.add(profile_url)
-            print(f"Found LinkedIn profile: {profile_url}")
+        _add_linkedin_href(found_profiles, link_tag['href'])
     return found_profiles
 
 
-def scrape_linkedin_profiles():
+class _LinkedInHrefParser(HTMLParser):
+    """Tokenizer-based extractor that only looks at ``<a href>`` attributes and never builds a DOM."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found_profiles = set()
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a':
+            return
+        href = None
+        for name, value in attrs:
+            if name == 'href':
+                href = value  # Last one wins, matching BeautifulSoup's handling of duplicate attributes
+        if href:
+            _add_linkedin_href(self.found_profiles, href)
+
+    handle_startendtag = handle_starttag
+
+
+def _extract_linkedin_links_streaming(source):
+    """Extracts LinkedIn profile URLs from an HTML string or text file object without building a tree.
+
+    File objects are fed to the tokenizer ``STREAM_READ_SIZE`` characters at a time, so memory use stays
+    flat regardless of page size.
+    """
+    parser = _LinkedInHrefParser()
+    if isinstance(source, str):
+        parser.feed(source)
+    else:
+        for chunk in iter(functools.partial(source.read, STREAM_READ_SIZE), ''):
+            parser.feed(chunk)
+    parser.close()
+    return parser.found_profiles
+
+
+def _extract_linkedin_links_with_soup(source):
+    """Extracts LinkedIn profile URLs from an HTML string or text file object via a full BeautifulSoup tree."""
+    return _extract_linkedin_links_from_soup(BeautifulSoup(source, 'html.parser'))
+
+
+# Link extractor backends, selectable with --extractor. Each takes an HTML string or a text file object.
+LINK_EXTRACTORS = {
+    'soup': _extract_linkedin_links_with_soup,
+    'stream': _extract_linkedin_links_streaming,
+}
+
+
+def _extract_linkedin_links(source, extractor='soup'):
+    """Extracts LinkedIn profile URLs from ``source`` with the named extractor backend."""
+    try:
+        extract = LINK_EXTRACTORS[extractor]
+    except KeyError:
+        raise ValueError(f"Unknown link extractor '{extractor}'. Choose from: {', '.join(LINK_EXTRACTORS)}") from None
+    return extract(source)
+
+
+# Matches LinkedIn profile URLs embedded anywhere in a string, e.g. inside a bio or a markdown link
+_LINKEDIN_URL_IN_TEXT = re.compile(r"(?:https?://)?(?:[\w-]+\.)*linkedin\.com/in/[^\s\"'<>()\[\]{},]+", re.IGNORECASE)
+
+
+def _extract_linkedin_links_from_json(payload):
+    """Extracts LinkedIn profile URLs from every string in a decoded JSON payload.
+
+    The payload is walked iteratively, so deeply nested API responses cannot hit the recursion limit.
+    """
+    found_profiles = set()
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, str) and 'linkedin.com/in/' in node.lower():
+            for match in _LINKEDIN_URL_IN_TEXT.findall(node):
+                # Sentence punctuation after a URL in free text; a missing scheme is fine for the canonicalizer
+                _add_linkedin_href(found_profiles, match.rstrip('.;:!'))
+    return found_profiles
+
+
+def _extract_linkedin_links_from_json_text(text):
+    """Parses ``text`` as JSON and extracts LinkedIn profile URLs from it; non-JSON text yields nothing."""
+    try:
+        return _extract_linkedin_links_from_json(json.loads(text))
+    except ValueError:
+        return set()
+
+
+def _extract_profiles_from_har(har, url_pattern=None):
+    """Extracts LinkedIn profile URLs from the JSON responses recorded in a HAR archive (as a dict).
+
+    Only responses with a JSON MIME type are read, optionally narrowed to URLs matching ``url_pattern``.
+    Base64-encoded bodies are decoded first.
+    """
+    found_profiles = set()
+    for entry in har.get('log', {}).get('entries', []):
+        request_url = entry.get('request', {}).get('url', '')
+        content = entry.get('response', {}).get('content', {})
+        if 'json' not in content.get('mimeType', '').lower() or not content.get('text'):
+            continue
+        if url_pattern and not re.search(url_pattern, request_url):
+            continue
+        text = content['text']
+        if content.get('encoding') == 'base64':
+            text = base64.b64decode(text).decode('utf-8', errors='replace')
+        found_profiles.update(_extract_linkedin_links_from_json_text(text))
+    return found_profiles
+
+
+def _extract_profiles_from_file(filename, extractor='soup', with_digest=False):
+    """Parses a saved HTML file and returns the LinkedIn profiles found in it, or ``None`` on error.
+
+    ``.gz``, ``.zip`` and WARC archives are read page by page without unpacking them (see ``page_archives``);
+    the profiles of all their pages are returned together. If an archive is truncated or corrupt partway
+    through, the profiles of the pages before the damage are returned and the rest of the archive is skipped.
+
+    With ``with_digest`` it returns ``(profiles, sha256)`` instead, where ``sha256`` is the file's
+    ``page_archives.file_digest`` computed from the bytes read for parsing, or ``None`` if the file was not
+    read to the end.
+    """
+    found_profiles = set()
+    pages_read = 0
+    digest = hashlib.sha256() if with_digest else None
+    profiles = None
+    complete = False
+    try:
+        logger.debug(f"Processing {filename}")
+        for page_name, page in iter_pages(filename, digest=digest):
+            if page_name != filename:
+                logger.debug(f"  Reading {page_name}")
+            found_profiles.update(_extract_linkedin_links(page, extractor))
+            pages_read += 1
+        profiles = found_profiles
+        complete = True
+    except FileNotFoundError:  # Ahead of ARCHIVE_ERRORS, which is a plain OSError for gzip on Python 3.7
+        logger.warning(f"Error: File not found {filename}")
+    except ARCHIVE_ERRORS as e:
+        if pages_read:
+            logger.error(f"Error processing file {filename} after {pages_read} pages, keeping the profiles "
+                         f"found so far ({type(e).__name__}): {e}")
+            profiles = found_profiles
+        else:
+            logger.error(f"Error processing file {filename} ({type(e).__name__}): {e}")
+    except Exception as e:
+        logger.error(f"Error processing file {filename} ({type(e).__name__}): {e}")
+    if with_digest:
+        return profiles, digest.hexdigest() if complete else None
+    return profiles
+
+
+def _extract_profiles_from_file_chunk(filenames, extractor='soup', with_digests=False):
+    """Worker entry point: parses a chunk of files and returns ``(filename, sorted profiles or None, seconds, sha256)``.
+
+    The parse time travels back with the result because metrics recorded in a worker process are lost.
+    ``sha256`` is the digest computed while parsing with ``with_digests`` (see ``_extract_profiles_from_file``),
+    else ``None``.
+    """
+    chunk_results = []
+    for filename in filenames:
+        start = time.perf_counter()
+        sha256 = None
+        if with_digests:
+            profiles, sha256 = _extract_profiles_from_file(filename, extractor, with_digest=True)
+        else:
+            profiles = _extract_profiles_from_file(filename, extractor)
+        chunk_results.append((filename, None if profiles is None else sorted(profiles), time.perf_counter() - start,
+                              sha256))
+    return chunk_results
+
+
+def _record_local_file_parse(profiles, elapsed):
+    METRICS.observe("local_file_parse", elapsed)
+    METRICS.increment("local_files_parsed" if profiles is not None else "local_file_errors")
+
+
+def _iter_local_file_results(file_list, max_workers=1, chunk_size=64, extractor='soup', digests=None):
+    """Yields ``(filename, profiles)`` for every file in ``file_list`` order; ``profiles`` is ``None`` on error.
+
+    With ``max_workers`` other than 1 the files are parsed across a process pool, dispatched in chunks of
+    ``chunk_size`` to keep pickling overhead low. Chunk results come back in submission order, so the
+    outcome does not depend on which worker finishes first. ``None`` or 0 uses every available core.
+
+    With a ``digests`` dict, each file's content digest, computed while it was parsed, is stored in it under
+    the file's name before the file is yielded (``None`` if the file was not read to the end).
+    """
+    with_digests = digests is not None
+    if max_workers == 1 or len(file_list) <= 1:
+        for filename in file_list:
+            start = time.perf_counter()
+            if with_digests:
+                profiles, digests[filename] = _extract_profiles_from_file(filename, extractor, with_digest=True)
+            else:
+                profiles = _extract_profiles_from_file(filename, extractor)
+            _record_local_file_parse(profiles, time.perf_counter() - start)
+            yield filename, profiles
+        return
+
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+    chunks = [file_list[i:i + chunk_size] for i in range(0, len(file_list), chunk_size)]
+    logger.info(f"  Dispatching {len(file_list)} files in {len(chunks)} chunks to {max_workers} worker processes...")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        worker = functools.partial(_extract_profiles_from_file_chunk, extractor=extractor, with_digests=with_digests)
+        for chunk_results in executor.map(worker, chunks):
+            for filename, profiles, elapsed, sha256 in chunk_results:
+                _record_local_file_parse(profiles, elapsed)
+                if with_digests:
+                    digests[filename] = sha256
+                yield filename, None if profiles is None else set(profiles)
+
+
+def _scan_local_files(file_list, extractor='soup'):
+    """Parses local HTML files one at a time in the current process."""
+    found_profiles = set()
+    for _, profiles in _iter_local_file_results(file_list, 1, extractor=extractor):
+        found_profiles.update(profiles or ())
+    return found_profiles
+
+
+def _scan_local_files_parallel(file_list, max_workers=None, chunk_size=64, extractor='soup'):
+    """Parses local HTML files across a process pool (see ``_iter_local_file_results``)."""
+    found_profiles = set()
+    for _, profiles in _iter_local_file_results(file_list, max_workers or 0, chunk_size, extractor):
+        found_profiles.update(profiles or ())
+    return found_profiles
+
+
+def _add_profiles_version_column(conn, table):
+    """Adds the ``profiles_version`` column to a ``table`` created before it existed.
+
+    Rows written without it get version 0, so they count as stale under any ``CANONICAL_FORM_VERSION``.
+    """
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if 'profiles_version' not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN profiles_version INTEGER NOT NULL DEFAULT 0")
+
+
+class _LocalScanManifest:
+    """SQLite manifest of scanned local files, used to skip unchanged files on the next run.
+
+    Each row records a file's size, mtime, content hash and the profiles extracted from it. A file whose
+    size and mtime match its row is trusted without being read. If only the mtime moved, the content hash
+    decides. Rows for files that no longer exist are dropped. Rows whose profiles were stored under another
+    ``CANONICAL_FORM_VERSION`` are stale, and their files are parsed again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+            " sha256 TEXT NOT NULL, profiles TEXT NOT NULL, profiles_version INTEGER NOT NULL DEFAULT 0)"
+        )
+        _add_profiles_version_column(self._conn, "files")
+        self._conn.commit()
+        self._pending_stats = {}
+
+    def plan(self, file_list):
+        """Splits ``file_list`` into the profiles of unchanged files and the list of files to parse."""
+        known = {
+            row[0]: row[1:]
+            for row in self._conn.execute("SELECT path, size, mtime_ns, sha256, profiles, profiles_version FROM files")
+        }
+        unchanged_profiles = {}
+        to_parse = []
+        refreshed_mtimes = []
+        stale = 0
+        for filename in file_list:
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                continue  # Vanished since the glob; treated like a deleted file
+            row = known.pop(filename, None)
+            if row is not None and row[4] != CANONICAL_FORM_VERSION:
+                stale += 1
+            elif row is not None:
+                size, mtime_ns, sha256, profiles, _ = row
+                if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                    unchanged_profiles[filename] = set(json.loads(profiles))
+                    continue
+                if stat.st_size == size and file_digest(filename) == sha256:
+                    # Touched but not edited: keep the stored profiles and remember the new mtime
+                    unchanged_profiles[filename] = set(json.loads(profiles))
+                    refreshed_mtimes.append((stat.st_mtime_ns, filename))
+                    continue
+            self._pending_stats[filename] = stat
+            to_parse.append(filename)
+
+        # Whatever is left in `known` was not matched by this run's file list, i.e. it was deleted
+        self._conn.executemany("DELETE FROM files WHERE path = ?", [(filename,) for filename in known])
+        self._conn.executemany("UPDATE files SET mtime_ns = ? WHERE path = ?", refreshed_mtimes)
+        self._conn.commit()
+        if known:
+            logger.info(f"  Dropped {len(known)} deleted files from the manifest.")
+        if stale:
+            logger.info(f"  Parsing {stale} files again whose profiles were stored in an older canonical form.")
+        return unchanged_profiles, to_parse
+
+    def record(self, filename, profiles, sha256=None):
+        """Stores the profiles extracted from ``filename`` together with the stat taken at planning time.
+
+        ``sha256`` is the file's ``file_digest`` if it was computed while parsing; otherwise the file is read
+        again to compute it.
+        """
+        stat = self._pending_stats.pop(filename)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, sha256, profiles, profiles_version)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (filename, stat.st_size, stat.st_mtime_ns, sha256 or file_digest(filename), json.dumps(sorted(profiles)),
+             CANONICAL_FORM_VERSION),
+        )
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+
+def _iter_local_files_incremental(file_list, manifest, max_workers=1, chunk_size=64, extractor='soup'):
+    """Yields ``(filename, profiles)`` for ``file_list``, parsing only the files changed since the manifest last saw them.
+
+    Unchanged files come first, with the profiles stored for them. Files that fail to parse yield ``None``
+    and are left out of the manifest so the next run retries them.
+    """
+    unchanged_profiles, to_parse = manifest.plan(file_list)
+    logger.info(f"  {len(unchanged_profiles)} files unchanged since the last run, {len(to_parse)} new or modified.")
+
+    yield from unchanged_profiles.items()
+    digests = {}  # Computed by the workers while they parse, so no file is read a second time just to hash it
+    for parsed_count, (filename, profiles) in enumerate(
+            _iter_local_file_results(to_parse, max_workers, chunk_size, extractor, digests), start=1):
+        sha256 = digests.pop(filename)
+        if profiles is not None:
+            manifest.record(filename, profiles, sha256)
+            if parsed_count % 1000 == 0:
+                manifest.commit()  # Keep progress if the run is interrupted
+        yield filename, profiles
+    manifest.commit()
+
+
+def _scan_local_files_incremental(file_list, manifest, max_workers=1, chunk_size=64, extractor='soup'):
+    """Parses only the files in ``file_list`` that changed since the manifest last saw them.
+
+    Profiles stored for unchanged files are merged into the result.
+    """
+    found_profiles = set()
+    for _, profiles in _iter_local_files_incremental(file_list, manifest, max_workers, chunk_size, extractor):
+        found_profiles.update(profiles or ())
+    return found_profiles
+
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})  # Responses worth retrying with backoff
+MAX_RETRY_AFTER_SECONDS = 60  # Longest server-requested Retry-After honoured before retrying anyway
+
+
+def _normalize_cache_key(url):
+    """Normalizes ``url`` into a response cache key.
+
+    The scheme and host are lower-cased, default ports and fragments are dropped, an empty path becomes
+    ``/`` and query parameters are sorted, so trivially different spellings of a URL share one entry.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+class _ResponseCache:
+    """On-disk cache of static responses and the profiles extracted from them, stored in SQLite.
+
+    Bodies are zlib-compressed. Only responses carrying an ``ETag`` or ``Last-Modified`` validator are
+    stored, because they are the only ones that can be revalidated with a conditional request. Once the
+    compressed bodies exceed ``max_bytes`` the least recently used entries are evicted. Entries whose
+    profiles were stored under another ``CANONICAL_FORM_VERSION`` are treated as missing, so the page is
+    fetched and parsed again and the entry replaced.
+    """
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB NOT NULL,"
+            " size INTEGER NOT NULL, profiles TEXT NOT NULL, last_used REAL NOT NULL,"
+            " profiles_version INTEGER NOT NULL DEFAULT 0)"
+        )
+        _add_profiles_version_column(self._conn, "responses")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+
+    def get(self, url):
+        """Returns the cached entry for ``url`` as a dict, or ``None``."""
+        row = self._conn.execute(
+            "SELECT key, etag, last_modified, profiles FROM responses WHERE key = ? AND profiles_version = ?",
+            (_normalize_cache_key(url), CANONICAL_FORM_VERSION),
+        ).fetchone()
+        if row is None:
+            return None
+        return {'key': row[0], 'etag': row[1], 'last_modified': row[2], 'profiles': set(json.loads(row[3]))}
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Builds the ``If-None-Match``/``If-Modified-Since`` headers that revalidate ``entry``."""
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def touch(self, entry):
+        """Marks ``entry`` as recently used after a successful revalidation."""
+        self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), entry['key']))
+        self._conn.commit()
+
+    def put(self, url, response, profiles):
+        """Stores a 200 response and its extracted profiles, then evicts down to ``max_bytes``."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        body = zlib.compress(response.content)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, etag, last_modified, body, size, profiles, last_used, profiles_version)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (_normalize_cache_key(url), etag, last_modified, body, len(body), json.dumps(sorted(profiles)), time.time(),
+             CANONICAL_FORM_VERSION),
+        )
+        self._evict()
+        self._conn.commit()
+
+    def _evict(self):
+        total_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if total_size <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total_size -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.info(f"  Evicted {len(evicted)} least recently used responses from the cache.")
+
+    def close(self):
+        self._conn.close()
+
+
+class _StaticFetchEngine:
+    """Fetches static URLs concurrently over pooled connections and extracts LinkedIn links from them.
+
+    Requests run on a thread pool through a single ``requests.Session`` so connections (and TLS sessions)
+    are reused per host. Asyncio semaphores cap the total number of requests in flight and the number per
+    host. Responses with a status in ``RETRY_STATUS_CODES`` (and connection errors) are retried with
+    exponential backoff, honouring ``Retry-After`` (up to ``MAX_RETRY_AFTER_SECONDS``) when the server sends
+    one. Parsing is handed to a separate worker pool so extraction of one page overlaps with the download of
+    the next. Its worker processes are spawned rather than forked, because forking while fetch threads hold
+    locks (the logging handler's, for one) can leave a child deadlocked.
+
+    With a ``_ResponseCache``, cached URLs are revalidated with a conditional request and a 304 reuses the
+    profiles extracted on an earlier run without downloading or parsing the page again.
+
+    ``on_result(url, profiles)`` is called on the event loop as each URL is scraped successfully, so
+    results can be written out before the whole batch finishes.
+    """
+
+    def __init__(self, headers, concurrency=8, per_host_concurrency=2, max_retries=3, backoff=0.5, timeout=15,
+                 link_extractor='soup', parse_workers=None, cache=None, on_result=None):
+        self.headers = headers
+        self.concurrency = max(1, concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.timeout = timeout
+        self.link_extractor = link_extractor
+        self.parse_workers = parse_workers  # None uses every core, 0 parses on a thread in this process
+        self.cache = cache
+        self.on_result = on_result
+
+    def _make_session(self):
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.per_host_concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _retry_delay(self, response, attempt):
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+        # Exponential backoff with jitter so parallel retries against one host don't line up
+        return self.backoff * (2 ** attempt) * (1 + random.random() / 2)
+
+    async def _fetch(self, url, request_headers=None):
+        """Returns the final response for ``url`` (possibly a non-200 one), or ``None`` if every attempt errored."""
+        loop = asyncio.get_running_loop()
+        host = urlsplit(url).netloc.lower()
+        host_limit = self._host_limits.setdefault(host, asyncio.Semaphore(self.per_host_concurrency))
+        response = None
+        for attempt in range(self.max_retries + 1):
+            # Host slot first: a request queued behind a busy host must not hold a global slot other hosts could use
+            async with host_limit, self._global_limit:
+                try:
+                    response = await loop.run_in_executor(
+                        self._fetch_executor, functools.partial(self._session.get, url, headers=request_headers, timeout=self.timeout)
+                    )
+                    if response.status_code not in RETRY_STATUS_CODES:
+                        return response
+                    reason = f"status code {response.status_code}"
+                except requests.exceptions.RequestException as e:
+                    response = None
+                    reason = f"{type(e).__name__}: {e}"
+            if attempt < self.max_retries:
+                delay = self._retry_delay(response, attempt)
+                METRICS.increment("static_fetch_retries")
+                logger.warning(f"  Retrying {url} in {delay:.1f}s after {reason} (attempt {attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+            else:
+                METRICS.increment("static_fetch_failures")
+                logger.error(f"Error accessing {url}: {reason} (giving up after {attempt + 1} attempts)")
+        return response
+
+    async def _scrape_url(self, url):
+        logger.debug(f"Requesting {url} (static)...")
+        try:
+            cached = self.cache.get(url) if self.cache else None
+            with _timed_phase("static_fetch"):
+                response = await self._fetch(url, _ResponseCache.conditional_headers(cached) if cached else None)
+            if response is None:
+                return set()
+            if response.status_code == 304 and cached is not None:
+                METRICS.increment("static_not_modified")
+                logger.debug(f"Not modified since last run: {url} (reusing {len(cached['profiles'])} cached profiles)")
+                self.cache.touch(cached)
+                return self._report(url, cached['profiles'])
+            if response.status_code != 200:
+                METRICS.increment("static_http_errors")
+                logger.warning(f"Failed to access {url}. Status code: {response.status_code}")
+                return set()
+            METRICS.increment("static_pages_fetched")
+            logger.debug(f"Successfully retrieved {url}")
+            loop = asyncio.get_running_loop()
+            with _timed_phase("static_parse"):
+                found_profiles = await loop.run_in_executor(
+                    self._parse_executor, _extract_linkedin_links, response.text, self.link_extractor
+                )
+            if self.cache:
+                self.cache.put(url, response, found_profiles)
+            return self._report(url, found_profiles)
+        except Exception as e:
+            logger.error(f"An unexpected error occurred while processing {url} ({type(e).__name__}): {e}")
+            return set()
+
+    def _report(self, url, found_profiles):
+        if self.on_result:
+            self.on_result(url, found_profiles)
+        return found_profiles
+
+    async def scrape(self, urls):
+        """Scrapes every URL in ``urls`` and returns the union of the profiles found."""
+        self._global_limit = asyncio.Semaphore(self.concurrency)
+        self._host_limits = {}
+        self._session = self._make_session()
+        self._fetch_executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        if self.parse_workers == 0:
+            self._parse_executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self._parse_executor = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                                       mp_context=multiprocessing.get_context('spawn'))
+        try:
+            results = await asyncio.gather(*(self._scrape_url(url) for url in urls))
+        finally:
+            self._fetch_executor.shutdown(wait=True)
+            self._parse_executor.shutdown(wait=True)
+            self._session.close()
+
+        found_profiles = set()
+        for url_profiles in results:  # gather() keeps input order, so the merge is deterministic
+            found_profiles.update(url_profiles)
+        return found_profiles
+
+
+def _scrape_static_urls(urls, headers, **engine_options):
+    """Runs the async static fetch engine over ``urls`` from synchronous code."""
+    if not urls:
+        return set()
+    return asyncio.run(_StaticFetchEngine(headers, **engine_options).scrape(urls))
+
+
+def _utc_timestamp():
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+class _MemoryResultSink:
+    """Keeps the profiles found in memory; the default when no output file is given.
+
+    Like the file sinks, ``add`` returns whether the profile is new and ``mark_source_done`` records a
+    finished source, but nothing outlives the run, so there is no checkpoint to resume from.
+    """
+
+    def __init__(self, path=None, resume=False):
+        self.path = path
+        self._profiles = set()
+        self._completed_sources = set()
+
+    def add(self, profile, source):
+        if profile in self._profiles:
+            METRICS.increment("duplicate_profiles")
+            return False
+        self._profiles.add(profile)
+        METRICS.increment("profiles_written")
+        return True
+
+    def mark_source_done(self, source):
+        self._completed_sources.add(source)
+        METRICS.increment("sources_completed")
+
+    def completed_sources(self):
+        return set(self._completed_sources)
+
+    def __len__(self):
+        return len(self._profiles)
+
+    def profiles(self):
+        """Returns every profile written so far, sorted."""
+        return sorted(self._profiles)
+
+    def close(self):
+        pass
+
+
+class _FileResultSink:
+    """Base for sinks that append one record per new profile to a text file.
+
+    Every record carries the profile URL, the source it was found in and a UTC timestamp. Deduplication
+    and the checkpoint live in a ``<path>.index.sqlite`` sidecar (an ``_SqliteResultSink``), so memory use
+    does not grow with the number of profiles. The file is flushed before the index is committed, so
+    every profile the index knows about is already in the file. Without ``resume`` both are started afresh.
+    With it, the records in the file are loaded into the index first, which also covers records written
+    after the index's last commit, and the checkpointed sources can be skipped.
+    """
+
+    def __init__(self, path, resume=False, commit_every=100):
+        self.path = path
+        self.index_path = f"{path}.index.sqlite"
+        self.commit_every = commit_every
+        self._uncommitted = 0
+        self._index = _SqliteResultSink(self.index_path, resume and os.path.exists(path), commit_every=0)
+        if resume and os.path.exists(path):
+            self._index.load(self._read_records())
+            self._index.commit()
+        mode = 'a' if resume else 'w'
+        self._file = open(path, mode, encoding='utf-8', newline='')
+        if self._file.tell() == 0:
+            self._write_header()
+        elif not self._ends_with_newline():
+            self._file.write('\n')  # An interrupted run may have left a partial last record
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _write_header(self):
+        pass
+
+    def add(self, profile, source):
+        """Appends ``profile`` unless the index already has it; returns whether it was new."""
+        found_at = _utc_timestamp()
+        if not self._index.add(profile, source, found_at):
+            return False
+        self._write_record(profile, source, found_at)
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self._commit()
+        return True
+
+    def _commit(self):
+        self._file.flush()
+        self._index.commit()
+        self._uncommitted = 0
+
+    def mark_source_done(self, source):
+        self._file.flush()
+        self._index.mark_source_done(source)  # Commits the profiles added so far along with the source
+        self._uncommitted = 0
+
+    def completed_sources(self):
+        return self._index.completed_sources()
+
+    def __len__(self):
+        return len(self._index)
+
+    def profiles(self):
+        """Streams every profile written so far, sorted, from the index."""
+        return self._index.profiles()
+
+    def close(self):
+        self._file.close()
+        self._index.close()
+
+
+class _JsonlResultSink(_FileResultSink):
+    """Writes one JSON object per line: ``{"profile": ..., "source": ..., "found_at": ...}``."""
+
+    def _read_records(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    yield record['profile'], record['source'], record['found_at']
+                except (ValueError, KeyError, TypeError):
+                    continue  # Blank or truncated line from an interrupted run
+
+    def _write_record(self, profile, source, found_at):
+        self._file.write(json.dumps({'profile': profile, 'source': source, 'found_at': found_at}) + '\n')
+
+
+class _CsvResultSink(_FileResultSink):
+    """Writes CSV rows with a ``profile,source,found_at`` header."""
+
+    FIELDS = ('profile', 'source', 'found_at')
+
+    def __init__(self, path, resume=False, commit_every=100):
+        self._writer = None
+        super().__init__(path, resume, commit_every)
+
+    def _read_records(self):
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                if row.get('profile') and row.get('found_at'):  # A truncated last row has no timestamp
+                    yield row['profile'], row['source'] or '', row['found_at']
+
+    def _write_header(self):
+        self._csv_writer().writerow(self.FIELDS)
+
+    def _csv_writer(self):
+        if self._writer is None:
+            self._writer = csv.writer(self._file)
+        return self._writer
+
+    def _write_record(self, profile, source, found_at):
+        self._csv_writer().writerow((profile, source, found_at))
+
+
+class _SqliteResultSink:
+    """Writes profiles to a SQLite table whose unique index on ``profile`` does the deduplication.
+
+    Completed sources are kept in a second table, which is the checkpoint for ``resume``. Without
+    ``resume`` both tables are emptied. Rows are committed with each completed source and every
+    ``commit_every`` new profiles, so an interrupted run loses at most that many; ``commit_every=0``
+    leaves the other commits to the caller (see ``_FileResultSink``, which uses this as its index).
+    """
+
+    def __init__(self, path, resume=False, commit_every=100):
+        self.path = path
+        self.commit_every = commit_every
+        self._uncommitted = 0
+        self._conn = sqlite3.connect(path)
+        # WAL makes the frequent small commits cheap while still surviving a crash of this process
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profiles (profile TEXT NOT NULL, source TEXT NOT NULL, found_at TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS profiles_profile ON profiles (profile)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completed_sources (source TEXT PRIMARY KEY, completed_at TEXT NOT NULL)"
+        )
+        if not resume:
+            self._conn.execute("DELETE FROM profiles")
+            self._conn.execute("DELETE FROM completed_sources")
+        self._conn.commit()
+        if resume:
+            logger.info(f"Resuming into {path}: {len(self)} profiles written, "
+                        f"{len(self.completed_sources())} sources completed.")
+
+    def add(self, profile, source, found_at=None):
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO profiles (profile, source, found_at) VALUES (?, ?, ?)",
+            (profile, source, found_at or _utc_timestamp()),
+        )
+        if cursor.rowcount != 1:
+            METRICS.increment("duplicate_profiles")
+            return False
+        METRICS.increment("profiles_written")
+        self._uncommitted += 1
+        if self.commit_every and self._uncommitted >= self.commit_every:
+            self.commit()
+        return True
+
+    def load(self, records):
+        """Inserts ``(profile, source, found_at)`` records written by an earlier run, skipping known profiles."""
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO profiles (profile, source, found_at) VALUES (?, ?, ?)", records
+        )
+
+    def commit(self):
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def mark_source_done(self, source):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO completed_sources (source, completed_at) VALUES (?, ?)", (source, _utc_timestamp())
+        )
+        METRICS.increment("sources_completed")
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def completed_sources(self):
+        return {row[0] for row in self._conn.execute("SELECT source FROM completed_sources")}
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def profiles(self):
+        """Streams every profile written so far, sorted, without loading them all into memory."""
+        return (row[0] for row in self._conn.execute("SELECT profile FROM profiles ORDER BY profile"))
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+
+RESULT_SINKS = {
+    'memory': _MemoryResultSink,
+    'jsonl': _JsonlResultSink,
+    'csv': _CsvResultSink,
+    'sqlite': _SqliteResultSink,
+}
+
+_RESULT_SINK_EXTENSIONS = {'.jsonl': 'jsonl', '.ndjson': 'jsonl', '.csv': 'csv', '.db': 'sqlite', '.sqlite': 'sqlite',
+                           '.sqlite3': 'sqlite'}
+
+
+def _open_result_sink(path=None, sink_format=None, resume=False):
+    """Opens the result sink for ``path``, inferring the format from its extension unless ``sink_format`` is given."""
+    if path is None:
+        return _MemoryResultSink()
+    if sink_format is None:
+        sink_format = _RESULT_SINK_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if sink_format is None:
+            raise ValueError(f"Cannot infer the output format of {path}; choose one of {', '.join(sorted(RESULT_SINKS))}")
+    try:
+        sink_class = RESULT_SINKS[sink_format]
+    except KeyError:
+        raise ValueError(f"Unknown output format '{sink_format}'; choose one of {', '.join(sorted(RESULT_SINKS))}")
+    return sink_class(path, resume)
+
+
+class _SinkCollector(set):
+    """A set of profiles that writes each new profile to ``sink`` as soon as it is added.
+
+    Handed to the Selenium scrapers in place of their own set, so profiles reach the output while a page
+    is still being worked through.
+    """
+
+    def __init__(self, sink, source):
+        super().__init__()
+        self.sink = sink
+        self.source = source
+
+    def add(self, profile):
+        if profile not in self:
+            super().add(profile)
+            self.sink.add(profile, self.source)
+
+    def update(self, *iterables):
+        for profiles in iterables:
+            for profile in list(profiles):
+                self.add(profile)
+
+
+class _QueuedSink:
+    """Stands in for the result sink in a worker thread: ``add`` queues the profile for the thread that owns it."""
+
+    def __init__(self, events):
+        self.events = events
+
+    def add(self, profile, source):
+        self.events.put(('profile', source, profile))
+
+
+def _record_source(sink, source, profiles, completed=True):
+    """Writes ``profiles`` found in ``source`` to ``sink`` and, if ``completed``, checkpoints the source."""
+    for profile in sorted(profiles):
+        sink.add(profile, source)
+    if completed:
+        sink.mark_source_done(source)
+
+
+def scrape_linkedin_profiles(local_file_pattern="saved_forum_page*.html", local_scan_workers=1, local_scan_chunk_size=64,
+                             link_extractor='soup', static_urls=(), fetch_concurrency=8, per_host_concurrency=2,
+                             parse_workers=None, http_cache_path=None, http_cache_max_mb=256,
+                             local_manifest_path=None, dynamic_batch_extraction=False, community_urls=(),
+                             browser_workers=1, attach_browser=None, dynamic_network_capture=False, har_files=(),
+                             max_triggers=None, output_path=None, output_format=None, resume=False):
     # URLs to scrape (may fail if protected)
     urls = [
         "https://community.udacity.com/c/onetenc10-general-space/" # This one is known to be dynamic
     ]
+    urls.extend(community_urls)
+    urls.extend(static_urls)
     
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     }
     
-    linkedin_profiles = set()
-    dynamic_community_url = "https://community.udacity.com/c/onetenc10-general-space/"
-    
-    # Scrape the web URLs
-    for url in urls:
-        if url == dynamic_community_url:
-            print(f"\nAttempting dynamic scrape for {url} using Selenium...")
+    # Profiles are streamed to the sink as they are found; it also does the deduplication. Sources the
+    # sink lists as completed (on a resumed run) are skipped. A community page is only checkpointed if it
+    # was scraped to the end without an error and yielded profiles (a failed login looks like an empty page),
+    # so an interrupted or empty page is retried on resume.
+    linkedin_profiles = _open_result_sink(output_path, output_format, resume)
+    try:
+        completed_sources = linkedin_profiles.completed_sources()
+
+        def pending(sources):
+            remaining = [source for source in sources if source not in completed_sources]
+            if len(remaining) < len(sources):
+                logger.info(f"  Skipping {len(sources) - len(remaining)} sources completed by an earlier run.")
+            return remaining
+
+        dynamic_community_url = "https://community.udacity.com/c/onetenc10-general-space/"
+        dynamic_urls = [dynamic_community_url, *community_urls]
+        urls = pending(urls)
+
+        if browser_workers > 1:
+            # One login, then a pool of browsers shares the community pages (and their triggers)
+            pool_urls = [url for url in urls if url in dynamic_urls]
+            if pool_urls:
+                logger.info(f"Attempting dynamic scrape of {len(pool_urls)} URLs with a pool of {browser_workers} browsers...")
+                try:
+                    _scrape_urls_with_driver_pool(
+                        pool_urls, headers["User-Agent"], browser_workers, batch_extraction=dynamic_batch_extraction,
+                        max_triggers=max_triggers, by_url=True, sink=linkedin_profiles,
+                        debugger_address=attach_browser, network_capture=dynamic_network_capture,
+                    )
+                except Exception as e:
+                    logger.error(f"Error during pooled dynamic scraping ({type(e).__name__}): {e}")
+            urls = [url for url in urls if url not in dynamic_urls]
+
+        # Scrape the web URLs
+        pending_static_urls = []
+        for url in urls:
+            if url in dynamic_urls:
+                logger.info(f"Attempting dynamic scrape for {url} using Selenium...")
+                dynamically_found_profiles = _SinkCollector(linkedin_profiles, url)
+                try:
+                    _scrape_url_dynamically_with_selenium(
+                        url, headers["User-Agent"], batch_extraction=dynamic_batch_extraction,
+                        debugger_address=attach_browser, network_capture=dynamic_network_capture,
+                        max_triggers=max_triggers, found_profiles=dynamically_found_profiles, raise_errors=True,
+                    )
+                except Exception:
+                    pass  # Logged by the scraper; the profiles found so far are kept and the page is retried on resume
+                else:
+                    if dynamically_found_profiles:
+                        linkedin_profiles.mark_source_done(url)
+            else:
+                # Static URLs are collected here and fetched together by the async engine below
+                pending_static_urls.append(url)
+
+        if pending_static_urls:
+            logger.info(f"Fetching {len(pending_static_urls)} static URLs (concurrency {fetch_concurrency}, "
+                        f"{per_host_concurrency} per host)...")
+            response_cache = None
+            if http_cache_path:
+                logger.info(f"Using HTTP response cache at {http_cache_path} (max {http_cache_max_mb} MB)")
+                response_cache = _ResponseCache(http_cache_path, http_cache_max_mb * 1024 * 1024)
             try:
-                dynamically_found_profiles = _scrape_url_dynamically_with_selenium(url, headers["User-Agent"])
-                linkedin_profiles.update(dynamically_found_profiles)
-            except Exception as e:
-                print(f"Error during dynamic scraping of {url} ({type(e).__name__}): {e}")
-        else:
-            # This block is currently not reachable as only the dynamic_community_url is in the urls list.
-            # Kept for potential future use if more static URLs are added.
+                _scrape_static_urls(
+                    pending_static_urls, headers,
+                    concurrency=fetch_concurrency,
+                    per_host_concurrency=per_host_concurrency,
+                    link_extractor=link_extractor,
+                    parse_workers=parse_workers,
+                    cache=response_cache,
+                    on_result=functools.partial(_record_source, linkedin_profiles),
+                )
+            finally:
+                if response_cache:
+                    response_cache.close()
+
+        # Recorded browser sessions (HAR files exported from the DevTools network tab)
+        for har_file in pending(list(har_files)):
+            logger.info(f"Reading recorded API responses from {har_file}...")
             try:
-                print(f"\nRequesting {url} (static)...")
-                response = requests.get(url, headers=headers, timeout=15)
-                
-                if response.status_code == 200:
-                    print(f"Successfully retrieved {url}")
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    statically_found = _extract_linkedin_links_from_soup(soup)
-                    linkedin_profiles.update(statically_found)
-                else:
-                    print(f"Failed to access {url}. Status code: {response.status_code}")
-            
-            except requests.exceptions.RequestException as e:
-                print(f"Error accessing {url}: {e}")
-            except Exception as e:
-                print(f"An unexpected error occurred while processing {url} ({type(e).__name__}): {e}")
-
-    # Now scrape local HTML files
-    file_list = glob.glob("saved_forum_page*.html")  # Adjust pattern as needed
-    print(f"\nScanning {len(file_list)} local HTML files for LinkedIn profiles...")
-    
-    for filename in file_list:
+                with open(har_file, 'r', encoding='utf-8') as f:
+                    _record_source(linkedin_profiles, har_file, _extract_profiles_from_har(json.load(f)))
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading HAR file {har_file} ({type(e).__name__}): {e}")
+
+        # Now scrape local HTML files
+        # Sorted so chunking (and output) is deterministic; a set so overlapping patterns do not scan a file twice
+        patterns = [local_file_pattern] if isinstance(local_file_pattern, str) else local_file_pattern
+        file_list = sorted({filename for pattern in patterns for filename in glob.glob(pattern)})
+        logger.info(f"Scanning {len(file_list)} local HTML files and archives for LinkedIn profiles...")
+
+        manifest = None
+        if local_manifest_path:
+            # The manifest sees every file (a missing one counts as deleted); unchanged ones cost nothing anyway
+            logger.info(f"Incremental scan using manifest {local_manifest_path}")
+            manifest = _LocalScanManifest(local_manifest_path)
+        else:
+            file_list = pending(file_list)
         try:
-            print(f"Processing {filename}")
-            with open(filename, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f, 'html.parser')
-                locally_found = _extract_linkedin_links_from_soup(soup)
-                linkedin_profiles.update(locally_found)
-        except FileNotFoundError:
-            print(f"Error: File not found {filename}")
-        except Exception as e:
-            print(f"Error processing file {filename} ({type(e).__name__}): {e}")
+            if manifest:
+                local_results = _iter_local_files_incremental(
+                    file_list, manifest, local_scan_workers, local_scan_chunk_size, link_extractor
+                )
+            else:
+                local_results = _iter_local_file_results(file_list, local_scan_workers, local_scan_chunk_size,
+                                                         link_extractor)
+            for filename, locally_found in local_results:
+                # Files that failed to parse are retried on the next resume. The manifest also yields files an
+                # earlier run already checkpointed; their profiles are in the sink, so they are not recorded again
+                if locally_found is not None and filename not in completed_sources:
+                    _record_source(linkedin_profiles, filename, locally_found)
+        finally:
+            if manifest:
+                manifest.close()
 
-    # Print summary
-    if linkedin_profiles:
-        print(f"\nFound {len(linkedin_profiles)} unique LinkedIn profiles:")
-        for profile in sorted(list(linkedin_profiles)): # Sort for consistent output
-            print(f"- {profile}")
-    else:
-        print("\nNo LinkedIn profiles found on any of the pages or files.")
-        print("Try visiting the Udacity website manually to find instructor LinkedIn profiles.")
+        # Print summary
+        if len(linkedin_profiles):
+            print(f"\nFound {len(linkedin_profiles)} unique LinkedIn profiles:")
+            for profile in linkedin_profiles.profiles(): # Sorted for consistent output
+                print(f"- {profile}")
+            if output_path:
+                print(f"\nProfiles written to {output_path}")
+        else:
+            print("\nNo LinkedIn profiles found on any of the pages or files.")
+            print("Try visiting the Udacity website manually to find instructor LinkedIn profiles.")
+    finally:
+        linkedin_profiles.close()
 
 
-def _scrape_url_dynamically_with_selenium(url, user_agent):
-    """Scrapes a single URL using Selenium to handle JavaScript-loaded content."""
-    found_profiles = set()
+# --- Batched DOM extraction and infinite-scroll pagination (see _process_triggers_batched) ---
+SCROLL_WAIT_SECONDS = 2  # How long a scroll may take to load more posts before it counts as idle
+MAX_IDLE_SCROLLS = 2  # Consecutive scrolls without new posts after which the feed is considered exhausted
+
+# Returns only the triggers added to the page since the previous call, plus the LinkedIn hrefs that came with
+# them. The first call scans the document once and installs a MutationObserver; later calls just drain what it
+# queued, so the cost of a call depends on how much is new rather than on how long the page has become.
+# Each trigger is tagged with a stable key and remembered by it, so clicking does not rescan the page either.
+# It is remembered until it is clicked or its key comes back in arguments[2], the keys Python will not click
+# (seen before, owned by another shard or already a LinkedIn link), so unmounted nodes are not kept alive.
+_COLLECT_TRIGGERS_JS = """
+var selector = arguments[0], linkSelector = arguments[1], forgetKeys = arguments[2] || [];
+var state = window.__linkedinScraper;
+if (!state || state.selector !== selector) {
+    if (state && state.observer) { state.observer.disconnect(); }
+    state = window.__linkedinScraper = {selector: selector, queue: [], links: [], byKey: {}, counter: 0};
+    var enqueue = function (node) {
+        if (node.nodeType !== 1) { return; }
+        if (node.matches(selector)) { state.queue.push(node); }
+        if (node.matches(linkSelector)) { state.links.push(node.href); }
+        Array.prototype.push.apply(state.queue, node.querySelectorAll(selector));
+        Array.prototype.forEach.call(node.querySelectorAll(linkSelector), function (a) { state.links.push(a.href); });
+    };
+    enqueue(document.body);
+    state.observer = new MutationObserver(function (mutations) {
+        mutations.forEach(function (mutation) { Array.prototype.forEach.call(mutation.addedNodes, enqueue); });
+    });
+    state.observer.observe(document.body, {childList: true, subtree: true});
+}
+forgetKeys.forEach(function (key) { delete state.byKey[key]; });
+var collected = state.queue.splice(0, state.queue.length).map(function (el) {
+    if (!el.hasAttribute('data-scraper-key')) {
+        el.setAttribute('data-scraper-key', el.getAttribute('data-user-id') || el.getAttribute('href') || ('trigger-' + state.counter++));
+    }
+    var key = el.getAttribute('data-scraper-key');
+    state.byKey[key] = el;
+    return {key: key, href: el.href || ''};
+});
+return {triggers: collected, linkedin_hrefs: state.links.splice(0, state.links.length)};
+"""
+
+# Scrolls to and clicks the trigger remembered under the given key, then forgets it. Returns false if it is gone.
+_CLICK_TRIGGER_JS = """
+var state = window.__linkedinScraper;
+var el = state && state.byKey[arguments[0]];
+if (state) { delete state.byKey[arguments[0]]; }
+if (!el || !el.isConnected) { return false; }
+el.scrollIntoView({block: 'center'});
+el.click();
+return true;
+"""
+
+# Scrolls to the bottom of the feed and waits (up to arguments[0] ms) for the observer to queue triggers. These may
+# be re-rendered posts already seen, so whether the feed actually grew is decided by key in _process_triggers_batched.
+_SCROLL_FOR_MORE_TRIGGERS_JS = """
+var timeoutMs = arguments[0], done = arguments[arguments.length - 1];
+var state = window.__linkedinScraper;
+var scroller = document.scrollingElement || document.documentElement;
+window.scrollTo(0, scroller.scrollHeight);
+var deadline = Date.now() + timeoutMs;
+(function poll() {
+    if (state && state.queue.length) { done({new_triggers: state.queue.length}); return; }
+    if (Date.now() >= deadline) { done({new_triggers: 0}); return; }
+    setTimeout(poll, 50);
+})();
+"""
+
+# Waits for the profile card, reads its LinkedIn hrefs, closes it and waits for it to disappear, all in one
+# async call. Waits are driven by a MutationObserver (plus a short poll for CSS-only changes) instead of sleeps.
+# A card that shows a close button but no LinkedIn link for arguments[4] ms is treated as having none.
+_READ_AND_CLOSE_PROFILE_CARD_JS = """
+var contentSelector = arguments[0], closeSelector = arguments[1];
+var openTimeoutMs = arguments[2], closeTimeoutMs = arguments[3], emptyCardGraceMs = arguments[4];
+var done = arguments[arguments.length - 1];
+
+function visible(selector) {
+    return Array.prototype.filter.call(document.querySelectorAll(selector), function (el) {
+        return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    });
+}
+
+function waitFor(check, timeoutMs, onDone) {
+    var value = check();
+    if (value !== null) { onDone(value); return; }
+    var finished = false;
+    function finish(result) {
+        if (finished) { return; }
+        finished = true;
+        observer.disconnect();
+        clearInterval(poll);
+        clearTimeout(timer);
+        onDone(result);
+    }
+    function recheck() { var result = check(); if (result !== null) { finish(result); } }
+    var observer = new MutationObserver(recheck);
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+    var poll = setInterval(recheck, 50);
+    var timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+
+var closeSeenAt = null, startedAt = Date.now();
+waitFor(function () {
+    var links = visible(contentSelector);
+    if (links.length) { return links.map(function (a) { return a.href; }); }
+    if (visible(closeSelector).length) {
+        closeSeenAt = closeSeenAt || Date.now();
+        if (Date.now() - closeSeenAt >= emptyCardGraceMs) { return []; }
+    }
+    return null;
+}, openTimeoutMs, function (hrefs) {
+    var openedAt = Date.now();
+    function report(closed) {
+        done({opened: hrefs !== null, hrefs: hrefs || [], closed: closed,
+              wait_ms: openedAt - startedAt, close_ms: Date.now() - openedAt});
+    }
+    var closeButtons = visible(closeSelector);
+    if (!closeButtons.length) { report(false); return; }
+    closeButtons[0].click();
+    waitFor(function () {
+        return visible(contentSelector).length || visible(closeSelector).length ? null : true;
+    }, closeTimeoutMs, function (closed) { report(closed === true); });
+});
+"""
+
+
+def _process_triggers_batched(driver, trigger_selector, card_link_selector, card_close_selector,
+                              iframe_selector=None, max_triggers=None, card_timeout=3, close_timeout=7, shard=None,
+                              scroll_wait=None, max_idle_scrolls=None, found_profiles=None):
+    """Processes profile triggers with a handful of WebDriver round-trips each, scrolling for more.
+
+    One ``execute_script`` call returns the triggers that appeared since the last call and any LinkedIn
+    hrefs that came with them. Each trigger then costs one call to scroll and click it and one async call
+    that waits for the card, reads it and closes it, plus the iframe switches when the triggers live in
+    one. When no new triggers are left the feed is scrolled, and the run ends after ``max_idle_scrolls``
+    scrolls in a row bring in no trigger with an unseen key within ``scroll_wait`` seconds (or at
+    ``max_triggers``, if given). Re-rendered posts, such as rows a virtualized list mounts again, come back
+    under keys already seen and do not keep the loop alive.
+
+    Progress is tracked by trigger key (the user's id or href) rather than by element handle, so the
+    bookkeeping stays small and each pass costs the same however long the feed gets. Triggers sharing a
+    key (the same user posting twice) are only clicked once. ``iframe_selector`` is the frame to return to
+    after each card, or ``None`` when the triggers are in the main document. With ``shard=(index, count)``
+    only every ``count``-th distinct trigger from ``index`` on is processed. Profiles are added to
+    ``found_profiles`` (a new set by default) as soon as each card is read.
+    """
+    scroll_wait = SCROLL_WAIT_SECONDS if scroll_wait is None else scroll_wait
+    max_idle_scrolls = MAX_IDLE_SCROLLS if max_idle_scrolls is None else max_idle_scrolls
+    found_profiles = set() if found_profiles is None else found_profiles
+    driver.set_script_timeout(max(card_timeout + close_timeout, scroll_wait) + 5)
+
+    seen_keys = set()
+    forget_keys = []  # Collected but never clicked; the next collect call lets the page drop their elements
+    processed_count = 0
+    idle_scrolls = 0
+    while max_triggers is None or processed_count < max_triggers:
+        batch = driver.execute_script(_COLLECT_TRIGGERS_JS, trigger_selector, "a[href*='linkedin.com/in/']", forget_keys)
+        forget_keys = []
+        for href in batch['linkedin_hrefs']:
+            _add_linkedin_href(found_profiles, href)
 
+        if not any(trigger['key'] not in seen_keys for trigger in batch['triggers']):
+            forget_keys = [trigger['key'] for trigger in batch['triggers']]
+            if idle_scrolls >= max_idle_scrolls:
+                logger.info(f"    No new triggers after {idle_scrolls} scrolls. Reached the end of the feed.")
+                break
+            driver.execute_async_script(_SCROLL_FOR_MORE_TRIGGERS_JS, int(scroll_wait * 1000))
+            idle_scrolls += 1  # Reset below once a pass turns up a trigger not seen before
+            continue
+        idle_scrolls = 0
+        logger.debug(f"    Collected {len(batch['triggers'])} new triggers ({len(seen_keys)} seen so far).")
+
+        for trigger in batch['triggers']:
+            if max_triggers is not None and processed_count >= max_triggers:
+                logger.info(f"    Reached the limit of {max_triggers} triggers.")
+                break
+            key = trigger['key']
+            if key in seen_keys:
+                forget_keys.append(key)
+                continue
+            seen_keys.add(key)
+            if shard and (len(seen_keys) - 1) % shard[1] != shard[0]:
+                forget_keys.append(key)
+                continue  # Another browser in the pool owns this trigger
+            processed_count += 1
+            if canonicalize_profile_url(trigger['href']):
+                forget_keys.append(key)
+                _add_linkedin_href(found_profiles, trigger['href'])  # The trigger itself links to LinkedIn; no card needed
+                continue
+            if not _open_and_read_profile_card(driver, key, card_link_selector, card_close_selector,
+                                               iframe_selector, card_timeout, close_timeout, found_profiles):
+                return found_profiles
+
+    return found_profiles
+
+
+def _open_and_read_profile_card(driver, key, card_link_selector, card_close_selector, iframe_selector,
+                                card_timeout, close_timeout, found_profiles):
+    """Clicks the trigger stored under ``key`` and adds the LinkedIn links on its card to ``found_profiles``.
+
+    Returns ``False`` if the iframe holding the triggers could not be re-entered afterwards.
+    """
+    try:
+        with _timed_phase("trigger_click"):
+            clicked = driver.execute_script(_CLICK_TRIGGER_JS, key)
+        if not clicked:
+            METRICS.increment("triggers_missing")
+            logger.debug(f"    Trigger '{key}' is no longer in the page. Skipping.")
+            return True
+        METRICS.increment("triggers_clicked")
+        if iframe_selector:
+            driver.switch_to.default_content()
+        card = driver.execute_async_script(
+            _READ_AND_CLOSE_PROFILE_CARD_JS, card_link_selector, card_close_selector,
+            card_timeout * 1000, close_timeout * 1000, 300,
+        )
+        # The wait and the close happen inside one script; it times both in the browser
+        METRICS.observe("modal_wait", card.get('wait_ms', 0) / 1000)
+        if not card['opened']:
+            METRICS.increment("modal_timeouts")
+            logger.debug(f"    Timed out waiting for the profile card of trigger '{key}'.")
+        else:
+            METRICS.observe("modal_close", card.get('close_ms', 0) / 1000)
+        for href in card['hrefs']:
+            _add_linkedin_href(found_profiles, href)
+        if card['opened'] and not card['closed']:
+            METRICS.increment("modals_left_open")
+            logger.warning("    Profile card might still be open, potentially interfering with next trigger.")
+    except Exception as e_trigger_processing:
+        METRICS.increment("trigger_errors")
+        logger.warning(f"    Error processing trigger '{key}' ({type(e_trigger_processing).__name__}): {e_trigger_processing}")
+        if iframe_selector:
+            driver.switch_to.default_content()
+    if iframe_selector:
+        try:
+            with _timed_phase("iframe_switch"):
+                driver.switch_to.frame(driver.find_element(By.CSS_SELECTOR, iframe_selector))
+        except Exception as e_refind_iframe:
+            logger.warning(f"      Could not re-find or switch back to iframe ('{iframe_selector}'): {e_refind_iframe}")
+            return False
+    return True
+
+
+# --- Browser startup fast path ---
+DRIVER_PATH_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "linkedin_scraper", "edgedriver.json")
+DRIVER_PATH_CACHE_TTL = 24 * 60 * 60  # Seconds a resolved driver path is trusted before asking webdriver-manager again
+BROWSER_DAEMON_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "linkedin_scraper", "edge-profile")
+
+def _resolve_edge_driver_path(cache_file=DRIVER_PATH_CACHE_FILE, ttl=DRIVER_PATH_CACHE_TTL, refresh=False):
+    """Returns the Edge driver binary path, reusing the last resolution for up to ``ttl`` seconds.
+
+    ``EdgeChromiumDriverManager().install()`` checks the installed browser and driver versions on every
+    call. The resolved path is cached in ``cache_file`` and trusted while it is fresh and still exists.
+    ``refresh=True`` ignores the cache, e.g. after Edge updated itself and the cached driver no longer matches.
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if not refresh and time.time() - cached['resolved_at'] < ttl and os.path.exists(cached['path']):
+            return cached['path']
+    except (OSError, ValueError, KeyError):
+        pass  # Missing or unreadable cache: resolve below
+
+    driver_path = EdgeChromiumDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'path': driver_path, 'resolved_at': time.time()}, f)
+    except OSError as e_cache:
+        logger.warning(f"  Could not cache the driver path in {cache_file}: {e_cache}")
+    return driver_path
+
+
+def _find_edge_binary():
+    """Locates the Edge executable, honouring the EDGE_BINARY environment variable."""
+    candidates = [
+        os.getenv("EDGE_BINARY"),
+        shutil.which("msedge"),
+        shutil.which("microsoft-edge"),
+        shutil.which("microsoft-edge-stable"),
+        r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+        r"C:\Program Files\Microsoft\Edge\Application\msedge.exe",
+        "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
+    ]
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError("Microsoft Edge was not found; set EDGE_BINARY to its executable.")
+
+
+def _start_browser_daemon(port=9222, profile_dir=BROWSER_DAEMON_PROFILE_DIR, startup_timeout=30):
+    """Launches a long-lived Edge with remote debugging enabled and returns its debugger address.
+
+    Later runs attach to it with ``--attach-browser`` instead of starting a browser of their own. The
+    dedicated profile directory keeps the Udacity login between runs.
+    """
+    address = f"127.0.0.1:{port}"
+    os.makedirs(profile_dir, exist_ok=True)
+    subprocess.Popen(
+        [_find_edge_binary(), f"--remote-debugging-port={port}", f"--user-data-dir={profile_dir}",
+         "--no-first-run", "--no-default-browser-check"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"http://{address}/json/version", timeout=1).ok:
+                return address
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.25)
+    raise TimeoutError(f"Edge did not open its debugging port at {address} within {startup_timeout}s.")
+
+
+# YOU MUST INSPECT THE NETWORK TAB OF THE LIVE PAGE TO FIND THE API THAT RETURNS USER PROFILES.
+# Network capture only reads JSON responses whose URL matches this pattern. EXAMPLE - UPDATE THIS
+NETWORK_PROFILE_API_PATTERN = r"/(api|graphql)/.*(user|profile|member|post)s?"
+
+
+def _iter_captured_json_responses(performance_log, url_pattern=NETWORK_PROFILE_API_PATTERN, unfinished=None):
+    """Yields ``(request_id, url)`` for finished JSON responses in a Chromium performance log.
+
+    ``performance_log`` is the list returned by ``driver.get_log('performance')``. Each entry's
+    ``message`` holds a JSON-encoded DevTools event. Only requests that have finished loading are
+    yielded, because their bodies cannot be fetched before that. Matching responses still loading are
+    left in the ``unfinished`` dict (request id to URL), so a later call with the next drain of the log
+    picks them up once their ``loadingFinished`` event arrives.
+    """
+    responses = {} if unfinished is None else unfinished
+    finished = set()
+    for entry in performance_log:
+        try:
+            event = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        params = event.get('params', {})
+        if event.get('method') == 'Network.responseReceived':
+            response = params.get('response', {})
+            if 'json' in response.get('mimeType', '').lower() and re.search(url_pattern, response.get('url', '')):
+                responses[params['requestId']] = response['url']
+        elif event.get('method') == 'Network.loadingFinished':
+            finished.add(params.get('requestId'))
+        elif event.get('method') == 'Network.loadingFailed':
+            responses.pop(params.get('requestId'), None)
+    for request_id in [request_id for request_id in responses if request_id in finished]:
+        yield request_id, responses.pop(request_id)
+
+
+def _harvest_profiles_from_network_log(driver, found_profiles, unfinished=None, url_pattern=NETWORK_PROFILE_API_PATTERN):
+    """Reads the profile API responses the page has fetched and adds the LinkedIn URLs in them to ``found_profiles``.
+
+    Needs a driver started with performance logging (``_make_edge_options(..., network_capture=True)``).
+    Each call drains the browser's log, so repeated calls only see responses that arrived in between;
+    pass the same ``unfinished`` dict to every call so responses still loading at one drain are read at
+    the next. Returns the number of responses read.
+    """
+    captured = 0
+    for request_id, response_url in _iter_captured_json_responses(driver.get_log('performance'), url_pattern, unfinished):
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except Exception as e_body:
+            logger.warning(f"    Could not read captured response {response_url} ({type(e_body).__name__}): {e_body}")
+            continue
+        captured += 1
+        text = body.get('body', '')
+        if body.get('base64Encoded'):
+            text = base64.b64decode(text).decode('utf-8', errors='replace')
+        found_profiles.update(_extract_linkedin_links_from_json_text(text))
+    return captured
+
+
+# Clears the page's resource timings, scrolls to the bottom of the feed and waits (up to arguments[0] ms) for
+# the page to finish loading anything new, which on an infinite-scroll feed is the next page of posts.
+_SCROLL_FOR_MORE_RESPONSES_JS = """
+var timeoutMs = arguments[0], done = arguments[arguments.length - 1];
+performance.clearResourceTimings();  // Also keeps the timing buffer from filling up on long feeds
+var scroller = document.scrollingElement || document.documentElement;
+window.scrollTo(0, scroller.scrollHeight);
+var deadline = Date.now() + timeoutMs;
+(function poll() {
+    var loaded = performance.getEntriesByType('resource').length;
+    if (loaded) { done({new_requests: loaded}); return; }
+    if (Date.now() >= deadline) { done({new_requests: 0}); return; }
+    setTimeout(poll, 50);
+})();
+"""
+
+
+def _harvest_profiles_while_scrolling(driver, found_profiles, url_pattern=NETWORK_PROFILE_API_PATTERN,
+                                      scroll_wait=None, max_idle_scrolls=None):
+    """Network capture over a whole infinite-scroll feed: harvests the log, scrolls, and harvests again.
+
+    The feed only requests its next page of posts when scrolled, so one drain of the log right after login
+    sees the first page alone. The run ends once ``max_idle_scrolls`` scrolls in a row bring in no new
+    profile API responses. Returns the number of responses read.
+    """
+    scroll_wait = SCROLL_WAIT_SECONDS if scroll_wait is None else scroll_wait
+    max_idle_scrolls = MAX_IDLE_SCROLLS if max_idle_scrolls is None else max_idle_scrolls
+    driver.set_script_timeout(scroll_wait + 5)
+    unfinished = {}
+    captured = _harvest_profiles_from_network_log(driver, found_profiles, unfinished, url_pattern)
+
+    iframe_found = _switch_to_community_iframe(driver)  # Scrolling has to happen in the document holding the feed
+    scrolls = idle_scrolls = 0
+    try:
+        while idle_scrolls < max_idle_scrolls:
+            driver.execute_async_script(_SCROLL_FOR_MORE_RESPONSES_JS, int(scroll_wait * 1000))
+            scrolls += 1
+            new_responses = _harvest_profiles_from_network_log(driver, found_profiles, unfinished, url_pattern)
+            captured += new_responses
+            idle_scrolls = 0 if new_responses else idle_scrolls + 1
+            logger.debug(f"    Scroll {scrolls}: {new_responses} new API responses ({len(found_profiles)} profiles so far).")
+    finally:
+        if iframe_found:
+            driver.switch_to.default_content()
+    logger.info(f"    Read {captured} captured API responses over {scrolls} scrolls, "
+                f"found {len(found_profiles)} LinkedIn profiles.")
+    return captured
+
+
+def _make_edge_options(user_agent, headless=False, debugger_address=None, network_capture=False):
+    """Builds the ``EdgeOptions`` shared by every browser the scraper starts.
+
+    With ``debugger_address`` the options attach to an already running browser (see
+    ``_start_browser_daemon``). Launch arguments do not apply to a running browser, so none are set.
+    ``network_capture`` turns on the DevTools performance log that ``_harvest_profiles_from_network_log`` reads.
+    """
     options = webdriver.EdgeOptions()  # Use EdgeOptions
+    if network_capture:
+        options.set_capability('ms:loggingPrefs', {'performance': 'ALL'})
+    if debugger_address:
+        options.add_experimental_option('debuggerAddress', debugger_address)
+        return options
     options.add_argument(f"user-agent={user_agent}")
-    # options.add_argument('--headless')  # Uncomment to run Edge in the background
-    # options.add_argument('--disable-gpu') # Often recommended with headless
+    if headless:
+        options.add_argument('--headless=new')  # Run Edge in the background
+        options.add_argument('--disable-gpu') # Often recommended with headless
     options.add_argument("--log-level=3")  # Suppress console logs from WebDriver
     options.add_experimental_option('excludeSwitches', ['enable-logging']) # Suppress DevTools listening message
+    return options
 
-    # --- Credentials for Login (fetch from environment variables) ---
-    # udacity_email = os.getenv("UDACITY_EMAIL") # No longer needed for automated login
-    # udacity_password = os.getenv("UDACITY_PASSWORD") # No longer needed for automated login
-    logged_in = False
-    login_element_to_check_staleness = None # To store the element we expect to disappear after login
 
-    driver = None # Initialize driver to None for the finally block
+def _prompt_for_manual_login(url):
+    """Blocks until the user confirms they have logged in and opened ``url`` in the browser."""
+    print("\n" + "="*50)
+    print("  MANUAL LOGIN REQUIRED")
+    print("  Please log in to Udacity in the opened browser window and navigate to:")
+    print(f"  {url}")
+    print("  Once you are on the correct page and it has fully loaded,")
+    input("  press Enter in this console window to continue scraping...")
+    print("="*50 + "\n")
+
+
+def _create_edge_driver(options):
+    """Starts (or attaches to) a local Edge browser, timing driver resolution and browser launch separately."""
+    with _timed_phase("driver_resolve"):
+        driver_path = _resolve_edge_driver_path()
+    with _timed_phase("browser_launch"):
+        try:
+            return webdriver.Edge(service=EdgeService(driver_path), options=options)  # Use Edge with the cached driver binary
+        except WebDriverException as e_launch:
+            # Usually a cached driver left behind by an Edge auto-update; resolve again once before giving up
+            logger.warning(f"  Edge failed to start with driver {driver_path} ({type(e_launch).__name__}); "
+                           f"resolving the driver again.")
+    with _timed_phase("driver_resolve"):
+        driver_path = _resolve_edge_driver_path(refresh=True)
+    with _timed_phase("browser_launch"):
+        return webdriver.Edge(service=EdgeService(driver_path), options=options)
+
+
+# YOU MUST INSPECT THE PAGE TO FIND THE SELECTOR FOR THE IFRAME
+# This is a placeholder selector for the iframe that might contain the community content
+COMMUNITY_CONTENT_IFRAME_SELECTOR = "iframe[src*='inner.html']" # EXAMPLE - UPDATE THIS
+
+
+def _switch_to_community_iframe(driver, iframe_selector=COMMUNITY_CONTENT_IFRAME_SELECTOR):
+    """Switches into the iframe holding the community content, if the page has one. Returns whether it did."""
     try:
-        print(f"  Initializing WebDriver for {url}...")
-        driver = webdriver.Edge(service=EdgeService(EdgeChromiumDriverManager().install()), options=options)  # Use Edge and EdgeChromiumDriverManager
+        logger.debug(f"  Checking for community content iframe (selector: '{iframe_selector}')...")
+        iframe_element = WebDriverWait(driver, 10).until(
+             EC.presence_of_element_located((By.CSS_SELECTOR, iframe_selector))
+        )
+        with _timed_phase("iframe_switch"):
+            driver.switch_to.frame(iframe_element)
+        logger.info("  Switched to community content iframe.")
+        return True
+    except (TimeoutException, NoSuchElementException):
+        logger.info(f"  Community content iframe ('{iframe_selector}') not found. Assuming content is in the main document.")
+    except Exception as e_iframe:
+         logger.warning(f"  Error switching to iframe ({type(e_iframe).__name__}): {e_iframe}")
+         # Decide whether to raise or continue assuming no iframe
+         # For now, we'll continue assuming no iframe if an error occurs
+    return False
 
-        # Maximize window, as some sites behave differently with smaller viewports
-        print("  Maximizing browser window...")
-        driver.maximize_window()
 
-        # Clear cookies for a fresh session before the first navigation
-        print("  Clearing cookies for a fresh session...")
-        driver.delete_all_cookies()
+def _extract_profiles_from_loaded_page(driver, batch_extraction=False, trigger_shard=None, logged_in=True,
+                                       max_triggers=None, found_profiles=None):
+    """Extracts LinkedIn profiles from the community page currently loaded (and logged in) in ``driver``.
 
-        print(f"\n  Opening browser to: {url}")
-        driver.get(url)
+    Batched extraction scrolls through the whole feed unless ``max_triggers`` caps it; the per-trigger
+    loop stops at ``max_triggers`` or 50 triggers.
 
-        # --- Manual Login Pause ---
-        print("\n" + "="*50)
-        print("  MANUAL LOGIN REQUIRED")
-        print("  Please log in to Udacity in the opened browser window and navigate to:")
-        print(f"  {url}")
-        print("  Once you are on the correct page and it has fully loaded,")
-        input("  press Enter in this console window to continue scraping...")
-        print("="*50 + "\n")
-
-        print(f"  Resuming script. Current URL: {driver.current_url}")
-        # Assume login was successful if the user proceeds.
-        # You might want to add a check here for a known element on the target page
-        # to be more certain (e.g., WebDriverWait for known_element_on_target_page_selector), but for manual mode, this is often sufficient.
-        logged_in = True
+    ``trigger_shard`` is an ``(index, count)`` pair that restricts batched extraction to every ``count``-th
+    trigger starting at ``index``, so several browsers can split one page between them.
 
+    Profiles are added to ``found_profiles`` as they are found, so a ``_SinkCollector`` passed in streams
+    them to the output while the page is still being worked through.
+    """
+    found_profiles = set() if found_profiles is None else found_profiles
 
-        # --- Attempt to switch to iframe if one is detected ---
-        # YOU MUST INSPECT THE PAGE TO FIND THE SELECTOR FOR THE IFRAME
-        # This is a placeholder selector for the iframe that might contain the community content
-        community_content_iframe_selector = "iframe[src*='inner.html']" # EXAMPLE - UPDATE THIS
+    # --- Attempt to switch to iframe if one is detected ---
+    community_content_iframe_selector = COMMUNITY_CONTENT_IFRAME_SELECTOR
+    iframe_found = _switch_to_community_iframe(driver, community_content_iframe_selector)
 
-        iframe_found = False
-        try:
-            print(f"  Checking for community content iframe (selector: '{community_content_iframe_selector}')...")
-            iframe_element = WebDriverWait(driver, 10).until(
-                 EC.presence_of_element_located((By.CSS_SELECTOR, community_content_iframe_selector))
-            )
-            driver.switch_to.frame(iframe_element)
-            print("  Switched to community content iframe.")
-            iframe_found = True
-        except (TimeoutException, NoSuchElementException):
-            print(f"  Community content iframe ('{community_content_iframe_selector}') not found. Assuming content is in the main document.")
-        except Exception as e_iframe:
-             print(f"  Error switching to iframe ({type(e_iframe).__name__}): {e_iframe}")
-             # Decide whether to raise or continue assuming no iframe
-             # For now, we'll continue assuming no iframe if an error occurs
-
-
-        # NOTE: The user_profile_trigger_selector below was very specific (targets div:nth-child(1) and long parent chain).
-        # If you want to scrape multiple profiles, or if the 1st item isn't always present/relevant,
-        # you will need a more general selector.
-        # Ensure this selector is correct for the content *inside* the iframe if one is used.
-        # YOU MUST INSPECT THE LIVE PAGE TO FIND A RELIABLE, MORE GENERAL SELECTOR that works for ALL profile entries (with or without images).
-        # Example: Target the clickable link (<a>) or a common container div.
-        user_profile_trigger_selector = "div.post--list__user a" # EXAMPLE: Targets the link (<a>) within a specific div class. Adjust as needed.
-        # Ensure this selector is correct for the profile card content.
-        # Profile cards often appear in the main document, even if triggered from an iframe.
-        # YOU MUST INSPECT THE LIVE PAGE TO FIND A RELIABLE SELECTOR FOR THE LINKEDIN LINK IN THE PROFILE CARD.
-        # Example: Find a class name on the LinkedIn link or a container around it, or an aria-label.
-        # Let's try a more general approach for the LinkedIn link within a modal.
-        profile_card_content_selector = "div[role='dialog'] a[href*='linkedin.com/in/'], div[class*='modal'] a[href*='linkedin.com/in/']" # EXAMPLE: More general for modals. Adjust.
-        
-        # YOU MUST INSPECT THE LIVE PAGE TO FIND A RELIABLE, MORE FLEXIBLE CSS SELECTOR FOR THE PROFILE CARD'S CLOSE/BACK BUTTON.
-        # The fallback selector was working, so let's make that the primary.
-        # You should still inspect and refine this based on the actual modal structure.
-        profile_card_close_button_selector = "div[role='dialog'] button[aria-label*='lose'], div[class*='modal'] button[aria-label*='lose']" # Primary, based on working fallback. Adjust.
 
-        print(f"  Waiting for profile triggers (selector: '{user_profile_trigger_selector}')...")
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, user_profile_trigger_selector))
-            )
-        except (TimeoutException, NoSuchElementException) as e_wait_trigger: # Catch specific exceptions for clarity
-            print(f"    Could not find profile triggers (selector: '{user_profile_trigger_selector}'). Page content might be different than expected or login failed.")
-            # More specific error printing for TimeoutException
-            error_message = e_wait_trigger.msg if isinstance(e_wait_trigger, TimeoutException) and hasattr(e_wait_trigger, 'msg') else str(e_wait_trigger)
-            print(f"    Error type: {type(e_wait_trigger).__name__}, Message: {error_message}")
-            # In manual mode, logged_in is True after the pause
-            if logged_in:
-                print("    Manual login was assumed successful, but triggers not found on the current page.")
-            # The 'login_flow_initiated' and 'else' conditions are not relevant for the manual login path.
-            # else: print("    Login not attempted or failed early, triggers not found.") # This was the original else
-            raise
+    # NOTE: The user_profile_trigger_selector below was very specific (targets div:nth-child(1) and long parent chain).
+    # If you want to scrape multiple profiles, or if the 1st item isn't always present/relevant,
+    # you will need a more general selector.
+    # Ensure this selector is correct for the content *inside* the iframe if one is used.
+    # YOU MUST INSPECT THE LIVE PAGE TO FIND A RELIABLE, MORE GENERAL SELECTOR that works for ALL profile entries (with or without images).
+    # Example: Target the clickable link (<a>) or a common container div.
+    user_profile_trigger_selector = "div.post--list__user a" # EXAMPLE: Targets the link (<a>) within a specific div class. Adjust as needed.
+    # Ensure this selector is correct for the profile card content.
+    # Profile cards often appear in the main document, even if triggered from an iframe.
+    # YOU MUST INSPECT THE LIVE PAGE TO FIND A RELIABLE SELECTOR FOR THE LINKEDIN LINK IN THE PROFILE CARD.
+    # Example: Find a class name on the LinkedIn link or a container around it, or an aria-label.
+    # Let's try a more general approach for the LinkedIn link within a modal.
+    profile_card_content_selector = "div[role='dialog'] a[href*='linkedin.com/in/'], div[class*='modal'] a[href*='linkedin.com/in/']" # EXAMPLE: More general for modals. Adjust.
+    
+    # YOU MUST INSPECT THE LIVE PAGE TO FIND A RELIABLE, MORE FLEXIBLE CSS SELECTOR FOR THE PROFILE CARD'S CLOSE/BACK BUTTON.
+    # The fallback selector was working, so let's make that the primary.
+    # You should still inspect and refine this based on the actual modal structure.
+    profile_card_close_button_selector = "div[role='dialog'] button[aria-label*='lose'], div[class*='modal'] button[aria-label*='lose']" # Primary, based on working fallback. Adjust.
+
+    logger.info(f"  Waiting for profile triggers (selector: '{user_profile_trigger_selector}')...")
+    try:
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, user_profile_trigger_selector))
+        )
+    except (TimeoutException, NoSuchElementException) as e_wait_trigger: # Catch specific exceptions for clarity
+        logger.error(f"    Could not find profile triggers (selector: '{user_profile_trigger_selector}'). Page content might be different than expected or login failed.")
+        # More specific error printing for TimeoutException
+        error_message = e_wait_trigger.msg if isinstance(e_wait_trigger, TimeoutException) and hasattr(e_wait_trigger, 'msg') else str(e_wait_trigger)
+        logger.error(f"    Error type: {type(e_wait_trigger).__name__}, Message: {error_message}")
+        # In manual mode, logged_in is True after the pause
+        if logged_in:
+            logger.error("    Manual login was assumed successful, but triggers not found on the current page.")
+        # The 'login_flow_initiated' and 'else' conditions are not relevant for the manual login path.
+        # else: print("    Login not attempted or failed early, triggers not found.") # This was the original else
+        raise
+
+    if batch_extraction:
+        logger.info("  Using batched DOM extraction.")
+        found_profiles.update(_process_triggers_batched(
+            driver, user_profile_trigger_selector, profile_card_content_selector,
+            profile_card_close_button_selector,
+            iframe_selector=community_content_iframe_selector if iframe_found else None,
+            shard=trigger_shard,
+            max_triggers=max_triggers,
+            found_profiles=found_profiles,
+        ))
+        return found_profiles
+
+    profile_triggers = driver.find_elements(By.CSS_SELECTOR, user_profile_trigger_selector)
+    logger.info(f"  Found {len(profile_triggers)} potential profile triggers.")
+
+    # It's often safer to iterate by index if the DOM might change,
+    # but we need to be careful about the list length if elements disappear.
+    # We'll re-fetch the list of triggers in each iteration to handle DOM changes.
+    num_initial_triggers = len(profile_triggers)
+    processed_trigger_elements = set() # Keep track of elements we've already tried to click
+    MAX_TRIGGERS_TO_PROCESS = max_triggers or 50 # Safety limit for infinite scroll
+
+    if num_initial_triggers == 0:
+        logger.info("  No profile triggers found to process.")
+
+    # Loop as long as there are triggers, up to a max limit
+    current_trigger_index = 0
+    while current_trigger_index < MAX_TRIGGERS_TO_PROCESS:
+        logger.debug(f"  Attempting to process trigger (current pass: {current_trigger_index + 1}).")
+        # Add a small delay before re-finding, allowing DOM to settle after modal closure from previous iteration
+        if current_trigger_index > 0: # No need to sleep before the first iteration
+            logger.debug("    Pausing briefly for page to settle before finding next trigger...")
+            time.sleep(0.75) # Slightly increased delay
 
-        profile_triggers = driver.find_elements(By.CSS_SELECTOR, user_profile_trigger_selector)
-        print(f"  Found {len(profile_triggers)} potential profile triggers.")
-
-        # It's often safer to iterate by index if the DOM might change,
-        # but we need to be careful about the list length if elements disappear.
-        # We'll re-fetch the list of triggers in each iteration to handle DOM changes.
-        num_initial_triggers = len(profile_triggers)
-        processed_trigger_elements = set() # Keep track of elements we've already tried to click
-        MAX_TRIGGERS_TO_PROCESS = 50 # Safety limit for infinite scroll
-
-        if num_initial_triggers == 0:
-            print("  No profile triggers found to process.")
-
-        # Loop as long as there are triggers, up to a max limit
-        current_trigger_index = 0
-        while current_trigger_index < MAX_TRIGGERS_TO_PROCESS:
-            print(f"\n  Attempting to process trigger (current pass: {current_trigger_index + 1}).")
-            # Add a small delay before re-finding, allowing DOM to settle after modal closure from previous iteration
-            if current_trigger_index > 0: # No need to sleep before the first iteration
-                print("    Pausing briefly for page to settle before finding next trigger...")
-                time.sleep(0.75) # Slightly increased delay
-
-            # Re-find all triggers in each iteration as the DOM might have changed
-            current_triggers = driver.find_elements(By.CSS_SELECTOR, user_profile_trigger_selector)
-            print(f"    Re-found {len(current_triggers)} triggers on the page using selector: '{user_profile_trigger_selector}'")
-
-            # Find the next unprocessed trigger
-            trigger_to_process = None
-            for t in current_triggers:
-                if t not in processed_trigger_elements:
-                    trigger_to_process = t
-                    break
-            
-            if not trigger_to_process:
-                print("    No new, unprocessed triggers found. Assuming all available triggers processed.")
+        # Re-find all triggers in each iteration as the DOM might have changed
+        current_triggers = driver.find_elements(By.CSS_SELECTOR, user_profile_trigger_selector)
+        logger.debug(f"    Re-found {len(current_triggers)} triggers on the page using selector: '{user_profile_trigger_selector}'")
+
+        # Find the next unprocessed trigger
+        trigger_to_process = None
+        for t in current_triggers:
+            if t not in processed_trigger_elements:
+                trigger_to_process = t
                 break
+        
+        if not trigger_to_process:
+            logger.debug("    No new, unprocessed triggers found. Assuming all available triggers processed.")
+            break
 
-            trigger = trigger_to_process
-            processed_trigger_elements.add(trigger) # Mark as processed (or attempted)
+        trigger = trigger_to_process
+        processed_trigger_elements.add(trigger) # Mark as processed (or attempted)
 
-            try:
-                print(f"    Processing trigger (element: {trigger.tag_name}, location: {trigger.location}).")
+        try:
+            if logger.isEnabledFor(logging.DEBUG):  # tag_name and location are a WebDriver round-trip each
+                logger.debug(f"    Processing trigger (element: {trigger.tag_name}, location: {trigger.location}).")
 
+            with _timed_phase("trigger_click"):
                 # Scroll to the trigger
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", trigger)
                 # Wait for the element to be clickable after scrolling
@@ -252,121 +1925,394 @@ def _scrape_url_dynamically_with_selenium(url, user_agent):
                 # Small pause can sometimes still be beneficial after ensuring clickability if animations are involved
                 # time.sleep(0.2) # Optional: very short pause if needed
                 trigger.click() # Click happens in the current context (main doc or iframe)
+            METRICS.increment("triggers_clicked")
 
-                # If the trigger was clicked within an iframe, and the profile card
-                # (modal) appears in the main document, switch back to default content.
-                # This 'iframe_found' refers to whether an iframe was detected and switched into earlier.
-                if iframe_found:  # If an iframe was active for finding triggers
-                    print("    Trigger was in iframe. Switching to default content to find profile card.")
-                    driver.switch_to.default_content()
+            # If the trigger was clicked within an iframe, and the profile card
+            # (modal) appears in the main document, switch back to default content.
+            # This 'iframe_found' refers to whether an iframe was detected and switched into earlier.
+            if iframe_found:  # If an iframe was active for finding triggers
+                logger.debug("    Trigger was in iframe. Switching to default content to find profile card.")
+                driver.switch_to.default_content()
 
-                # Now, in the default content (or if we were already there), look for the LinkedIn link.
-                # The profile_card_content_selector should ideally be specific to the <a> tag of the LinkedIn link.
-                try:
-                    print(f"    Waiting for LinkedIn link in profile card (selector: '{profile_card_content_selector}')...")
+            # Now, in the default content (or if we were already there), look for the LinkedIn link.
+            # The profile_card_content_selector should ideally be specific to the <a> tag of the LinkedIn link.
+            try:
+                logger.debug(f"    Waiting for LinkedIn link in profile card (selector: '{profile_card_content_selector}')...")
+                with _timed_phase("modal_wait"):
                     linkedin_link_webelement = WebDriverWait(driver, 3).until( # Reduced timeout to 3 seconds
                         EC.visibility_of_element_located((By.CSS_SELECTOR, profile_card_content_selector))
                     )
-                    # Attempt to get the href directly from the found element
-                    href = linkedin_link_webelement.get_attribute('href')
-                    if href and 'linkedin.com/in/' in href.lower():
-                        # Basic normalization
-                        profile_url = href.split('?')[0]
-                        if profile_url.endswith('/'):
-                            profile_url = profile_url[:-1]
-                        found_profiles.add(profile_url)
-                        print(f"    Found LinkedIn profile directly from element: {profile_url}")
-                    else:
-                        # If the selector found an element, but it wasn't a direct LinkedIn <a> tag or href was missing/wrong,
-                        # try parsing the element's HTML content.
-                        print(f"    Selector '{profile_card_content_selector}' found, but not a direct LinkedIn link via attributes. Falling back to parsing its content.")
-                        # Fall through to BeautifulSoup parsing of this specific element's source.
-                        page_source_of_card_element = linkedin_link_webelement.get_attribute('outerHTML')
-                        if page_source_of_card_element:
-                            soup = BeautifulSoup(page_source_of_card_element, 'html.parser')
-                            newly_found = _extract_linkedin_links_from_soup(soup)
-                            if newly_found:
-                                found_profiles.update(newly_found)
-                                print(f"    Found {len(newly_found)} profiles by parsing element's outerHTML.")
-                            else:
-                                print("    No LinkedIn profiles found by parsing element's outerHTML.")
-                        else: # Fallback to whole page if outerHTML is not available or empty
-                            print(f"    Could not get outerHTML for '{profile_card_content_selector}'. Parsing whole page.")
-                            page_source_after_click = driver.page_source
-                            soup = BeautifulSoup(page_source_after_click, 'html.parser')
-                            newly_found = _extract_linkedin_links_from_soup(soup)
-                            if newly_found:
-                                found_profiles.update(newly_found)
-                                print(f"    Found {len(newly_found)} profiles by parsing whole page.")
-                            else:
-                                print("    No LinkedIn profiles found by parsing whole page.")
-
-                except TimeoutException:
-                    print(f"    Timed out waiting for specific LinkedIn link ('{profile_card_content_selector}').")
-                    print(f"    Attempting to parse entire current page source for LinkedIn links as a fallback.")
-                    page_source_after_click = driver.page_source
-                    soup = BeautifulSoup(page_source_after_click, 'html.parser')
-                    newly_found = _extract_linkedin_links_from_soup(soup)
-                    found_profiles.update(newly_found)
-
-                # --- Close the profile card ---
-                try:
-                    # Small pause to ensure modal is fully rendered before looking for close button
-                    time.sleep(0.5) 
-                    print(f"    Attempting to close profile card (selector: '{profile_card_close_button_selector}')...")
+                # Attempt to get the href directly from the found element
+                href = linkedin_link_webelement.get_attribute('href')
+                profile_url = canonicalize_profile_url(href)
+                if profile_url:
+                    found_profiles.add(profile_url)
+                    logger.debug(f"    Found LinkedIn profile directly from element: {profile_url}")
+                else:
+                    # If the selector found an element, but it wasn't a direct LinkedIn <a> tag or href was missing/wrong,
+                    # try parsing the element's HTML content.
+                    logger.debug(f"    Selector '{profile_card_content_selector}' found, but not a direct LinkedIn link via attributes. Falling back to parsing its content.")
+                    # Fall through to BeautifulSoup parsing of this specific element's source.
+                    page_source_of_card_element = linkedin_link_webelement.get_attribute('outerHTML')
+                    if page_source_of_card_element:
+                        soup = BeautifulSoup(page_source_of_card_element, 'html.parser')
+                        newly_found = _extract_linkedin_links_from_soup(soup)
+                        if newly_found:
+                            found_profiles.update(newly_found)
+                            logger.debug(f"    Found {len(newly_found)} profiles by parsing element's outerHTML.")
+                        else:
+                            logger.debug("    No LinkedIn profiles found by parsing element's outerHTML.")
+                    else: # Fallback to whole page if outerHTML is not available or empty
+                        logger.debug(f"    Could not get outerHTML for '{profile_card_content_selector}'. Parsing whole page.")
+                        page_source_after_click = driver.page_source
+                        soup = BeautifulSoup(page_source_after_click, 'html.parser')
+                        newly_found = _extract_linkedin_links_from_soup(soup)
+                        if newly_found:
+                            found_profiles.update(newly_found)
+                            logger.debug(f"    Found {len(newly_found)} profiles by parsing whole page.")
+                        else:
+                            logger.debug("    No LinkedIn profiles found by parsing whole page.")
+
+            except TimeoutException:
+                METRICS.increment("modal_timeouts")
+                logger.debug(f"    Timed out waiting for specific LinkedIn link ('{profile_card_content_selector}').")
+                logger.debug(f"    Attempting to parse entire current page source for LinkedIn links as a fallback.")
+                page_source_after_click = driver.page_source
+                soup = BeautifulSoup(page_source_after_click, 'html.parser')
+                newly_found = _extract_linkedin_links_from_soup(soup)
+                found_profiles.update(newly_found)
+
+            # --- Close the profile card ---
+            try:
+                # Small pause to ensure modal is fully rendered before looking for close button
+                time.sleep(0.5) 
+                logger.debug(f"    Attempting to close profile card (selector: '{profile_card_close_button_selector}')...")
+                with _timed_phase("modal_close"):
                     # Wait for the close button to be visible and clickable
                     close_button = WebDriverWait(driver, 7).until( # Increased wait time slightly
                         EC.element_to_be_clickable((By.CSS_SELECTOR, profile_card_close_button_selector))
                     )
                     close_button.click()
-                    print("    Profile card close button clicked.")
+                    logger.debug("    Profile card close button clicked.")
                     # Wait for the profile card element to disappear
                     WebDriverWait(driver, 7).until( # Increased wait time slightly
                         EC.invisibility_of_element_located((By.CSS_SELECTOR, profile_card_content_selector)) # Wait for the profile card content to be invisible
                     )
-                    print("    Profile card is now invisible.")
-                except (TimeoutException, NoSuchElementException) as e_close:
-                    print(f"    Could not find or click profile card close button ('{profile_card_close_button_selector}') or wait for card to disappear: {e_close}")
-                    # If the primary close fails, we might be stuck. 
-                    # Consider if a more aggressive "escape" is needed, e.g., driver.refresh() or sending ESC key,
-                    # but this can be risky. For now, we'll just log and continue.
-                    print("    WARNING: Profile card might still be open, potentially interfering with next trigger.")
-
-
-                # If triggers were originally found in an iframe, attempt to switch back for the next trigger.
-                if iframe_found:
-                    print("    Attempting to switch back into iframe for next trigger (if any).")
-                    try:
-                        # Re-locate the iframe before switching. This is safer.
+                logger.debug("    Profile card is now invisible.")
+            except (TimeoutException, NoSuchElementException) as e_close:
+                logger.warning(f"    Could not find or click profile card close button ('{profile_card_close_button_selector}') or wait for card to disappear: {e_close}")
+                # If the primary close fails, we might be stuck. 
+                # Consider if a more aggressive "escape" is needed, e.g., driver.refresh() or sending ESC key,
+                # but this can be risky. For now, we'll just log and continue.
+                METRICS.increment("modals_left_open")
+                logger.warning("    Profile card might still be open, potentially interfering with next trigger.")
+
+
+            # If triggers were originally found in an iframe, attempt to switch back for the next trigger.
+            if iframe_found:
+                logger.debug("    Attempting to switch back into iframe for next trigger (if any).")
+                try:
+                    # Re-locate the iframe before switching. This is safer.
+                    with _timed_phase("iframe_switch"):
                         iframe_element_for_next_trigger = driver.find_element(By.CSS_SELECTOR, community_content_iframe_selector)
                         driver.switch_to.frame(iframe_element_for_next_trigger)
-                    except Exception as e_refind_iframe:
-                        print(f"      Could not re-find or switch back to iframe ('{community_content_iframe_selector}'): {e_refind_iframe}")
-                        print("      Subsequent triggers might fail if they are inside the iframe.")
-
-            except Exception as e_trigger_processing: # Renamed from e_trigger
-                 if iframe_found:
-                     try:
-                         print("    Error during trigger processing, attempting to switch to default content.")
-                         driver.switch_to.default_content()
-                     except Exception as e_switch_back_error:
-                         print(f"        Error trying to switch back to default content after trigger error: {e_switch_back_error}")
-                 print(f"    Error processing current trigger ({type(e_trigger_processing).__name__}): {e_trigger_processing}")
-            time.sleep(1) # Politeness delay
-            current_trigger_index += 1
+                except Exception as e_refind_iframe:
+                    logger.warning(f"      Could not re-find or switch back to iframe ('{community_content_iframe_selector}'): {e_refind_iframe}")
+                    logger.warning("      Subsequent triggers might fail if they are inside the iframe.")
+
+        except Exception as e_trigger_processing: # Renamed from e_trigger
+             METRICS.increment("trigger_errors")
+             if iframe_found:
+                 try:
+                     logger.debug("    Error during trigger processing, attempting to switch to default content.")
+                     driver.switch_to.default_content()
+                 except Exception as e_switch_back_error:
+                     logger.warning(f"        Error trying to switch back to default content after trigger error: {e_switch_back_error}")
+             logger.warning(f"    Error processing current trigger ({type(e_trigger_processing).__name__}): {e_trigger_processing}")
+        time.sleep(1) # Politeness delay
+        current_trigger_index += 1
+
+    return found_profiles
+
+
+class _DriverPool:
+    """A pool of browsers sharing one logged-in session, reused across community URLs.
+
+    ``login`` opens a visible browser for the manual login and exports its cookies. ``start`` launches the
+    remaining headless workers and injects those cookies, so only one login is ever needed. ``scrape``
+    queues the URLs, each split into one trigger shard per worker when ``shard_triggers`` is set, and
+    lets every worker pull tasks until the queue is empty. Drivers are only quit by ``close``.
+    ``driver_factory`` receives ``EdgeOptions`` and returns a WebDriver, so a fake can be plugged in.
+
+    With ``debugger_address`` the first worker attaches to a running, already logged-in browser daemon
+    instead of opening a login browser, and its cookies are copied into the others. With ``network_capture``
+    every worker reads a page's profiles from its API responses (see ``_harvest_profiles_while_scrolling``)
+    and only clicks triggers if none were captured; trigger shards always click.
+    """
+
+    def __init__(self, user_agent, size=2, driver_factory=None, headless_workers=True, max_triggers=None,
+                 debugger_address=None, network_capture=False):
+        self.user_agent = user_agent
+        self.size = max(1, size)
+        self.driver_factory = driver_factory or _create_edge_driver
+        self.headless_workers = headless_workers
+        self.max_triggers = max_triggers
+        self.debugger_address = debugger_address
+        self.network_capture = network_capture
+        self.drivers = []
+        self.session_cookies = []
+
+    def login(self, url, manual_login=True):
+        """Logs in through a visible browser (which becomes the first worker) and keeps its cookies."""
+        logger.info(f"  Initializing login WebDriver for {url}...")
+        with _timed_phase("driver_startup"):
+            driver = self.driver_factory(_make_edge_options(self.user_agent, debugger_address=self.debugger_address,
+                                                            network_capture=self.network_capture))
+        self.drivers.append(driver)
+        if self.debugger_address:
+            logger.info(f"  Attached to running browser at {self.debugger_address}; keeping its window and cookies.")
+        else:
+            driver.maximize_window()
+            driver.delete_all_cookies()
+        driver.get(url)
+        if manual_login and not self.debugger_address:
+            _prompt_for_manual_login(url)
+        self.session_cookies = driver.get_cookies()
+        logger.info(f"  Exported {len(self.session_cookies)} session cookies from the login browser.")
+
+    def start(self, url):
+        """Starts the remaining workers and injects the session cookies exported by ``login``."""
+        origin = "{0.scheme}://{0.netloc}/".format(urlsplit(url))
+        while len(self.drivers) < self.size:
+            logger.info(f"  Starting worker browser {len(self.drivers) + 1}/{self.size}...")
+            with _timed_phase("driver_startup"):
+                driver = self.driver_factory(_make_edge_options(self.user_agent, headless=self.headless_workers,
+                                                                network_capture=self.network_capture))
+            self.drivers.append(driver)
+            driver.get(origin)  # Cookies can only be set for the domain currently loaded
+            for cookie in self.session_cookies:
+                try:
+                    driver.add_cookie({key: value for key, value in cookie.items() if key != 'sameSite'})
+                except Exception as e_cookie:
+                    logger.warning(f"    Could not inject cookie '{cookie.get('name')}' ({type(e_cookie).__name__}): {e_cookie}")
+
+    def _run_worker(self, worker_index, tasks, batch_extraction, events):
+        """Works through ``tasks``, reporting to ``events`` each profile as ``('profile', url, profile)`` and
+        the end of each task as ``('done', url, finished without error)``."""
+        driver = self.drivers[worker_index]
+        while True:
+            try:
+                url, trigger_shard = tasks.get_nowait()
+            except queue.Empty:
+                return
+            shard_label = f" (triggers {trigger_shard[0] + 1}/{trigger_shard[1]})" if trigger_shard else ""
+            logger.info(f"  [worker {worker_index + 1}] Scraping {url}{shard_label}")
+            try:
+                driver.switch_to.default_content()
+                with _timed_phase("page_load"):
+                    driver.get(url)
+                found_profiles = _SinkCollector(_QueuedSink(events), url)
+                if self.network_capture and trigger_shard is None:
+                    _harvest_profiles_while_scrolling(driver, found_profiles)
+                if not found_profiles:
+                    _extract_profiles_from_loaded_page(
+                        driver, batch_extraction, trigger_shard, max_triggers=self.max_triggers,
+                        found_profiles=found_profiles,
+                    )
+                events.put(('done', url, True))
+            except Exception as e_selenium:
+                logger.error(f"  [worker {worker_index + 1}] Error during Selenium operation for {url} "
+                             f"({type(e_selenium).__name__}): {e_selenium}")
+                events.put(('done', url, False))
+
+    def scrape(self, urls, batch_extraction=True, shard_triggers=False):
+        """Scrapes ``urls`` across the pool and returns the union of the profiles found."""
+        found_profiles = set()
+        for url_profiles in self.scrape_by_url(urls, batch_extraction, shard_triggers).values():
+            found_profiles.update(url_profiles)
+        return found_profiles
+
+    def scrape_by_url(self, urls, batch_extraction=True, shard_triggers=False, sink=None):
+        """Scrapes ``urls`` across the pool and returns a dict of URL -> profiles found on that page.
+
+        Splitting one page's triggers between workers relies on the stable trigger keys of batched
+        extraction, so ``shard_triggers`` forces it on.
+
+        With a result ``sink``, profiles are written to it as the workers find them, and a URL is
+        checkpointed once all of its shards finished without an error and it yielded profiles. Workers
+        queue what they find, and this thread does the writing, so the sink is only used from one thread.
+        """
+        tasks = queue.Queue()
+        shard_count = len(self.drivers) if shard_triggers and len(self.drivers) > 1 else 1
+        for url in urls:
+            for shard_index in range(shard_count):
+                tasks.put((url, (shard_index, shard_count) if shard_count > 1 else None))
+        shards_left = {url: urls.count(url) * shard_count for url in urls}
+        batch_extraction = batch_extraction or shard_triggers
+
+        found_by_url = {url: _SinkCollector(sink, url) if sink is not None else set() for url in urls}
+        failed_urls = set()
+        events = queue.Queue()
+        with ThreadPoolExecutor(max_workers=len(self.drivers)) as executor:
+            futures = [
+                executor.submit(self._run_worker, worker_index, tasks, batch_extraction, events)
+                for worker_index in range(len(self.drivers))
+            ]
+            # Workers put every event before they return, so once all are done the queue holds the rest
+            while not all(future.done() for future in futures) or not events.empty():
+                try:
+                    kind, url, value = events.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if kind == 'profile':
+                    found_by_url[url].add(value)
+                    continue
+                shards_left[url] -= 1
+                if not value:
+                    failed_urls.add(url)
+                elif sink is not None and not shards_left[url] and url not in failed_urls and found_by_url[url]:
+                    sink.mark_source_done(url)
+            for future in futures:
+                future.result()
+        return found_by_url
+
+    def close(self):
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception as e_quit:
+                logger.warning(f"  Error quitting WebDriver ({type(e_quit).__name__}): {e_quit}")
+        self.drivers = []
+
+
+def _scrape_urls_with_driver_pool(urls, user_agent, workers=2, batch_extraction=True, shard_triggers=None,
+                                  driver_factory=None, manual_login=True, max_triggers=None, by_url=False, sink=None,
+                                  debugger_address=None, network_capture=False):
+    """Logs in once and scrapes ``urls`` with a pool of ``workers`` browsers.
+
+    By default a single URL is split by trigger across the workers and several URLs are spread across
+    them whole; pass ``shard_triggers`` explicitly to override. With ``network_capture`` URLs are not split
+    by default, since each page is read whole from its API responses. ``debugger_address`` attaches the
+    first worker to a running browser daemon (see ``_DriverPool``). Returns the union of the profiles found,
+    or a dict of URL -> profiles with ``by_url``. With ``by_url``, a ``sink`` receives the profiles as they
+    are found and the URLs that finished cleanly (see ``_DriverPool.scrape_by_url``).
+    """
+    if not urls:
+        return {} if by_url else set()
+    if shard_triggers is None:
+        shard_triggers = len(urls) == 1 and not network_capture
+    pool = _DriverPool(user_agent, workers, driver_factory, max_triggers=max_triggers,
+                       debugger_address=debugger_address, network_capture=network_capture)
+    try:
+        pool.login(urls[0], manual_login)
+        pool.start(urls[0])
+        if by_url:
+            return pool.scrape_by_url(urls, batch_extraction, shard_triggers, sink)
+        return pool.scrape(urls, batch_extraction, shard_triggers)
+    finally:
+        pool.close()
+
+
+def _scrape_url_dynamically_with_selenium(url, user_agent, batch_extraction=False, driver_factory=None,
+                                          manual_login=True, debugger_address=None, network_capture=False,
+                                          max_triggers=None, found_profiles=None, raise_errors=False):
+    """Scrapes a single URL using Selenium to handle JavaScript-loaded content.
+
+    ``driver_factory`` receives the configured ``EdgeOptions`` and returns a WebDriver; it defaults to
+    a local Edge browser and can be swapped for a fake. ``manual_login=False`` skips the console pause.
+    With ``debugger_address`` the scraper attaches to a running browser daemon and keeps its cookies and
+    login; the console pause then only happens if the page yields nothing, i.e. the daemon's session expired.
+    With ``network_capture`` the profiles are read from the page's own API responses, scrolling the feed
+    so it keeps loading them, instead of clicking every trigger; the trigger loop only runs if nothing was
+    captured. Profiles are added to
+    ``found_profiles`` (a new set by default) as soon as they are found.
+
+    Errors are logged and the profiles found before them returned, unless ``raise_errors`` is set, in which
+    case they are re-raised after logging so the caller can tell a partial page from a finished one.
+    """
+    found_profiles = set() if found_profiles is None else found_profiles
+
+    options = _make_edge_options(user_agent, debugger_address=debugger_address, network_capture=network_capture)
+
+    # --- Credentials for Login (fetch from environment variables) ---
+    # udacity_email = os.getenv("UDACITY_EMAIL") # No longer needed for automated login
+    # udacity_password = os.getenv("UDACITY_PASSWORD") # No longer needed for automated login
+    logged_in = False
+    login_element_to_check_staleness = None # To store the element we expect to disappear after login
+
+    driver = None # Initialize driver to None for the finally block
+    try:
+        logger.info(f"  Initializing WebDriver for {url}...")
+        with _timed_phase("driver_startup"):
+            driver = (driver_factory or _create_edge_driver)(options)
+
+        if debugger_address:
+            # The daemon's window and its logged-in session are reused as they are
+            logger.info(f"  Attached to running browser at {debugger_address}; keeping its window and cookies.")
+        else:
+            # Maximize window, as some sites behave differently with smaller viewports
+            logger.debug("  Maximizing browser window...")
+            with _timed_phase("maximize_window"):
+                driver.maximize_window()
+
+            # Clear cookies for a fresh session before the first navigation
+            logger.debug("  Clearing cookies for a fresh session...")
+            with _timed_phase("clear_cookies"):
+                driver.delete_all_cookies()
+
+        logger.info(f"  Opening browser to: {url}")
+        with _timed_phase("page_load"):
+            driver.get(url)
+
+        # --- Manual Login Pause ---
+        # An attached daemon is already logged in; it is only asked to log in again if the page turns out empty
+        if manual_login and not debugger_address:
+            _prompt_for_manual_login(url)
+
+        logger.info(f"  Resuming script. Current URL: {driver.current_url}")
+        # Assume login was successful if the user proceeds.
+        # You might want to add a check here for a known element on the target page
+        # to be more certain (e.g., WebDriverWait for known_element_on_target_page_selector), but for manual mode, this is often sufficient.
+        logged_in = True
+
+        def extract():
+            if network_capture:
+                logger.info(f"  Harvesting profile API responses from the network log (pattern: '{NETWORK_PROFILE_API_PATTERN}')...")
+                _harvest_profiles_while_scrolling(driver, found_profiles)
+                if not found_profiles:
+                    logger.info("  No profiles in captured API responses. Falling back to clicking profile triggers.")
+
+            if not found_profiles:
+                found_profiles.update(_extract_profiles_from_loaded_page(
+                    driver, batch_extraction, logged_in=logged_in, max_triggers=max_triggers, found_profiles=found_profiles
+                ))
+
+        relogin_if_empty = manual_login and debugger_address
+        try:
+            extract()
+        except TimeoutException:
+            if not relogin_if_empty:
+                raise
+        if not found_profiles and relogin_if_empty:
+            logger.warning("  Nothing found in the attached browser; its login may have expired.")
+            _prompt_for_manual_login(url)
+            extract()
 
     except Exception as e_selenium:
-        print(f"  An error occurred during Selenium operation for {url} ({type(e_selenium).__name__}): {e_selenium}")
+        logger.error(f"  An error occurred during Selenium operation for {url} ({type(e_selenium).__name__}): {e_selenium}")
+        if raise_errors:
+            raise
     finally:
         if driver:
             # Ensure we are in the default content before quitting
             try:
-                print("  Ensuring driver is in default content before quitting.")
+                logger.debug("  Ensuring driver is in default content before quitting.")
                 driver.switch_to.default_content()
             except Exception as e_final_switch: # Corrected indentation
-                print(f"  Error during final switch to default content: {e_final_switch}") # Corrected indentation
+                logger.warning(f"  Error during final switch to default content: {e_final_switch}") # Corrected indentation
 
-            print(f"  Quitting WebDriver for {url}.")
+            # Quitting a session attached through a debugger address leaves the daemon browser running
+            logger.info(f"  Quitting WebDriver for {url}.")
             driver.quit()
 
     return found_profiles
@@ -374,7 +2320,112 @@ def _scrape_url_dynamically_with_selenium(url, user_agent):
 
 
 
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn profile URLs from Udacity Community pages and saved HTML files.")
+    parser.add_argument("--local-pattern", dest="local_patterns", action="append", metavar="PATTERN",
+                        help="Glob pattern for saved pages to scan; may be repeated. Matches ending in .gz, .zip, "
+                             ".warc or .warc.gz are read as archives (default: saved_forum_page*.html)")
+    parser.add_argument("--local-workers", type=int, default=1,
+                        help="Worker processes for the local file scan; 0 uses every core (default: %(default)s)")
+    parser.add_argument("--local-chunk-size", type=int, default=64,
+                        help="Files handed to a worker process at a time (default: %(default)s)")
+    parser.add_argument("--manifest", metavar="PATH",
+                        help="SQLite manifest enabling incremental local scans: unchanged files are not re-parsed")
+    parser.add_argument("--extractor", choices=sorted(LINK_EXTRACTORS), default="soup",
+                        help="Link extractor backend for static pages and local files (default: %(default)s)")
+    parser.add_argument("--batch-extraction", action="store_true",
+                        help="Collect triggers in one script call and wait on DOM events instead of fixed sleeps")
+    parser.add_argument("--max-triggers", type=int, default=None,
+                        help="Stop after this many profile triggers per page. By default batched extraction scrolls "
+                             "until the feed stops growing and the per-trigger loop stops at 50")
+    parser.add_argument("--network-capture", action="store_true",
+                        help="Read profiles from the page's own JSON API responses instead of clicking every trigger")
+    parser.add_argument("--har", dest="har_files", action="append", default=[], metavar="PATH",
+                        help="HAR file exported from the browser's network tab to extract profiles from; may be repeated")
+    parser.add_argument("--community-url", dest="community_urls", action="append", default=[], metavar="URL",
+                        help="Additional community page to scrape with the browser; may be repeated")
+    parser.add_argument("--browser-workers", type=int, default=1,
+                        help="Browsers sharing one login session for the community pages (default: %(default)s)")
+    parser.add_argument("--attach-browser", metavar="HOST:PORT",
+                        help="Attach to a browser started with --browser-daemon instead of launching a new one")
+    parser.add_argument("--browser-daemon", action="store_true",
+                        help="Start a long-lived Edge with remote debugging for later --attach-browser runs, then exit")
+    parser.add_argument("--browser-daemon-port", type=int, default=9222,
+                        help="Remote debugging port for --browser-daemon (default: %(default)s)")
+    parser.add_argument("--static-url", dest="static_urls", action="append", default=[], metavar="URL",
+                        help="Additional static page to fetch without a browser; may be repeated")
+    parser.add_argument("--fetch-concurrency", type=int, default=8,
+                        help="Maximum static requests in flight overall (default: %(default)s)")
+    parser.add_argument("--per-host-concurrency", type=int, default=2,
+                        help="Maximum static requests in flight per host (default: %(default)s)")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Worker processes parsing fetched pages; 0 parses in-process (default: every core)")
+    parser.add_argument("--http-cache", metavar="PATH",
+                        help="SQLite file caching static responses between runs; revalidated with ETag/Last-Modified")
+    parser.add_argument("--http-cache-max-mb", type=int, default=256,
+                        help="Size bound for the compressed bodies in the HTTP cache (default: %(default)s)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="Stream profiles to this file as they are found (.jsonl, .csv or .db/.sqlite)")
+    parser.add_argument("--output-format", choices=sorted(set(RESULT_SINKS) - {'memory'}),
+                        help="Format of --output when its extension does not say")
+    parser.add_argument("--resume", action="store_true",
+                        help="Append to --output and skip the sources its checkpoint lists as completed")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="INFO",
+                        help="Lowest level logged; DEBUG adds a line per trigger, file and request (default: %(default)s)")
+    parser.add_argument("--log-format", choices=["text", "json"], default="text",
+                        help="Log records as plain text or as one JSON object per line (default: %(default)s)")
+    parser.add_argument("--metrics-out", metavar="PATH",
+                        help="Write counters and per-phase latency histograms as JSON at the end of the run ('-' for stdout)")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="Serve the metrics in Prometheus text format at http://127.0.0.1:PORT/metrics during the run")
+    parser.add_argument("--profiler", choices=["cprofile", "pyinstrument"],
+                        help="Profile the whole scrape and log the hot spots")
+    parser.add_argument("--profile-out", metavar="PATH",
+                        help="Where --profiler writes its report (cProfile stats or pyinstrument HTML)")
+    args = parser.parse_args(argv)
+    if args.resume and not args.output:
+        parser.error("--resume requires --output")
+    if args.profiler == "pyinstrument" and importlib.util.find_spec("pyinstrument") is None:
+        parser.error("--profiler pyinstrument needs the optional pyinstrument package (pip install pyinstrument)")
+    return args
+
+
 if __name__ == "__main__":
-    print("Starting LinkedIn profile scraper for both URLs and local HTML files...")
-    scrape_linkedin_profiles()
-    print("\nScraping completed.")
+    args = _parse_args()
+    _configure_logging(args.log_level, args.log_format)
+    if args.browser_daemon:
+        address = _start_browser_daemon(args.browser_daemon_port)
+        print(f"Browser daemon listening at {address}. Log in there once, then run with --attach-browser {address}")
+        raise SystemExit(0)
+    if args.metrics_port is not None:
+        _serve_metrics(args.metrics_port)
+    logger.info("Starting LinkedIn profile scraper for both URLs and local HTML files...")
+    try:
+        with _profiled(args.profiler, args.profile_out):
+            scrape_linkedin_profiles(
+                local_file_pattern=args.local_patterns or "saved_forum_page*.html",
+                local_scan_workers=args.local_workers,
+                local_scan_chunk_size=args.local_chunk_size,
+                link_extractor=args.extractor,
+                static_urls=args.static_urls,
+                fetch_concurrency=args.fetch_concurrency,
+                per_host_concurrency=args.per_host_concurrency,
+                parse_workers=args.parse_workers,
+                http_cache_path=args.http_cache,
+                http_cache_max_mb=args.http_cache_max_mb,
+                local_manifest_path=args.manifest,
+                dynamic_batch_extraction=args.batch_extraction,
+                community_urls=args.community_urls,
+                browser_workers=args.browser_workers,
+                attach_browser=args.attach_browser,
+                dynamic_network_capture=args.network_capture,
+                har_files=args.har_files,
+                max_triggers=args.max_triggers,
+                output_path=args.output,
+                output_format=args.output_format,
+                resume=args.resume,
+            )
+    finally:
+        if args.metrics_out:
+            _write_metrics(args.metrics_out)
+    logger.info("Scraping completed.")
@@ -0,0 +1,71 @@
+"""Canonical form of LinkedIn profile URLs.
+
+Every spelling of a profile link (``http``/``https``, ``www.`` or a country subdomain such as
+``uk.linkedin.com``, query strings, fragments, trailing path segments, percent-encoding and case) maps to
+``https://www.linkedin.com/in/<slug>``. The slug is lower-cased and percent-encoded as UTF-8, so the same
+member always gets the same string. The exception is an opaque member ID (``ACoAA...``), which LinkedIn links
+to in place of a vanity slug: it is case-sensitive, so its case is kept. Links that are not profile links
+map to ``None``.
+
+Most hrefs on a page are either not LinkedIn links at all or plain ``https://www.linkedin.com/in/slug/``
+links, so ``canonicalize_profile_url`` answers both with one precompiled regex. Everything else goes through
+``urlsplit`` in ``_canonicalize_slow``, which is memoized because the same odd spelling tends to repeat on
+every page it is posted to.
+"""
+import functools
+import re
+from urllib.parse import quote, unquote, urlsplit
+
+
+PROFILE_URL_PREFIX = "https://www.linkedin.com/in/"
+# Bumped whenever the canonical form changes. Profiles stored by earlier runs (the local scan manifest, the
+# HTTP response cache) under another version are stale and extracted again.
+CANONICAL_FORM_VERSION = 1
+SLOW_PATH_CACHE_SIZE = 64 * 1024  # Distinct unusual hrefs remembered by the slow path
+
+# The common spellings, matched against the lower-cased href: optional scheme, optional www./country
+# subdomain, an ASCII slug and nothing but an optional slash, query or fragment after it
+_FAST_PROFILE_URL = re.compile(r"(?:(?:https?:)?//)?(?:www\.|[a-z]{2,3}\.)?linkedin\.com/in/([a-z0-9_-]+)/?(?:[?#]|$)")
+# Opaque member IDs are base64url-encoded and case-sensitive, unlike vanity slugs
+_OPAQUE_MEMBER_ID = re.compile(r"ACoAA[A-Za-z0-9_-]+")
+_HAS_SCHEME = re.compile(r"[a-z][a-z0-9+.-]*:(?!\d)", re.IGNORECASE)  # "host:443/..." is a port, not a scheme
+
+
+def canonicalize_profile_url(href):
+    """Returns the canonical ``https://www.linkedin.com/in/<slug>`` URL for ``href``, or ``None``."""
+    if not href:
+        return None
+    lowered = href.lower()
+    if 'linkedin.com' not in lowered:  # Hosts are never percent-encoded, so this rejects every other link
+        return None
+    match = _FAST_PROFILE_URL.match(lowered)
+    if match and not match.group(1).startswith('acoaa'):  # A member ID needs its case back from the slow path
+        return PROFILE_URL_PREFIX + match.group(1)
+    return _canonicalize_slow(href)
+
+
+@functools.lru_cache(maxsize=SLOW_PATH_CACHE_SIZE)
+def _canonicalize_slow(href):
+    """Full parse of ``href``; accepts everything the fast path does and the rarer spellings besides."""
+    text = href.strip()
+    if not _HAS_SCHEME.match(text):
+        text = "//" + text.lstrip("/")  # Scheme-relative or bare host, e.g. "linkedin.com/in/slug"
+    try:
+        parts = urlsplit(text)
+        host = (parts.hostname or "").rstrip(".")
+    except ValueError:  # Malformed netloc, e.g. an unbalanced IPv6 bracket
+        return None
+    if parts.scheme.lower() not in ("", "http", "https"):
+        return None
+    if host != "linkedin.com" and not host.endswith(".linkedin.com"):
+        return None
+
+    segments = parts.path.split("/")
+    if len(segments) < 3 or segments[1].lower() != "in":
+        return None
+    slug = unquote(segments[2]).strip()
+    if not _OPAQUE_MEMBER_ID.fullmatch(slug):
+        slug = slug.lower()
+    if not slug:
+        return None
+    return PROFILE_URL_PREFIX + quote(slug, safe="-_.~")
@@ -0,0 +1,299 @@
+"""Streaming readers for saved pages, loose or bundled in archives.
+
+``iter_pages(path)`` yields ``(name, text file object)`` for every HTML page stored at ``path``:
+
+- ``.html.gz`` and other ``.gz`` files hold one gzip-compressed page.
+- ``.zip`` files hold one page per ``.html``/``.htm`` member.
+- ``.warc`` and ``.warc.gz`` files hold one page per HTML ``response`` or ``resource`` record. The HTTP
+  payload is de-chunked and gunzipped if the capture stored it that way.
+- Any other file is one uncompressed page. Files of ``MMAP_THRESHOLD`` bytes or more are memory-mapped
+  instead of read through a buffered file.
+
+Nothing is unpacked to disk or read whole into memory. Every page is decompressed and decoded in bounded
+chunks while the caller reads it, so a multi-GB archive is scanned in the memory of its largest read.
+Each page must be read before the next one is requested; the generator closes it when it moves on.
+
+A truncated or corrupt archive raises one of ``ARCHIVE_ERRORS`` when the reader reaches the damage, so the
+pages yielded before it are intact and a caller can keep them.
+
+``iter_pages`` can also compute the file's ``file_digest`` from the bytes it reads anyway, so a caller that
+needs both the pages and a content hash reads the file only once.
+"""
+import codecs
+import contextlib
+import functools
+import gzip
+import hashlib
+import io
+import mmap
+import zipfile
+import zlib
+
+
+MMAP_THRESHOLD = 16 * 1024 * 1024  # Uncompressed pages at least this large are memory-mapped
+MMAP_RELEASE_SIZE = 4 * 1024 * 1024  # Bytes of a mapped page read before they are released from the mapping
+READ_BUFFER_SIZE = 64 * 1024  # Bytes buffered per archive member or WARC record
+MAX_HEADER_LINE = 64 * 1024  # Longest WARC or HTTP header line read before giving up on the record
+
+ZIP_PAGE_SUFFIXES = ('.html', '.htm')
+
+# What a damaged archive raises partway through: a gzip stream or WARC record cut short (EOFError), a bad
+# gzip header, a corrupt deflate stream, a zip member failing its CRC, or an unparseable WARC header (ValueError)
+# gzip.BadGzipFile is Python 3.8+; 3.7 raises a plain OSError for a bad gzip header
+ARCHIVE_ERRORS = (EOFError, getattr(gzip, 'BadGzipFile', OSError), zlib.error, zipfile.BadZipFile, ValueError)
+
+
+def iter_pages(path, encoding='utf-8', digest=None):
+    """Yields ``(name, text file object)`` for every page in the file at ``path`` (see the module docstring).
+
+    ``name`` is ``path`` for single-page files, ``path!member`` for zip members and the target URI for WARC
+    records. ``encoding`` applies to loose and gzip pages; archive members fall back to it when they do not
+    name a charset of their own, and undecodable bytes in archives are replaced rather than fatal.
+
+    A hashlib object passed as ``digest`` is fed what ``file_digest`` hashes, as the file is read. It only
+    matches ``file_digest`` once the generator has been exhausted, so not after an error.
+    """
+    lowered = path.lower()
+    if lowered.endswith('.zip'):
+        yield from _iter_zip_pages(path, encoding, digest)
+        return
+    with open(path, 'rb') as f:
+        size = _file_size(f)
+        if not lowered.endswith(('.warc', '.gz')) and size and size >= MMAP_THRESHOLD:  # An empty file cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                page = _MappedTextReader(mapped, encoding, digest)
+                yield path, page
+                page.hash_rest()
+            return
+
+        # Hashed below the decompression and decoding, so the digest covers the file's bytes in order
+        stream = f if digest is None else io.BufferedReader(_HashingReader(f, digest), READ_BUFFER_SIZE)
+        if lowered.endswith(('.warc', '.warc.gz')):
+            opened = gzip.GzipFile(fileobj=stream, mode='rb') if lowered.endswith('.gz') else contextlib.nullcontext(stream)
+            with opened as records:
+                yield from _iter_warc_pages(records, encoding)
+        elif lowered.endswith('.gz'):
+            with gzip.open(stream, 'rt', encoding=encoding) as page:
+                yield path, page
+        else:
+            with io.TextIOWrapper(stream, encoding=encoding) as page:
+                yield path, page
+        if digest is not None:
+            for block in iter(functools.partial(f.read, READ_BUFFER_SIZE), b''):  # Whatever the readers left unread
+                digest.update(block)
+
+
+def file_digest(path):
+    """Returns the SHA-256 content digest of the file at ``path`` that ``iter_pages`` computes while reading.
+
+    It covers every byte of the file, except for zips: their pages are read member by member, so the digest
+    covers the central directory instead (every member's name, CRC-32 and sizes), which changes whenever a
+    member does.
+    """
+    digest = hashlib.sha256()
+    if path.lower().endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            _update_zip_digest(digest, archive)
+    else:
+        with open(path, 'rb') as f:
+            for block in iter(functools.partial(f.read, 1024 * 1024), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+class _HashingReader(io.RawIOBase):
+    """Passes reads of the binary file ``f`` through, feeding every byte read to ``digest``."""
+
+    def __init__(self, f, digest):
+        self._f = f
+        self._digest = digest
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self._f.readinto(buffer)
+        self._digest.update(memoryview(buffer)[:count])
+        return count
+
+
+def _file_size(f):
+    f.seek(0, io.SEEK_END)
+    size = f.tell()
+    f.seek(0)
+    return size
+
+
+class _MappedTextReader:
+    """Read-only text view of a memory-mapped file, decoded incrementally so no read copies more than it returns.
+
+    Mapped pages count towards the process's RSS until they are unmapped, so pages that have been read are
+    released with ``MADV_DONTNEED`` as the reader moves on. They stay in the page cache; only the mapping goes.
+    """
+
+    def __init__(self, mapped, encoding, digest=None):
+        self._mapped = mapped
+        self._position = 0
+        self._released = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._digest = digest
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):  # madvise is Python 3.8+ and not on Windows
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+    def read(self, size=-1):
+        total = len(self._mapped)
+        text = ''
+        while not text and self._position < total:  # A short read can end inside a multi-byte character
+            end = total if size is None or size < 0 else min(total, self._position + max(size, 4))
+            data = self._mapped[self._position:end]
+            if self._digest is not None:
+                self._digest.update(data)
+            text = self._decoder.decode(data, final=end == total)
+            self._position = end
+        self._release_read_pages()
+        return text
+
+    def hash_rest(self):
+        """Feeds the bytes the caller did not read to the digest, so it covers the whole file."""
+        while self._digest is not None and self._position < len(self._mapped):
+            end = min(len(self._mapped), self._position + MMAP_RELEASE_SIZE)
+            self._digest.update(self._mapped[self._position:end])
+            self._position = end
+            self._release_read_pages()
+
+    def _release_read_pages(self):
+        release_end = self._position - self._position % mmap.PAGESIZE
+        if hasattr(mmap, 'MADV_DONTNEED') and release_end - self._released >= MMAP_RELEASE_SIZE:
+            self._mapped.madvise(mmap.MADV_DONTNEED, self._released, release_end - self._released)
+            self._released = release_end
+
+
+def _update_zip_digest(digest, archive):
+    for info in archive.infolist():
+        digest.update(f"{info.filename}\0{info.CRC:08x}\0{info.compress_size}\0{info.file_size}\n".encode('utf-8'))
+    digest.update(archive.comment)
+
+
+def _iter_zip_pages(path, encoding, digest=None):
+    with zipfile.ZipFile(path) as archive:
+        if digest is not None:
+            _update_zip_digest(digest, archive)
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith(ZIP_PAGE_SUFFIXES):
+                continue
+            with io.TextIOWrapper(archive.open(info), encoding=encoding, errors='replace') as page:
+                yield f"{path}!{info.filename}", page
+
+
+class _BoundedReader(io.RawIOBase):
+    """Reads at most ``length`` bytes of ``stream``; ``drain`` skips whatever the caller left unread."""
+
+    def __init__(self, stream, length):
+        self._stream = stream
+        self._remaining = length
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._stream.read(min(len(buffer), self._remaining))
+        self._remaining -= len(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def drain(self):
+        while self._remaining:
+            data = self._stream.read(min(READ_BUFFER_SIZE, self._remaining))
+            if not data:
+                raise EOFError("WARC record is shorter than its Content-Length")
+            self._remaining -= len(data)
+
+
+class _ChunkedReader(io.RawIOBase):
+    """Decodes an HTTP ``Transfer-Encoding: chunked`` body read from the buffered ``stream``."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._chunk_remaining = 0
+        self._done = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self._chunk_remaining and not self._done:
+            size_line = self._stream.readline(MAX_HEADER_LINE).split(b';', 1)[0].strip()
+            self._chunk_remaining = int(size_line or b'0', 16)
+            self._done = self._chunk_remaining == 0  # Trailers after the last chunk are ignored
+        if self._done:
+            return 0
+        data = self._stream.read(min(len(buffer), self._chunk_remaining))
+        if not data:
+            raise EOFError("Chunked body ends inside a chunk")
+        self._chunk_remaining -= len(data)
+        if not self._chunk_remaining:
+            self._stream.readline(MAX_HEADER_LINE)  # CRLF after the chunk data
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _read_headers(stream):
+    """Reads ``Name: value`` lines up to a blank line into a dict with lower-cased names."""
+    headers = {}
+    while True:
+        line = stream.readline(MAX_HEADER_LINE)
+        if not line.strip():
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+def _charset(content_type, default):
+    for parameter in content_type.split(';')[1:]:
+        name, _, value = parameter.partition('=')
+        if name.strip().lower() == 'charset' and value.strip():
+            charset = value.strip().strip('"\'')
+            try:
+                return codecs.lookup(charset).name
+            except LookupError:
+                break  # An unknown charset in the capture is not worth failing the page over
+    return default
+
+
+def _iter_warc_pages(stream, encoding):
+    """Yields the HTML pages in a WARC stream, one record at a time."""
+    while True:
+        line = stream.readline(MAX_HEADER_LINE)
+        if not line:
+            return
+        if not line.strip():
+            continue  # The blank lines that separate records
+        if not line.startswith(b'WARC/'):
+            raise ValueError(f"Expected a WARC record header, got {line[:40]!r}")
+        headers = _read_headers(stream)
+        record = _BoundedReader(stream, int(headers.get('content-length', 0)))
+        if headers.get('warc-type') in ('response', 'resource'):
+            page = _open_warc_payload(headers, io.BufferedReader(record, READ_BUFFER_SIZE), encoding)
+            if page is not None:
+                with page:
+                    yield headers.get('warc-target-uri', ''), page
+        record.drain()
+
+
+def _open_warc_payload(headers, body, encoding):
+    """Returns a text reader over the HTML in a WARC record body, or ``None`` if the record is not HTML."""
+    content_type = headers.get('content-type', '')
+    if headers['warc-type'] == 'response' and content_type.lower().startswith('application/http'):
+        body.readline(MAX_HEADER_LINE)  # HTTP status line
+        http_headers = _read_headers(body)
+        content_type = http_headers.get('content-type', '')
+        if 'chunked' in http_headers.get('transfer-encoding', '').lower():
+            body = io.BufferedReader(_ChunkedReader(body), READ_BUFFER_SIZE)
+        content_encoding = http_headers.get('content-encoding', 'identity').lower()
+        if content_encoding in ('gzip', 'x-gzip'):
+            body = gzip.GzipFile(fileobj=body, mode='rb')
+        elif content_encoding != 'identity':
+            return None  # Brotli and friends would need a third-party decoder
+    if 'html' not in content_type.lower():
+        return None
+    return io.TextIOWrapper(body, encoding=_charset(content_type, encoding), errors='replace')